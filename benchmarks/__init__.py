@@ -0,0 +1,4 @@
+"""Benchmarks of the hot paths of this package on synthetic stacks.
+
+Run all suites with `python -m benchmarks`, or see `python -m benchmarks --help` for options.
+"""
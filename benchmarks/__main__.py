@@ -0,0 +1,80 @@
+"""Run the benchmarks and report per-item latency and peak memory of each case."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from random import Random
+from typing import TYPE_CHECKING
+
+from . import introspection, policies, startup, transforms
+from ._workload import Workload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from ._workload import Result
+
+_SUITES = ("transforms", "introspection", "policies", "startup")
+
+
+def main(argv: Sequence[str] | None = None) -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--suites", nargs="+", choices=_SUITES, default=_SUITES, help="Suites to run")
+    parser.add_argument("--resources", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Stack sizes")
+    parser.add_argument("--rules", type=int, nargs="+", default=[1, 50, 500], help="Numbers of transform rules")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic workloads")
+    parser.add_argument("--json", type=argparse.FileType("w"), help="Write results to given JSON file")
+    parser.add_argument(
+        "--baseline",
+        type=argparse.FileType("r"),
+        help="Fail on startup regressions against results in given JSON file, e.g. benchmarks/baseline.json",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="Also fail on startup time/memory exceeding the baseline by more than given fraction, e.g. 0.5",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    sys.stdout.write(
+        f"{'suite':<14} {'case':<50} {'items':>8} {'total (ms)':>11} {'per item (us)':>14} {'peak (KiB)':>11}\n"
+    )
+    workload = Workload(Random(args.seed))  # noqa: S311 ; Not used for cryptographic purposes
+    for result in _run(args.suites, workload, args.resources, args.rules):
+        results.append(result)
+        sys.stdout.write(
+            f"{result.suite:<14} {result.case:<50} {result.items:>8} {result.seconds * 1000:>11.1f}"
+            f" {result.per_item:>14.2f} {result.peak_memory / 1024:>11.1f}\n",
+        )
+
+    if args.json is not None:
+        json.dump([{**r._asdict(), "per_item": r.per_item} for r in results], args.json, indent=2)
+
+    if args.baseline is not None:
+        regressions = startup.compare(results, json.load(args.baseline), args.tolerance)
+        for regression in regressions:
+            sys.stderr.write(f"Regression: {regression}\n")
+
+        if regressions:
+            sys.exit(1)
+
+
+def _run(suites: Sequence[str], workload: Workload, sizes: Sequence[int], rules: Sequence[int]) -> Iterator[Result]:
+    if "transforms" in suites:
+        yield from transforms.run(workload, sizes, rules)
+
+    if "introspection" in suites:
+        yield from introspection.run(workload, sizes)
+
+    if "policies" in suites:
+        yield from policies.run(workload, sizes)
+
+    if "startup" in suites:
+        yield from startup.run()
+
+
+if __name__ == "__main__":
+    main()
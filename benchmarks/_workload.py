@@ -0,0 +1,208 @@
+"""Synthetic workloads and measurement helpers of the benchmarks."""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple
+from unittest import mock
+
+import pulumi
+from pulumi.runtime.rpc import _RESOURCE_MODULES
+
+from pulumi_extra.cache import dump_json
+from pulumi_extra.schema import _SCHEMA_INDEX, load_manifest
+from tests._helpers import write_stub_provider
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from random import Random
+
+# Most common resource types of real-world stacks, along with their relative frequency and input properties.
+_COMMON_TYPES: list[tuple[str, int, frozenset[str]]] = [
+    ("aws:iam/rolePolicyAttachment:RolePolicyAttachment", 120, frozenset({"policy_arn", "role"})),
+    ("aws:iam/role:Role", 80, frozenset({"assume_role_policy", "description", "name", "tags"})),
+    ("aws:iam/policy:Policy", 40, frozenset({"description", "name", "policy", "tags"})),
+    ("aws:vpc/securityGroupIngressRule:SecurityGroupIngressRule", 70, frozenset({"cidr_ipv4", "description", "tags"})),
+    ("aws:ec2/securityGroup:SecurityGroup", 40, frozenset({"description", "name", "tags", "vpc_id"})),
+    ("aws:s3/bucket:Bucket", 30, frozenset({"bucket", "tags"})),
+    ("aws:s3/bucketPolicy:BucketPolicy", 20, frozenset({"bucket", "policy"})),
+    ("aws:lambda/function:Function", 30, frozenset({"description", "handler", "role", "runtime", "tags"})),
+    ("aws:lambda/permission:Permission", 25, frozenset({"action", "function", "principal"})),
+    ("aws:cloudwatch/logGroup:LogGroup", 30, frozenset({"name", "retention_in_days", "tags"})),
+    ("aws:route53/record:Record", 40, frozenset({"name", "records", "type", "zone_id"})),
+    ("aws:sqs/queue:Queue", 15, frozenset({"name", "tags"})),
+    ("gcp:projects/iAMMember:IAMMember", 100, frozenset({"member", "project", "role"})),
+    ("gcp:serviceaccount/account:Account", 30, frozenset({"account_id", "description", "display_name"})),
+    ("gcp:storage/bucket:Bucket", 25, frozenset({"labels", "location", "name"})),
+    ("gcp:compute/firewall:Firewall", 30, frozenset({"description", "name", "network"})),
+    ("gcp:compute/instance:Instance", 15, frozenset({"description", "labels", "machine_type", "name"})),
+    ("gcp:pubsub/topic:Topic", 20, frozenset({"labels", "name"})),
+    ("gcp:cloudrunv2/service:Service", 15, frozenset({"description", "labels", "location", "name"})),
+]
+
+_LONG_TAIL_TYPES = 200
+"""Number of synthetic, rarely used resource types per provider."""
+
+_PACKAGES = ("aws", "gcp")
+
+INVOKE_TOKENS = [
+    "aws:ec2/getAmi:getAmi",
+    "aws:iam/getPolicyDocument:getPolicyDocument",
+    "aws:index/getRegion:getRegion",
+    "gcp:organizations/getProject:getProject",
+    "gcp:compute/getNetwork:getNetwork",
+]
+
+
+class Result(NamedTuple):
+    """Measurement of a benchmark case."""
+
+    suite: str
+    case: str
+    items: int
+    """Number of items (resources, invokes) processed."""
+
+    seconds: float
+    peak_memory: int
+    """Peak memory allocated while processing, in bytes."""
+
+    @property
+    def per_item(self) -> float:
+        """Time per item, in microseconds."""
+        return self.seconds / self.items * 1_000_000
+
+
+class Workload:
+    """Resource types of a synthetic stack, with a realistic distribution across AWS and GCP."""
+
+    def __init__(self, rng: Random) -> None:
+        """Create a workload drawing resource types with given random generator."""
+        self.rng = rng
+        self.types: list[str] = []
+        self.weights: list[float] = []
+        self.attributes: dict[str, frozenset[str]] = {}
+        for type_, weight, attributes in _COMMON_TYPES:
+            self._add(type_, weight, attributes)
+
+        for package, tag_attribute in (("aws", "tags"), ("gcp", "labels")):
+            for i in range(_LONG_TAIL_TYPES):
+                attributes = frozenset({"name", tag_attribute}) if i % 3 else frozenset({"name"})
+                # Zipf-like distribution of rarely used types
+                self._add(f"{package}:service{i % 40}/resource{i}:Resource{i}", 10 / (i + 1), attributes)
+
+    def sample(self, count: int) -> list[str]:
+        """Return the resource types of `count` resources."""
+        return self.rng.choices(self.types, self.weights, k=count)
+
+    def patterns(self, count: int) -> list[str]:
+        """Return `count` patterns of transform rules: mostly exact types, some module and brace patterns."""
+        patterns = []
+        for i in range(count):
+            package, _, rest = self.rng.choice(self.types).partition(":")
+            module = rest.partition("/")[0]
+            if i % 10 < 7:  # noqa: PLR2004
+                patterns.append(f"{package}:{rest}")
+            elif i % 10 < 9:  # noqa: PLR2004
+                patterns.append(f"{package}:{module}/*")
+            else:
+                patterns.append(f"{package}:{{{module},iam,storage}}/*:*")
+
+        return patterns
+
+    @contextmanager
+    def manifest(self) -> Iterator[None]:
+        """Make attributes of the workload resource types known through a provider manifest."""
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "manifest.json"
+            dump_json(path, {"resources": {type_: sorted(attrs) for type_, attrs in self.attributes.items()}})
+            load_manifest(path)
+            try:
+                yield
+            finally:
+                _SCHEMA_INDEX.clear()
+
+    @contextmanager
+    def provider_sdks(self) -> Iterator[None]:
+        """Make the workload resource types known through stub provider SDKs, as if installed."""
+        with TemporaryDirectory() as directory:
+            for package in _PACKAGES:
+                resources = {t: sorted(attrs) for t, attrs in self.attributes.items() if t.startswith(f"{package}:")}
+                write_stub_provider(Path(directory), package, resources)
+
+            sys.path.insert(0, directory)
+            try:
+                yield
+            finally:
+                sys.path.remove(directory)
+                unload_provider_sdks()
+
+    def _add(self, type_: str, weight: float, attributes: frozenset[str]) -> None:
+        self.types.append(type_)
+        self.weights.append(weight)
+        self.attributes[type_] = attributes
+
+
+def unload_provider_sdks() -> None:
+    """Unload the provider SDKs of the workload, along with their resource modules, as if never imported."""
+    packages = {f"pulumi_{package}" for package in _PACKAGES}
+    for name in [name for name in sys.modules if name.partition(".")[0] in packages]:
+        del sys.modules[name]
+
+    for key in [key for key in _RESOURCE_MODULES if key.partition(":")[0] in _PACKAGES]:
+        del _RESOURCE_MODULES[key]
+
+
+class _Mocks(pulumi.runtime.Mocks):
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs) -> Any:
+        return (f"{args.name}_id", args.inputs)
+
+    def call(self, args: pulumi.runtime.MockCallArgs) -> Any:  # noqa: ARG002
+        return {}
+
+
+@contextmanager
+def mocked_runtime() -> Iterator[None]:
+    """Run under Pulumi runtime mocks.
+
+    Mocks do not support registering runtime transforms, so registration is skipped; benchmarks dispatch
+    resources and invokes to the transform registry directly, as the engine would.
+    """
+    pulumi.runtime.set_mocks(_Mocks(), project="project", stack="stack", organization="organization", preview=True)
+    with (
+        mock.patch("pulumi.runtime.register_resource_transform"),
+        mock.patch("pulumi.runtime.register_invoke_transform"),
+    ):
+        yield
+
+
+def measure(
+    suite: str,
+    case: str,
+    items: int,
+    run: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+) -> Result:
+    """Measure time and peak memory of `run`, in two separate runs each preceded by `setup`."""
+    if setup is not None:
+        setup()
+
+    start = perf_counter()
+    run()
+    seconds = perf_counter() - start
+
+    if setup is not None:
+        setup()
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(suite, case, items, seconds, peak_memory)
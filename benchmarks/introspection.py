@@ -0,0 +1,50 @@
+"""Benchmark of resource type introspection."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pulumi_extra import resource_has_attribute
+from pulumi_extra.contrib.aws import is_taggable
+from pulumi_extra.contrib.gcp import is_labelable
+from pulumi_extra.testing import reset_caches
+
+from ._workload import Result, Workload, measure, unload_provider_sdks
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+
+def run(workload: Workload, sizes: Sequence[int]) -> Iterator[Result]:
+    """Run the benchmark for each number of resources, with cold and warm caches.
+
+    Cold caches look attributes up from a provider manifest, or from provider SDKs imported on demand.
+    """
+    for size in sizes:
+        types = workload.sample(size)
+        with workload.manifest():
+            yield measure(
+                "introspection", "cold cache, manifest", size, _check(types), resource_has_attribute.cache_clear
+            )
+            yield measure("introspection", "warm cache", size, _check(types))
+
+        with workload.provider_sdks():
+            yield measure("introspection", "cold cache, provider SDK", size, _check(types), _unload)
+
+
+def _check(types: list[str]) -> Callable[[], None]:
+    def run() -> None:
+        for type_ in types:
+            if type_.startswith("aws:"):
+                is_taggable(type_)
+            else:
+                is_labelable(type_)
+
+            resource_has_attribute(type_, "description")
+
+    return run
+
+
+def _unload() -> None:
+    reset_caches()
+    unload_provider_sdks()
@@ -0,0 +1,71 @@
+"""Benchmark of the contrib policy validators."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pulumi_policy as policy
+
+from pulumi_extra.contrib.aws.policies.governance import Governance
+from pulumi_extra.contrib.aws.policies.require_description import RequireDescription
+from pulumi_extra.contrib.aws.policies.require_tags import RequireTags
+from pulumi_extra.contrib.gcp.policies.require_labels import RequireLabels
+from tests._helpers import policy_args, policy_resource
+
+from ._workload import Result, Workload, measure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from pulumi_extra.contrib._policy import PolicyValidator
+
+_CONFIG: dict[str, Any] = {
+    "exclude": ["aws:service1*/*"],
+    "required-tags": ["Team", "Environment"],
+    "required-labels": ["team", "environment"],
+    "require-tag-if-description-unsupported": True,
+    "allowed-values": {"Environment": "dev|staging|prod"},
+}
+
+
+def run(workload: Workload, sizes: Sequence[int]) -> Iterator[Result]:
+    """Run the benchmark of each validator for each number of resources, per resource and per stack."""
+    with workload.manifest():
+        for size in sizes:
+            resources = [_resource(type_, i) for i, type_ in enumerate(workload.sample(size))]
+            validators: list[type[PolicyValidator[Any, Any]]] = [
+                RequireTags,
+                RequireLabels,
+                RequireDescription,
+                Governance,
+            ]
+            # Each case gets a validator of its own, as validators keep plans of the resource types they saw
+            for validator in validators:
+                name = validator.__name__
+                yield measure("policies", f"{name}, per resource", size, _validate_resources(validator(), resources))
+                yield measure("policies", f"{name}, per stack", size, _validate_stack(validator(), resources))
+
+
+def _resource(type_: str, i: int) -> policy.PolicyResource:
+    tags = {"Team": "platform", "Environment": "prod"} if i % 2 else {}
+    name = f"resource-{i}"
+    return policy_resource(type_, name, {"name": name, "tags": tags, "labels": {"team": "platform"}})
+
+
+def _report_violation(message: str, urn: str | None) -> None:
+    pass
+
+
+def _validate_resources(validator: PolicyValidator[Any, Any], resources: list[policy.PolicyResource]) -> Any:
+    def run() -> None:
+        for r in resources:
+            validator(policy_args(r.resource_type, r.props, _CONFIG, r.name, r.opts), _report_violation)
+
+    return run
+
+
+def _validate_stack(validator: PolicyValidator[Any, Any], resources: list[policy.PolicyResource]) -> Any:
+    def run() -> None:
+        validator.validate_stack(policy.StackValidationArgs(resources, config=dict(_CONFIG)), _report_violation)
+
+    return run
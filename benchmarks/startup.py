@@ -0,0 +1,152 @@
+"""Benchmark of startup time and memory footprint: import of each public module, and first type lookups.
+
+Each case runs several times in a fresh interpreter with `-X importtime`, reporting the fastest run: the
+number of modules it imported as items, its wall time, and the growth of the maximum resident set size as
+peak memory. First lookups run on stub provider SDKs, so that they run (and import the same modules) whether
+or not the provider SDKs are installed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any
+
+import pulumi_extra
+from tests._helpers import write_stub_provider
+
+from ._workload import Result
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+_RUNS = 3
+"""Number of runs of each case."""
+
+_FIRST_CALLS = {
+    "first is_taggable": "from pulumi_extra.contrib.aws import is_taggable; is_taggable('aws:s3/bucket:Bucket')",
+    "first is_labelable": "from pulumi_extra.contrib.gcp import is_labelable; is_labelable('gcp:pubsub/topic:Topic')",
+}
+
+_STUB_PROVIDERS = {
+    "aws": {"aws:s3/bucket:Bucket": ("bucket", "tags"), "aws:sqs/queue:Queue": ("name", "tags")},
+    "gcp": {"gcp:pubsub/topic:Topic": ("labels", "name"), "gcp:storage/bucket:Bucket": ("labels", "name")},
+}
+"""Provider SDKs the first lookups run on."""
+
+# Executed in the benchmarked interpreter; imports before the start marker are not counted
+_SCRIPT = """\
+import json, resource, sys, time
+
+def maxrss():
+    # Linux keeps the maximum resident set size of the parent across exec; read the high-water mark instead
+    if sys.platform == "linux":
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmHWM:"))
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+rss = maxrss()
+sys.stderr.write("-- start\\n")
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<benchmark>", "exec"))
+seconds = time.perf_counter() - start
+sys.stderr.write("-- end\\n")
+print(json.dumps({"seconds": seconds, "peak_memory": maxrss() - rss}))
+"""
+
+
+def run() -> Iterator[Result]:
+    """Run the benchmark for each public module of the package, and each first lookup."""
+    for module in _public_modules():
+        result = _run_case(f"import {module.removeprefix('pulumi_extra.')}", f"import {module}")
+        if result is not None:
+            yield result
+
+    with TemporaryDirectory() as directory:
+        for package, resources in _STUB_PROVIDERS.items():
+            write_stub_provider(Path(directory), package, resources)
+
+        for case, statement in _FIRST_CALLS.items():
+            result = _run_case(case, statement, directory)
+            if result is not None:
+                yield result
+
+
+def compare(
+    results: Iterable[Result],
+    baselines: Sequence[dict[str, Any]],
+    tolerance: float | None = None,
+) -> list[str]:
+    """Return regressions of startup results against baselines, as written by `--json`.
+
+    Imported modules must not increase. Time and memory depend on the machine and its load, so they are
+    only checked if `tolerance` is given: they must not exceed baselines by more than `tolerance`, a
+    fraction of the baseline.
+    """
+    baseline_by_case = {b["case"]: b for b in baselines if b["suite"] == "startup"}
+    regressions = []
+    for result in results:
+        baseline = baseline_by_case.get(result.case)
+        if result.suite != "startup" or baseline is None:
+            continue
+
+        if result.items > baseline["items"]:
+            regressions.append(f"{result.case}: imports {result.items} modules, up from {baseline['items']}")
+
+        if tolerance is None:
+            continue
+
+        for metric in ("seconds", "peak_memory"):
+            value, limit = getattr(result, metric), baseline[metric] * (1 + tolerance)
+            if value > limit:
+                regressions.append(f"{result.case}: {metric} {value:.6g} exceeds {limit:.6g}")
+
+    return regressions
+
+
+def _public_modules() -> list[str]:
+    submodules = pkgutil.walk_packages(pulumi_extra.__path__, f"{pulumi_extra.__name__}.")
+    return [
+        pulumi_extra.__name__,
+        *(m.name for m in submodules if not any(part.startswith("_") for part in m.name.split("."))),
+    ]
+
+
+def _run_case(case: str, statement: str, path: str | None = None) -> Result | None:
+    """Run given case, with given directory put first on the module search path."""
+    env = dict(os.environ)
+    if path is not None:
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, (path, env.get("PYTHONPATH"))))
+
+    runs = []
+    for _ in range(_RUNS):
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", _SCRIPT, statement],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=env,
+        )
+        if process.returncode:
+            error = process.stderr.strip().rpartition("\n")[2]
+            sys.stderr.write(f"Skipping {case!r}, which failed: {error}\n")
+            return None
+
+        measurement = json.loads(process.stdout)
+        runs.append(
+            Result("startup", case, _count_imports(process.stderr), measurement["seconds"], measurement["peak_memory"])
+        )
+
+    return min(runs, key=lambda r: r.seconds)
+
+
+def _count_imports(importtime: str) -> int:
+    """Return the number of modules imported between the markers of the `-X importtime` output."""
+    lines = importtime.partition("-- start\n")[2].partition("-- end\n")[0].splitlines()
+    return sum(line.startswith("import time:") for line in lines)
@@ -0,0 +1,104 @@
+"""Benchmark of transforms dispatched through the default transform registry."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pulumi
+
+from pulumi_extra import override_invoke, override_resource
+from pulumi_extra.contrib.aws import register_auto_tagging
+from pulumi_extra.contrib.gcp import register_auto_labeling
+from pulumi_extra.transforms import provider_routing_table, transform_registry
+
+from ._workload import INVOKE_TOKENS, Result, Workload, measure, mocked_runtime
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+def run(workload: Workload, sizes: Sequence[int], rule_counts: Sequence[int]) -> Iterator[Result]:
+    """Run the benchmark for each combination of number of resources and number of rules."""
+    with mocked_runtime(), workload.manifest():
+        for rules in rule_counts:
+            patterns = workload.patterns(rules)
+            for size in sizes:
+                yield _run_resources(workload.sample(size), patterns)
+                yield _run_invokes([workload.rng.choice(INVOKE_TOKENS) for _ in range(size)], patterns)
+                yield _run_routes(workload.sample(size), rules)
+
+
+def _run_resources(types: list[str], patterns: list[str]) -> Result:
+    resources: list[pulumi.ResourceTransformArgs] = []
+
+    def setup() -> None:
+        transform_registry.reset()
+        for pattern in patterns:
+            transform_registry.add_resource_transform(override_resource(pattern, props={"extra": "value"}), pattern)
+
+        register_auto_tagging()
+        register_auto_labeling()
+        resources[:] = [
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_=type_,
+                name=f"resource-{i}",
+                props={"name": f"resource-{i}"},
+                opts=pulumi.ResourceOptions(),
+            )
+            for i, type_ in enumerate(types)
+        ]
+
+    def run() -> None:
+        for args in resources:
+            transform_registry.transform_resource(args)
+
+    return measure("transforms", f"resources, {len(patterns)} rules + auto-tagging", len(types), run, setup)
+
+
+def _run_invokes(tokens: list[str], patterns: list[str]) -> Result:
+    invokes: list[pulumi.InvokeTransformArgs] = []
+
+    def setup() -> None:
+        transform_registry.reset()
+        for pattern in patterns:
+            transform_registry.add_invoke_transform(override_invoke(pattern, args={"extra": "value"}), pattern)
+
+        invokes[:] = [pulumi.InvokeTransformArgs(token, {}, pulumi.InvokeOptions()) for token in tokens]
+
+    def run() -> None:
+        for args in invokes:
+            transform_registry.transform_invoke(args)
+
+    return measure("transforms", f"invokes, {len(patterns)} rules", len(tokens), run, setup)
+
+
+def _run_routes(types: list[str], accounts: int) -> Result:
+    """Route resources to a provider per account and package, by name prefix, as multi-account programs do."""
+    resources: list[pulumi.ResourceTransformArgs] = []
+
+    def setup() -> None:
+        transform_registry.reset()
+        provider_routing_table.reset()
+        for i in range(accounts):
+            for package in ("aws:*", "gcp:*"):
+                provider = mock.Mock(spec=pulumi.ProviderResource)
+                provider_routing_table.add_route(package, provider=provider, name_prefix=f"account{i:04}-")
+
+        resources[:] = [
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_=type_,
+                name=f"account{i % accounts:04}-resource-{i}",
+                props={},
+                opts=pulumi.ResourceOptions(),
+            )
+            for i, type_ in enumerate(types)
+        ]
+
+    def run() -> None:
+        for args in resources:
+            transform_registry.transform_resource(args)
+
+    return measure("transforms", f"resources, routed to {accounts * 2} providers", len(types), run, setup)
@@ -1,17 +1,25 @@
-from .output import render_template
-from .resource_ import get_resource_cls, resource_has_attribute
-from .stack_reference import get_stack_outputs, get_stack_reference, re_export
-from .transforms import (
-    override_default_provider,
-    override_invoke,
-    override_invoke_defaults,
-    override_invoke_options,
-    override_resource,
-    override_resource_defaults,
-    override_resource_options,
-)
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .output import enable_template_bytecode_cache, render_template, render_templates
+    from .resource_ import enable_attribute_cache, get_resource_cls, resource_has_attribute
+    from .stack_reference import enable_stack_output_snapshot, get_stack_outputs, get_stack_reference, re_export
+    from .transforms import (
+        override_default_provider,
+        override_invoke,
+        override_invoke_defaults,
+        override_invoke_options,
+        override_resource,
+        override_resource_defaults,
+        override_resource_options,
+    )
 
 __all__ = (
+    "enable_attribute_cache",
+    "enable_stack_output_snapshot",
+    "enable_template_bytecode_cache",
     "get_resource_cls",
     "get_stack_outputs",
     "get_stack_reference",
@@ -24,5 +32,25 @@ __all__ = (
     "override_resource_options",
     "re_export",
     "render_template",
+    "render_templates",
     "resource_has_attribute",
 )
+
+# Exports are imported on first access, as their dependencies (e.g. Jinja2) are costly to import
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".output": ("enable_template_bytecode_cache", "render_template", "render_templates"),
+        ".resource_": ("enable_attribute_cache", "get_resource_cls", "resource_has_attribute"),
+        ".stack_reference": ("enable_stack_output_snapshot", "get_stack_outputs", "get_stack_reference", "re_export"),
+        ".transforms": (
+            "override_default_provider",
+            "override_invoke",
+            "override_invoke_defaults",
+            "override_invoke_options",
+            "override_resource",
+            "override_resource_defaults",
+            "override_resource_options",
+        ),
+    },
+)
@@ -0,0 +1,26 @@
+"""Reports written at program exit.
+
+Reports run when the Pulumi engine may be gone already, so they cannot go through `pulumi.log`. Nor do they
+go through the standard library logging, whose fallback handler drops messages below warnings unless the
+program configures logging: they are written to standard error.
+"""
+
+from __future__ import annotations
+
+import atexit
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+def report_at_exit(report: Callable[[], Iterable[str]]) -> None:
+    """Register a function returning messages to write to standard error at program exit."""
+    atexit.register(write_report, report)
+
+
+def write_report(report: Callable[[], Iterable[str]]) -> None:
+    """Write the messages returned by given function to standard error."""
+    for message in report():
+        sys.stderr.write(f"{message}\n")
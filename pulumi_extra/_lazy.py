@@ -0,0 +1,50 @@
+"""Lazy loading of package exports (PEP 562).
+
+Importing a package of this library does not import the modules of its exports until they are first
+accessed, so programs and policy packs pay only for what they use: e.g. `override_resource_options` does
+not load Jinja2 (templates) nor the Pulumi provider lookups.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, Iterable[str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return module `__getattr__` and `__dir__` functions of a package loading its exports lazily.
+
+    Args:
+        package: Name of the package, i.e. `__name__` of its `__init__` module.
+        exports: Names exported by each module, by relative name of the module, e.g.
+            `{".output": ["render_template"]}`.
+
+    Returns:
+        Functions to assign to `__getattr__` and `__dir__` of the package.
+
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        module = modules.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        value = getattr(import_module(module, package), name)
+
+        # Cache it as a global of the package, so that further accesses do not go through here
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *modules})
+
+    return __getattr__, __dir__
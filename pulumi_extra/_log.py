@@ -0,0 +1,78 @@
+"""Deduplicating logging through the Pulumi engine.
+
+Each `pulumi.log` call is a round-trip to the engine. Messages logged from hot paths, such as per resource
+checks, are thus logged once each; repeats are counted instead and summarized when the program exits.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pulumi
+
+from ._exit import report_at_exit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_MAX_MESSAGES = 1024
+
+
+class OnceLogger:
+    """Logger emitting each distinct message once, up to a maximum number of distinct messages."""
+
+    __slots__ = ("_counts", "_dropped", "_max_messages")
+
+    def __init__(self, max_messages: int = _MAX_MESSAGES) -> None:
+        """Create a logger remembering up to `max_messages` distinct messages; further ones are dropped."""
+        self._max_messages = max_messages
+        self._counts: dict[str, int] = {}
+        self._dropped = 0
+
+    def debug(self, message: str) -> None:
+        """Log a debug message, unless logged already."""
+        self._log(pulumi.log.debug, message)
+
+    def info(self, message: str) -> None:
+        """Log an info message, unless logged already."""
+        self._log(pulumi.log.info, message)
+
+    def summary(self) -> str | None:
+        """Return a summary of the messages not logged, if any."""
+        repeats = sum(self._counts.values()) - len(self._counts)
+        if not repeats and not self._dropped:
+            return None
+
+        return (
+            f"Suppressed {repeats} repeat(s) of {len(self._counts)} distinct log message(s)"
+            f" and dropped {self._dropped} message(s) over the limit of {self._max_messages}"
+        )
+
+    def report(self) -> list[str]:
+        """Return the summary of the messages not logged, as a report written at exit."""
+        summary = self.summary()
+        return [summary] if summary is not None else []
+
+    def reset(self) -> None:
+        """Forget logged messages, e.g. between tests."""
+        self._counts.clear()
+        self._dropped = 0
+
+    def _log(self, log: Callable[[str], None], message: str) -> None:
+        count = self._counts.get(message)
+        if count is not None:
+            self._counts[message] = count + 1
+            return
+
+        if len(self._counts) >= self._max_messages:
+            self._dropped += 1
+            return
+
+        self._counts[message] = 1
+        log(message)
+
+
+log_once = OnceLogger()
+"""Default logger, used by the resource type lookups and checks of this package."""
+
+report_at_exit(log_once.report)
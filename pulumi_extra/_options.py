@@ -0,0 +1,83 @@
+"""Precomputed merges of static resource and invoke options.
+
+`pulumi.ResourceOptions.merge` copies both options, rebuilds every collection and normalizes providers, for
+each resource a transform applies to. Transforms overriding the same static options on every resource
+mostly replace a few scalar values (e.g. the provider), which only takes a shallow copy, or nothing at all
+when the options of the resource hold them already.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import pulumi
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_Options = TypeVar("_Options", pulumi.ResourceOptions, pulumi.InvokeOptions)
+
+_RESOURCE_COLLECTIONS = frozenset(
+    {
+        "additional_secret_outputs",
+        "aliases",
+        "depends_on",
+        "hide_diffs",
+        "hooks",
+        "ignore_changes",
+        "providers",
+        "replace_on_changes",
+        "replace_with",
+        "transformations",
+        "transforms",
+    },
+)
+"""Resource options `merge` combines rather than replaces."""
+
+_PRIMITIVES = (bool, int, float, str)
+
+
+class OptionsOverride(Generic[_Options]):
+    """Static options to merge over the options of resources (or invokes), as `merge` would."""
+
+    __slots__ = ("_merge", "_opts", "_values")
+
+    def __init__(self, opts: _Options) -> None:
+        """Precompute the merge of given options."""
+        self._opts: _Options = opts
+        self._values = {name: value for name, value in vars(opts).items() if value is not None}
+
+        # Collections are combined by a full merge
+        collections: frozenset[str] = _RESOURCE_COLLECTIONS if isinstance(opts, pulumi.ResourceOptions) else frozenset()
+        self._merge = not collections.isdisjoint(self._values)
+
+    def apply(self, opts: _Options | None) -> _Options | None:
+        """Return given options with the override merged over them, or `None` if they hold it already."""
+        if self._merge:
+            return type(self._opts).merge(opts, self._opts)
+
+        if opts is None:
+            return copy.copy(self._opts)
+
+        if contains(vars(opts), self._values):
+            return None
+
+        new_opts = copy.copy(opts)
+        for name, value in self._values.items():
+            setattr(new_opts, name, value)
+
+        return new_opts
+
+
+def contains(mapping: Mapping[str, Any], items: Mapping[str, Any]) -> bool:
+    """Return whether given mapping holds all given items already, e.g. props of a resource."""
+    return all(_same(mapping.get(key, _MISSING), value) for key, value in items.items())
+
+
+def _same(current: object, value: object) -> bool:
+    """Return whether values are the same object, or equal primitives; other values (e.g. outputs) are opaque."""
+    return current is value or (type(value) in _PRIMITIVES and type(current) is type(value) and current == value)
+
+
+_MISSING = object()
@@ -0,0 +1,53 @@
+"""Compiled glob pattern matching with brace expansion."""
+
+from __future__ import annotations
+
+import re
+from fnmatch import translate
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from braceexpand import braceexpand
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class PatternMatcher:
+    """Match values against glob patterns supporting brace expansion.
+
+    Patterns are expanded and compiled once: patterns without glob characters go to a set for exact
+    matching, the others are combined into a single regular expression. Verdicts are memoized per value,
+    as matchers are typically queried with a small set of distinct resource types or invoke tokens.
+    """
+
+    __slots__ = ("_exact", "_memo", "_regex", "patterns")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: tuple[str, ...] = tuple(dict.fromkeys(chain.from_iterable(map(braceexpand, patterns))))
+        """Expanded patterns."""
+
+        self._exact = frozenset(p for p in self.patterns if not is_glob(p))
+        globs = [p for p in self.patterns if is_glob(p)]
+        self._regex = re.compile("|".join(f"(?:{translate(g)})" for g in globs)) if globs else None
+        self._memo: dict[str, bool] = {}
+
+    def __call__(self, value: str) -> bool:
+        """Return whether given value matches any of the patterns."""
+        try:
+            return self._memo[value]
+        except KeyError:
+            pass
+
+        matched = value in self._exact or (self._regex is not None and self._regex.match(value) is not None)
+        self._memo[value] = matched
+        return matched
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.patterns)!r})"
+
+
+def is_glob(pattern: str) -> bool:
+    return not _GLOB_CHARS.isdisjoint(pattern)
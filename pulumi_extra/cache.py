@@ -0,0 +1,69 @@
+"""Utils for persistent, on-disk caches."""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+CACHE_DIR_ENV = "PULUMI_EXTRA_CACHE_DIR"
+"""Environment variable to override the cache directory."""
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """Return the cache directory of this package.
+
+    The directory is resolved in the following order:
+
+    - `$PULUMI_EXTRA_CACHE_DIR`
+    - `$XDG_CACHE_HOME/pulumi-extra`
+    - `~/.cache/pulumi-extra`
+
+    Args:
+        *parts: Subdirectories to append to the cache directory.
+
+    """
+    if cache_dir := os.environ.get(CACHE_DIR_ENV):
+        base = Path(cache_dir)
+    elif xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        base = Path(xdg_cache_home) / "pulumi-extra"
+    else:
+        base = Path.home() / ".cache" / "pulumi-extra"
+
+    return base.joinpath(*parts)
+
+
+def load_json(path: Path) -> Any | None:
+    """Load a JSON cache file in one read.
+
+    Returns:
+        Decoded content, or `None` if the file does not exist or is corrupted.
+
+    """
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def dump_json(path: Path, data: Any) -> None:
+    """Atomically write a JSON cache file.
+
+    Content is written to a temporary file first then moved in place, so concurrent readers
+    never observe a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmpfile = NamedTemporaryFile("w", dir=path.parent, prefix=f".{path.name}.", delete=False)  # noqa: SIM115
+    try:
+        with tmpfile:
+            json.dump(data, tmpfile, separators=(",", ":"), sort_keys=True)
+
+        Path(tmpfile.name).replace(path)
+    except BaseException:
+        # Data may not be serializable either, e.g. `TypeError`
+        with suppress(OSError):
+            Path(tmpfile.name).unlink()
+        raise
@@ -0,0 +1,123 @@
+"""Shared helpers of policy validators."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    import pulumi_policy as policy
+
+_Config = TypeVar("_Config")
+_Plan = TypeVar("_Plan")
+
+
+class _Entry(NamedTuple):
+    raw: dict[str, Any]
+    config: Any
+    plans: dict[str, Any]
+
+
+class ConfigCache(Generic[_Config, _Plan]):
+    """Cache of a policy config, as loaded by a policy validator, and of the validation plans derived from it.
+
+    Policies receive a fresh copy of their config for every resource, so the loaded config is memoized
+    against the last config seen and only loaded again if the config changes. Most decisions of validators
+    only depend on the resource type and the config; these are made once per resource type into a plan,
+    leaving only the resource properties to inspect for each resource.
+    """
+
+    __slots__ = ("_entry", "_load", "_make_plan")
+
+    def __init__(
+        self,
+        load: Callable[[Mapping[str, Any]], _Config],
+        make_plan: Callable[[_Config, str], _Plan],
+    ) -> None:
+        """Create a cache of configs loaded by `load`, with plans per resource type made by `make_plan`."""
+        self._load = load
+        self._make_plan = make_plan
+        self._entry: _Entry | None = None
+
+    def get(self, config: Mapping[str, Any]) -> _Config:
+        """Return the loaded config, loading it only if it differs from the last one."""
+        loaded: _Config = self._get_entry(config).config
+        return loaded
+
+    def plan(self, config: Mapping[str, Any], resource_type: str) -> _Plan:
+        """Return the validation plan of given resource type under given config."""
+        entry = self._get_entry(config)
+        try:
+            plan: _Plan = entry.plans[resource_type]
+        except KeyError:
+            plan = entry.plans[resource_type] = self._make_plan(entry.config, resource_type)
+
+        return plan
+
+    def _get_entry(self, config: Mapping[str, Any]) -> _Entry:
+        entry = self._entry
+        if entry is None or entry.raw != config:
+            entry = _Entry(deepcopy(dict(config)), self._load(config), {})
+            self._entry = entry
+
+        return entry
+
+
+class PolicyValidator(ABC, Generic[_Config, _Plan]):
+    """Base of policy validators checking resources against a plan made once per resource type.
+
+    Validators are usable both as resource validations, called once per resource, and as stack validations
+    through `validate_stack`, which groups the resources of the stack by type so that the plan of each type
+    is looked up once per group and types without anything to check are skipped altogether.
+    """
+
+    def __init__(self) -> None:
+        self._config_cache: ConfigCache[_Config, _Plan | None] = ConfigCache(self._load_config, self._make_plan)
+
+    @abstractmethod
+    def _load_config(self, config: Mapping[str, Any]) -> _Config:
+        """Load the policy config."""
+
+    @abstractmethod
+    def _make_plan(self, config: _Config, resource_type: str) -> _Plan | None:
+        """Return what to check on resources of given type, or `None` if there is nothing to check."""
+
+    @abstractmethod
+    def _check(self, plan: _Plan, urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        """Check the properties of a resource against the plan of its type, yielding violation messages."""
+
+    def __call__(
+        self,
+        args: policy.ResourceValidationArgs,
+        report_violation: policy.ReportViolation,
+    ) -> None:
+        """Validate a single resource."""
+        plan = self._config_cache.plan(args.get_config(), args.resource_type)
+        if plan is None:
+            return
+
+        for message in self._check(plan, args.urn, args.props):
+            report_violation(message, None)
+
+    def validate_stack(
+        self,
+        args: policy.StackValidationArgs,
+        report_violation: policy.ReportViolation,
+    ) -> None:
+        """Validate all resources of a stack, reporting violations along with the URN of offending resources."""
+        config = args.get_config()
+        groups: dict[str, list[policy.PolicyResource]] = {}
+        for resource in args.resources:
+            groups.setdefault(resource.resource_type, []).append(resource)
+
+        for resource_type, resources in groups.items():
+            plan = self._config_cache.plan(config, resource_type)
+            if plan is None:
+                continue
+
+            for resource in resources:
+                for message in self._check(plan, resource.urn, resource.props):
+                    report_violation(message, resource.urn)
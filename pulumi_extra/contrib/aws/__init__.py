@@ -1,8 +1,22 @@
-from .autotag import is_taggable, register_auto_tagging
-from .common import is_aws_resource
+from typing import TYPE_CHECKING
+
+from pulumi_extra._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .autotag import get_default_tags, is_taggable, register_auto_tagging
+    from .common import is_aws_resource
 
 __all__ = (
+    "get_default_tags",
     "is_aws_resource",
     "is_taggable",
     "register_auto_tagging",
 )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".autotag": ("get_default_tags", "is_taggable", "register_auto_tagging"),
+        ".common": ("is_aws_resource",),
+    },
+)
@@ -4,9 +4,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pulumi
-import pulumi_aws  # noqa: F401 ; Required to detect resources otherwise `is_taggable` will always return `False`
 
 from pulumi_extra import resource_has_attribute
+from pulumi_extra._log import log_once
+from pulumi_extra.transforms import transform_registry
+from pulumi_extra.transforms.instrumentation import instrument
 
 from .common import is_aws_resource
 
@@ -24,6 +26,11 @@ def register_auto_tagging(
 ) -> None:
     """Register a Pulumi stack transform that automatically tags resources.
 
+    The transform is added to the default transform registry, scoped to AWS resource types. Tags are
+    thus applied where the registry was first registered among runtime transforms: e.g. if
+    `override_default_provider` was called before registering a runtime transform of your own, tags are
+    applied before that transform, even if auto-tagging is registered after it.
+
     Args:
         exclude: Resources to exclude from tagging.
         extra: Extra tags to add.
@@ -36,17 +43,7 @@ def register_auto_tagging(
 
     # Pulumi tags
     if not no_default_tags:
-        org = pulumi.get_organization()
-        project = pulumi.get_project()
-        stack = pulumi.get_stack()
-        tags.update(
-            {
-                "pulumi:Organization": org,
-                "pulumi:Project": project,
-                "pulumi:Stack": stack,
-                "Managed-By": "Pulumi",
-            },
-        )
+        tags.update(get_default_tags())
 
     tags.update(extra)
 
@@ -64,19 +61,34 @@ def register_auto_tagging(
 
         return None
 
-    pulumi.runtime.register_resource_transform(transform)
+    transform_registry.add_resource_transform(instrument(transform, "register_auto_tagging"), "aws:*")
+
+
+def get_default_tags() -> dict[str, str]:
+    """Return the default tags added by `register_auto_tagging`.
+
+    Returns:
+        pulumi:Organization, pulumi:Project, pulumi:Stack and Managed-By tags of the current stack.
+    """
+    org = pulumi.get_organization()
+    project = pulumi.get_project()
+    stack = pulumi.get_stack()
+    return {
+        "pulumi:Organization": org,
+        "pulumi:Project": project,
+        "pulumi:Stack": stack,
+        "Managed-By": "Pulumi",
+    }
 
 
 def is_taggable(resource_type: str) -> bool:
     """Determine if a given AWS resource type is taggable."""
     if not is_aws_resource(resource_type):
-        pulumi.log.debug(f"Resource type {resource_type} is not a AWS resource")
+        log_once.debug(f"Resource type {resource_type} is not a AWS resource")
         return False
 
     if resource_type in _NOT_TAGGABLE_RESOURCES:
-        pulumi.log.info(
-            f"Resource type {resource_type} is set not-taggable explicitly",
-        )
+        log_once.info(f"Resource type {resource_type} is set not-taggable explicitly")
         return False
 
     return resource_has_attribute(resource_type, "tags")
@@ -1,4 +1,29 @@
-from .require_description import require_description
-from .require_tags import require_tags
+from typing import TYPE_CHECKING
 
-__all__ = ("require_description", "require_tags")
+from pulumi_extra._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .add_missing_tags import add_missing_tags
+    from .governance import governance, governance_stack
+    from .require_description import require_description, require_description_stack
+    from .require_tags import require_tags, require_tags_stack
+
+__all__ = (
+    "add_missing_tags",
+    "governance",
+    "governance_stack",
+    "require_description",
+    "require_description_stack",
+    "require_tags",
+    "require_tags_stack",
+)
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".add_missing_tags": ("add_missing_tags",),
+        ".governance": ("governance", "governance_stack"),
+        ".require_description": ("require_description", "require_description_stack"),
+        ".require_tags": ("require_tags", "require_tags_stack"),
+    },
+)
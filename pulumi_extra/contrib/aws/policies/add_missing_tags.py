@@ -0,0 +1,87 @@
+# noqa: D100
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import pulumi_policy as policy
+
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import ConfigCache
+from pulumi_extra.contrib.aws import get_default_tags, is_aws_resource, is_taggable
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class AddMissingTagsConfig(TypedDict):
+    """Configuration schema for AddMissingTags policy."""
+
+    exclude: PatternMatcher
+    """Resource types to exclude from this policy. Supports glob patterns."""
+
+    tags: dict[str, str]
+    """The tags to add to resources missing them."""
+
+
+class AddMissingTags:
+    """Policy remediation to add missing tags to resources, as `register_auto_tagging` would."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self._config_cache = ConfigCache(self._load_config, self._make_plan)
+
+    def _load_config(self, config: Mapping[str, Any]) -> AddMissingTagsConfig:
+        exclude = PatternMatcher(config.get("exclude", []))
+        tags = {} if config.get("no-default-tags", False) else get_default_tags()
+        tags.update(config.get("extra-tags", {}))
+        return AddMissingTagsConfig(exclude=exclude, tags=tags)
+
+    def _make_plan(self, config: AddMissingTagsConfig, resource_type: str) -> dict[str, str] | None:
+        """Return the tags to add to resources of given type."""
+        if config["exclude"](resource_type):
+            return None
+
+        if not config["tags"]:
+            return None
+
+        if not is_aws_resource(resource_type):
+            return None
+
+        if not is_taggable(resource_type):
+            return None
+
+        return config["tags"]
+
+    def __call__(self, args: policy.ResourceValidationArgs) -> Mapping[str, Any] | None:  # noqa: D102
+        tags = self._config_cache.plan(args.get_config(), args.resource_type)
+        if tags is None:
+            return None
+
+        current_tags = args.props.get("tags") or {}
+        if current_tags.keys() >= tags.keys():
+            return None
+
+        return {**args.props, "tags": {**tags, **current_tags}}
+
+
+add_missing_tags = policy.ResourceValidationPolicy(
+    name="aws:add-missing-tags",
+    description="Add missing tags to resources",
+    config_schema=policy.PolicyConfigSchema(
+        properties={
+            "exclude": {
+                "type": "array",
+                "items": {"type": "string"},
+            },
+            "extra-tags": {
+                "type": "object",
+                "additionalProperties": {"type": "string"},
+            },
+            "no-default-tags": {
+                "type": "boolean",
+            },
+        },
+    ),
+    # Remediations only run at this level, which policy packs do not default to
+    enforcement_level=policy.EnforcementLevel.REMEDIATE,
+    remediate=AddMissingTags(),  # type: ignore[arg-type]  # Synchronous results are supported too
+)
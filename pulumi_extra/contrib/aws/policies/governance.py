@@ -0,0 +1,148 @@
+# noqa: D100
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
+
+import pulumi_policy as policy
+
+from pulumi_extra import resource_has_attribute
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import PolicyValidator
+from pulumi_extra.contrib.aws import is_aws_resource, is_taggable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+
+class GovernanceConfig(TypedDict):
+    """Configuration schema for Governance policy."""
+
+    exclude: PatternMatcher
+    """Resource types to exclude from this policy. Supports glob patterns."""
+
+    required_tags: frozenset[str]
+    """The set of required tags."""
+
+    require_description: bool
+    """Whether to require description on resources supporting it."""
+
+    require_tag_if_description_unsupported: bool
+    """Whether to require a tag if description is unsupported."""
+
+    description_tag_key: str
+    """The tag key to use for description if description is unsupported."""
+
+    allowed_values: dict[str, re.Pattern[str]]
+    """Compiled patterns the whole value of tags must match, by tag key."""
+
+
+class _Plan(NamedTuple):
+    description: bool
+    """Whether to check the description."""
+
+    required_tags: tuple[str, ...]
+    """The tags to check presence of."""
+
+    allowed_values: Mapping[str, re.Pattern[str]]
+    """The tag values to check, by tag key."""
+
+
+class Governance(PolicyValidator[GovernanceConfig, _Plan]):
+    """Policy validator checking required tags, description and allowed tag values in a single pass."""
+
+    def _load_config(self, config: Mapping[str, Any]) -> GovernanceConfig:
+        exclude = PatternMatcher(config.get("exclude", []))
+        required_tags = frozenset(config.get("required-tags", []))
+        require_description = config.get("require-description", True)
+        require_tag_if_description_unsupported = config.get("require-tag-if-description-unsupported", False)
+        description_tag_key = config.get("description-tag-key", "Description")
+        allowed_values = {key: re.compile(pattern) for key, pattern in config.get("allowed-values", {}).items()}
+        return GovernanceConfig(
+            exclude=exclude,
+            required_tags=required_tags,
+            require_description=require_description,
+            require_tag_if_description_unsupported=require_tag_if_description_unsupported,
+            description_tag_key=description_tag_key,
+            allowed_values=allowed_values,
+        )
+
+    def _make_plan(self, config: GovernanceConfig, resource_type: str) -> _Plan | None:
+        if config["exclude"](resource_type):
+            return None
+
+        if not is_aws_resource(resource_type):
+            return None
+
+        description = config["require_description"] and resource_has_attribute(resource_type, "description")
+        required_tags = set(config["required_tags"])
+        if config["require_description"] and config["require_tag_if_description_unsupported"]:
+            required_tags.add(config["description_tag_key"])
+
+        allowed_values = config["allowed_values"]
+        if (required_tags or allowed_values) and not is_taggable(resource_type):
+            required_tags, allowed_values = set(), {}
+
+        if not description and not required_tags and not allowed_values:
+            return None
+
+        return _Plan(
+            description=description,
+            required_tags=tuple(sorted(required_tags)),
+            allowed_values=allowed_values,
+        )
+
+    def _check(self, plan: _Plan, urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        if plan.description and props.get("description") is None:
+            yield f"Resource '{urn}' is missing required description"
+
+        tags = props.get("tags") or {}
+        for rt in plan.required_tags:
+            if rt not in tags:
+                yield f"Resource '{urn}' is missing required tag '{rt}'"
+
+        for key, pattern in plan.allowed_values.items():
+            value = tags.get(key)
+            if isinstance(value, str) and pattern.fullmatch(value) is None:
+                yield f"Resource '{urn}' has tag '{key}' with disallowed value '{value}'"
+
+
+_config_schema = policy.PolicyConfigSchema(
+    properties={
+        "exclude": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "required-tags": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "require-description": {
+            "type": "boolean",
+        },
+        "require-tag-if-description-unsupported": {
+            "type": "boolean",
+        },
+        "description-tag-key": {
+            "type": "string",
+        },
+        "allowed-values": {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+        },
+    },
+)
+
+governance = policy.ResourceValidationPolicy(
+    name="aws:governance",
+    description="Require specific tags and description on resources, and restrict values of tags",
+    config_schema=_config_schema,
+    validate=Governance(),
+)
+
+governance_stack = policy.StackValidationPolicy(
+    name="aws:governance-stack",
+    description="Require tags and description, and restrict values of tags, on all resources of the stack at once",
+    config_schema=_config_schema,
+    validate=Governance().validate_stack,
+)
@@ -1,22 +1,23 @@
 # noqa: D100
 from __future__ import annotations
 
-from fnmatch import fnmatch
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
 
 import pulumi_policy as policy
 
 from pulumi_extra import resource_has_attribute
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import PolicyValidator
 from pulumi_extra.contrib.aws import is_aws_resource, is_taggable
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
 
 class RequireDescriptionConfig(TypedDict):
     """Configuration schema for RequireDescription policy."""
 
-    exclude: set[str]
+    exclude: PatternMatcher
     """Resource types to exclude from this policy. Supports glob patterns."""
 
     require_tag_if_description_unsupported: bool
@@ -26,11 +27,19 @@ class RequireDescriptionConfig(TypedDict):
     """The tag key to use for description if description is unsupported."""
 
 
-class RequireDescription:
+class _Plan(NamedTuple):
+    description: bool
+    """Whether to check the description."""
+
+    description_tag_key: str | None
+    """The tag key to check, if any."""
+
+
+class RequireDescription(PolicyValidator[RequireDescriptionConfig, _Plan]):
     """Policy validator to require description (or tag if unsupported) on resources."""
 
     def _load_config(self, config: Mapping[str, Any]) -> RequireDescriptionConfig:
-        exclude = set(config.get("exclude", []))
+        exclude = PatternMatcher(config.get("exclude", []))
         require_tag_if_description_unsupported = config.get("require-tag-if-description-unsupported", False)
         description_tag_key = config.get("description-tag-key", "Description")
         return RequireDescriptionConfig(
@@ -39,32 +48,31 @@ class RequireDescription:
             description_tag_key=description_tag_key,
         )
 
-    def __call__(  # noqa: D102
-        self,
-        args: policy.ResourceValidationArgs,
-        report_violation: policy.ReportViolation,
-    ) -> None:
-        config = self._load_config(args.get_config())
-        if any(fnmatch(args.resource_type, pattern) for pattern in config["exclude"]):
-            return
-
-        if not is_aws_resource(args.resource_type):
-            return
-
-        if resource_has_attribute(args.resource_type, "description") and args.props.get("description") is None:
-            report_violation(
-                f"Resource '{args.urn}' is missing required description",
-                None,
-            )
-
-        if config["require_tag_if_description_unsupported"]:  # noqa: SIM102
-            if is_taggable(args.resource_type):
-                tags = args.props.get("tags", {})
-                if config["description_tag_key"] not in tags:
-                    report_violation(
-                        f"Resource '{args.urn}' is missing required tag '{config['description_tag_key']}'",
-                        None,
-                    )
+    def _make_plan(self, config: RequireDescriptionConfig, resource_type: str) -> _Plan | None:
+        if config["exclude"](resource_type):
+            return None
+
+        if not is_aws_resource(resource_type):
+            return None
+
+        description_tag_key = None
+        if config["require_tag_if_description_unsupported"] and is_taggable(resource_type):
+            description_tag_key = config["description_tag_key"]
+
+        description = resource_has_attribute(resource_type, "description")
+        if not description and description_tag_key is None:
+            return None
+
+        return _Plan(description=description, description_tag_key=description_tag_key)
+
+    def _check(self, plan: _Plan, urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        if plan.description and props.get("description") is None:
+            yield f"Resource '{urn}' is missing required description"
+
+        if plan.description_tag_key is not None:
+            tags = props.get("tags") or {}
+            if plan.description_tag_key not in tags:
+                yield f"Resource '{urn}' is missing required tag '{plan.description_tag_key}'"
 
 
 require_description = policy.ResourceValidationPolicy(
@@ -86,3 +94,10 @@ require_description = policy.ResourceValidationPolicy(
     ),
     validate=RequireDescription(),
 )
+
+require_description_stack = policy.StackValidationPolicy(
+    name="aws:require-description-stack",
+    description="Require description (or tag if unsupported) on all resources of the stack at once",
+    config_schema=require_description.config_schema,
+    validate=RequireDescription().validate_stack,
+)
@@ -1,59 +1,57 @@
 # noqa: D100
 from __future__ import annotations
 
-from fnmatch import fnmatch
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import pulumi_policy as policy
 
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import PolicyValidator
 from pulumi_extra.contrib.aws import is_aws_resource, is_taggable
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
 
 class RequireTagsConfig(TypedDict):
     """Configuration schema for RequireTags policy."""
 
-    exclude: set[str]
+    exclude: PatternMatcher
     """Resource types to exclude from this policy. Supports glob patterns."""
 
-    required_tags: set[str]
+    required_tags: frozenset[str]
     """The set of required tags."""
 
 
-class RequireTags:
+class RequireTags(PolicyValidator[RequireTagsConfig, tuple[str, ...]]):
     """Policy validator to require specific tags on resources."""
 
     def _load_config(self, config: Mapping[str, Any]) -> RequireTagsConfig:
-        exclude = set(config.get("exclude", []))
-        required_tags = set(config.get("required-tags", []))
+        exclude = PatternMatcher(config.get("exclude", []))
+        required_tags = frozenset(config.get("required-tags", []))
         return RequireTagsConfig(exclude=exclude, required_tags=required_tags)
 
-    def __call__(  # noqa: D102
-        self,
-        args: policy.ResourceValidationArgs,
-        report_violation: policy.ReportViolation,
-    ) -> None:
-        config = self._load_config(args.get_config())
-
-        if any(fnmatch(args.resource_type, pattern) for pattern in config["exclude"]):
-            return
+    def _make_plan(self, config: RequireTagsConfig, resource_type: str) -> tuple[str, ...] | None:
+        """Return the tags to check on resources of given type."""
+        if config["exclude"](resource_type):
+            return None
 
         if not config["required_tags"]:
-            return
+            return None
+
+        if not is_aws_resource(resource_type):
+            return None
+
+        if not is_taggable(resource_type):
+            return None
 
-        if not is_aws_resource(args.resource_type):
-            return
+        return tuple(sorted(config["required_tags"]))
 
-        if is_taggable(args.resource_type):
-            tags = args.props.get("tags", {})
-            for rt in config["required_tags"]:
-                if not tags or rt not in tags:
-                    report_violation(
-                        f"Resource '{args.urn}' is missing required tag '{rt}'",
-                        None,
-                    )
+    def _check(self, plan: tuple[str, ...], urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        tags = props.get("tags") or {}
+        for rt in plan:
+            if rt not in tags:
+                yield f"Resource '{urn}' is missing required tag '{rt}'"
 
 
 require_tags = policy.ResourceValidationPolicy(
@@ -73,3 +71,10 @@ require_tags = policy.ResourceValidationPolicy(
     ),
     validate=RequireTags(),
 )
+
+require_tags_stack = policy.StackValidationPolicy(
+    name="aws:require-tags-stack",
+    description="Require specific tags on all resources of the stack at once",
+    config_schema=require_tags.config_schema,
+    validate=RequireTags().validate_stack,
+)
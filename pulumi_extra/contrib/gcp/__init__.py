@@ -1,8 +1,22 @@
-from .autolabel import is_labelable, register_auto_labeling
-from .common import is_gcp_resource
+from typing import TYPE_CHECKING
+
+from pulumi_extra._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .autolabel import get_default_labels, is_labelable, register_auto_labeling
+    from .common import is_gcp_resource
 
 __all__ = (
+    "get_default_labels",
     "is_gcp_resource",
     "is_labelable",
     "register_auto_labeling",
 )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".autolabel": ("get_default_labels", "is_labelable", "register_auto_labeling"),
+        ".common": ("is_gcp_resource",),
+    },
+)
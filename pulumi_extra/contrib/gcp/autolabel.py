@@ -4,9 +4,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pulumi
-import pulumi_gcp  # noqa: F401 ; Required to detect resources otherwise `is_labelable` will always return `False`
 
 from pulumi_extra import resource_has_attribute
+from pulumi_extra._log import log_once
+from pulumi_extra.transforms import transform_registry
+from pulumi_extra.transforms.instrumentation import instrument
 
 from .common import is_gcp_resource
 
@@ -21,6 +23,10 @@ def register_auto_labeling(
 ) -> None:
     """Register a Pulumi stack transform that automatically labels resources.
 
+    The transform is added to the default transform registry, scoped to GCP resource types. Mind that
+    labeling happens at the position of the registry among runtime transforms, which is where the registry
+    was registered first (e.g. by an earlier `override_default_provider` call), not where this is called.
+
     Args:
         exclude: Resources to exclude from labeling.
         extra: Extra labels to add.
@@ -32,19 +38,8 @@ def register_auto_labeling(
     exclude = exclude or set()
 
     # Pulumi labels
-    # NOTE: Labels need transformation because of strict GCP restrictions
     if not no_default_labels:
-        org = pulumi.get_organization()
-        project = pulumi.get_project()
-        stack = pulumi.get_stack()
-        labels.update(
-            {
-                "pulumi-organization": org,
-                "pulumi-project": project.replace(".", "-"),
-                "pulumi-stack": stack,
-                "managed-by": "pulumi",
-            },
-        )
+        labels.update(get_default_labels())
 
     labels.update(extra)
 
@@ -62,19 +57,35 @@ def register_auto_labeling(
 
         return None
 
-    pulumi.runtime.register_resource_transform(transform)
+    transform_registry.add_resource_transform(instrument(transform, "register_auto_labeling"), "gcp:*")
+
+
+def get_default_labels() -> dict[str, str]:
+    """Return the default labels added by `register_auto_labeling`.
+
+    Returns:
+        pulumi-organization, pulumi-project, pulumi-stack and managed-by labels of the current stack.
+    """
+    # NOTE: Labels need transformation because of strict GCP restrictions
+    org = pulumi.get_organization()
+    project = pulumi.get_project()
+    stack = pulumi.get_stack()
+    return {
+        "pulumi-organization": org,
+        "pulumi-project": project.replace(".", "-"),
+        "pulumi-stack": stack,
+        "managed-by": "pulumi",
+    }
 
 
 def is_labelable(resource_type: str) -> bool:
     """Determine if a given GCP resource type is labelable."""
     if not is_gcp_resource(resource_type):
-        pulumi.log.debug(f"Resource type {resource_type} is not a GCP resource")
+        log_once.debug(f"Resource type {resource_type} is not a GCP resource")
         return False
 
     if resource_type in _NOT_LABELABLE_RESOURCES:
-        pulumi.log.info(
-            f"Resource type {resource_type} is set not-labelable explicitly",
-        )
+        log_once.info(f"Resource type {resource_type} is set not-labelable explicitly")
         return False
 
     return resource_has_attribute(resource_type, "labels")
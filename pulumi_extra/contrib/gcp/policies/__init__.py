@@ -1,4 +1,29 @@
-from .require_description import require_description
-from .require_labels import require_labels
+from typing import TYPE_CHECKING
 
-__all__ = ("require_description", "require_labels")
+from pulumi_extra._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .add_missing_labels import add_missing_labels
+    from .governance import governance, governance_stack
+    from .require_description import require_description, require_description_stack
+    from .require_labels import require_labels, require_labels_stack
+
+__all__ = (
+    "add_missing_labels",
+    "governance",
+    "governance_stack",
+    "require_description",
+    "require_description_stack",
+    "require_labels",
+    "require_labels_stack",
+)
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".add_missing_labels": ("add_missing_labels",),
+        ".governance": ("governance", "governance_stack"),
+        ".require_description": ("require_description", "require_description_stack"),
+        ".require_labels": ("require_labels", "require_labels_stack"),
+    },
+)
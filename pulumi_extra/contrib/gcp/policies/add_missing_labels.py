@@ -0,0 +1,87 @@
+# noqa: D100
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import pulumi_policy as policy
+
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import ConfigCache
+from pulumi_extra.contrib.gcp import get_default_labels, is_gcp_resource, is_labelable
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class AddMissingLabelsConfig(TypedDict):
+    """Configuration schema for AddMissingLabels policy."""
+
+    exclude: PatternMatcher
+    """Resource types to exclude from this policy. Supports glob patterns."""
+
+    labels: dict[str, str]
+    """The labels to add to resources missing them."""
+
+
+class AddMissingLabels:
+    """Policy remediation to add missing labels to resources, as `register_auto_labeling` would."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self._config_cache = ConfigCache(self._load_config, self._make_plan)
+
+    def _load_config(self, config: Mapping[str, Any]) -> AddMissingLabelsConfig:
+        exclude = PatternMatcher(config.get("exclude", []))
+        labels = {} if config.get("no-default-labels", False) else get_default_labels()
+        labels.update(config.get("extra-labels", {}))
+        return AddMissingLabelsConfig(exclude=exclude, labels=labels)
+
+    def _make_plan(self, config: AddMissingLabelsConfig, resource_type: str) -> dict[str, str] | None:
+        """Return the labels to add to resources of given type."""
+        if config["exclude"](resource_type):
+            return None
+
+        if not config["labels"]:
+            return None
+
+        if not is_gcp_resource(resource_type):
+            return None
+
+        if not is_labelable(resource_type):
+            return None
+
+        return config["labels"]
+
+    def __call__(self, args: policy.ResourceValidationArgs) -> Mapping[str, Any] | None:  # noqa: D102
+        labels = self._config_cache.plan(args.get_config(), args.resource_type)
+        if labels is None:
+            return None
+
+        current_labels = args.props.get("labels") or {}
+        if current_labels.keys() >= labels.keys():
+            return None
+
+        return {**args.props, "labels": {**labels, **current_labels}}
+
+
+add_missing_labels = policy.ResourceValidationPolicy(
+    name="gcp:add-missing-labels",
+    description="Add missing labels to resources",
+    config_schema=policy.PolicyConfigSchema(
+        properties={
+            "exclude": {
+                "type": "array",
+                "items": {"type": "string"},
+            },
+            "extra-labels": {
+                "type": "object",
+                "additionalProperties": {"type": "string"},
+            },
+            "no-default-labels": {
+                "type": "boolean",
+            },
+        },
+    ),
+    # Remediations only run at this level, which policy packs do not default to
+    enforcement_level=policy.EnforcementLevel.REMEDIATE,
+    remediate=AddMissingLabels(),  # type: ignore[arg-type]  # Synchronous results are supported too
+)
@@ -0,0 +1,148 @@
+# noqa: D100
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
+
+import pulumi_policy as policy
+
+from pulumi_extra import resource_has_attribute
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import PolicyValidator
+from pulumi_extra.contrib.gcp import is_gcp_resource, is_labelable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+
+class GovernanceConfig(TypedDict):
+    """Configuration schema for Governance policy."""
+
+    exclude: PatternMatcher
+    """Resource types to exclude from this policy. Supports glob patterns."""
+
+    required_labels: frozenset[str]
+    """The set of required labels."""
+
+    require_description: bool
+    """Whether to require description on resources supporting it."""
+
+    require_label_if_description_unsupported: bool
+    """Whether to require a label if description is unsupported."""
+
+    description_label_key: str
+    """The label key to use for description if description is unsupported."""
+
+    allowed_values: dict[str, re.Pattern[str]]
+    """Compiled patterns the whole value of labels must match, by label key."""
+
+
+class _Plan(NamedTuple):
+    description: bool
+    """Whether to check the description."""
+
+    required_labels: tuple[str, ...]
+    """The labels to check presence of."""
+
+    allowed_values: Mapping[str, re.Pattern[str]]
+    """The label values to check, by label key."""
+
+
+class Governance(PolicyValidator[GovernanceConfig, _Plan]):
+    """Policy validator checking required labels, description and allowed label values in a single pass."""
+
+    def _load_config(self, config: Mapping[str, Any]) -> GovernanceConfig:
+        exclude = PatternMatcher(config.get("exclude", []))
+        required_labels = frozenset(config.get("required-labels", []))
+        require_description = config.get("require-description", True)
+        require_label_if_description_unsupported = config.get("require-label-if-description-unsupported", False)
+        description_label_key = config.get("description-label-key", "description")
+        allowed_values = {key: re.compile(pattern) for key, pattern in config.get("allowed-values", {}).items()}
+        return GovernanceConfig(
+            exclude=exclude,
+            required_labels=required_labels,
+            require_description=require_description,
+            require_label_if_description_unsupported=require_label_if_description_unsupported,
+            description_label_key=description_label_key,
+            allowed_values=allowed_values,
+        )
+
+    def _make_plan(self, config: GovernanceConfig, resource_type: str) -> _Plan | None:
+        if config["exclude"](resource_type):
+            return None
+
+        if not is_gcp_resource(resource_type):
+            return None
+
+        description = config["require_description"] and resource_has_attribute(resource_type, "description")
+        required_labels = set(config["required_labels"])
+        if config["require_description"] and config["require_label_if_description_unsupported"]:
+            required_labels.add(config["description_label_key"])
+
+        allowed_values = config["allowed_values"]
+        if (required_labels or allowed_values) and not is_labelable(resource_type):
+            required_labels, allowed_values = set(), {}
+
+        if not description and not required_labels and not allowed_values:
+            return None
+
+        return _Plan(
+            description=description,
+            required_labels=tuple(sorted(required_labels)),
+            allowed_values=allowed_values,
+        )
+
+    def _check(self, plan: _Plan, urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        if plan.description and props.get("description") is None:
+            yield f"Resource '{urn}' is missing required description"
+
+        labels = props.get("labels") or {}
+        for rl in plan.required_labels:
+            if rl not in labels:
+                yield f"Resource '{urn}' is missing required label '{rl}'"
+
+        for key, pattern in plan.allowed_values.items():
+            value = labels.get(key)
+            if isinstance(value, str) and pattern.fullmatch(value) is None:
+                yield f"Resource '{urn}' has label '{key}' with disallowed value '{value}'"
+
+
+_config_schema = policy.PolicyConfigSchema(
+    properties={
+        "exclude": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "required-labels": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "require-description": {
+            "type": "boolean",
+        },
+        "require-label-if-description-unsupported": {
+            "type": "boolean",
+        },
+        "description-label-key": {
+            "type": "string",
+        },
+        "allowed-values": {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+        },
+    },
+)
+
+governance = policy.ResourceValidationPolicy(
+    name="gcp:governance",
+    description="Require specific labels and description on resources, and restrict values of labels",
+    config_schema=_config_schema,
+    validate=Governance(),
+)
+
+governance_stack = policy.StackValidationPolicy(
+    name="gcp:governance-stack",
+    description="Require labels and description, and restrict values of labels, on all resources of the stack at once",
+    config_schema=_config_schema,
+    validate=Governance().validate_stack,
+)
@@ -1,22 +1,23 @@
 # noqa: D100
 from __future__ import annotations
 
-from fnmatch import fnmatch
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
 
 import pulumi_policy as policy
 
 from pulumi_extra import resource_has_attribute
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import PolicyValidator
 from pulumi_extra.contrib.gcp import is_gcp_resource, is_labelable
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
 
 class RequireDescriptionConfig(TypedDict):
     """Configuration schema for RequireDescription policy."""
 
-    exclude: set[str]
+    exclude: PatternMatcher
     """Resource types to exclude from this policy. Supports glob patterns."""
 
     require_label_if_description_unsupported: bool
@@ -26,11 +27,19 @@ class RequireDescriptionConfig(TypedDict):
     """The label key to use for description if description is unsupported."""
 
 
-class RequireDescription:
+class _Plan(NamedTuple):
+    description: bool
+    """Whether to check the description."""
+
+    description_label_key: str | None
+    """The label key to check, if any."""
+
+
+class RequireDescription(PolicyValidator[RequireDescriptionConfig, _Plan]):
     """Policy validator to require description (or label if unsupported) on resources."""
 
     def _load_config(self, config: Mapping[str, Any]) -> RequireDescriptionConfig:
-        exclude = set(config.get("exclude", []))
+        exclude = PatternMatcher(config.get("exclude", []))
         require_label_if_description_unsupported = config.get("require-label-if-description-unsupported", False)
         description_label_key = config.get("description-label-key", "description")
         return RequireDescriptionConfig(
@@ -39,32 +48,31 @@ class RequireDescription:
             description_label_key=description_label_key,
         )
 
-    def __call__(  # noqa: D102
-        self,
-        args: policy.ResourceValidationArgs,
-        report_violation: policy.ReportViolation,
-    ) -> None:
-        config = self._load_config(args.get_config())
-        if any(fnmatch(args.resource_type, pattern) for pattern in config["exclude"]):
-            return
-
-        if not is_gcp_resource(args.resource_type):
-            return
-
-        if resource_has_attribute(args.resource_type, "description") and args.props.get("description") is None:
-            report_violation(
-                f"Resource '{args.urn}' is missing required description",
-                None,
-            )
-
-        if config["require_label_if_description_unsupported"]:  # noqa: SIM102
-            if is_labelable(args.resource_type):
-                labels = args.props.get("labels", {})
-                if config["description_label_key"] not in labels:
-                    report_violation(
-                        f"Resource '{args.urn}' is missing required label '{config['description_label_key']}'",
-                        None,
-                    )
+    def _make_plan(self, config: RequireDescriptionConfig, resource_type: str) -> _Plan | None:
+        if config["exclude"](resource_type):
+            return None
+
+        if not is_gcp_resource(resource_type):
+            return None
+
+        description_label_key = None
+        if config["require_label_if_description_unsupported"] and is_labelable(resource_type):
+            description_label_key = config["description_label_key"]
+
+        description = resource_has_attribute(resource_type, "description")
+        if not description and description_label_key is None:
+            return None
+
+        return _Plan(description=description, description_label_key=description_label_key)
+
+    def _check(self, plan: _Plan, urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        if plan.description and props.get("description") is None:
+            yield f"Resource '{urn}' is missing required description"
+
+        if plan.description_label_key is not None:
+            labels = props.get("labels") or {}
+            if plan.description_label_key not in labels:
+                yield f"Resource '{urn}' is missing required label '{plan.description_label_key}'"
 
 
 require_description = policy.ResourceValidationPolicy(
@@ -86,3 +94,10 @@ require_description = policy.ResourceValidationPolicy(
     ),
     validate=RequireDescription(),
 )
+
+require_description_stack = policy.StackValidationPolicy(
+    name="gcp:require-description-stack",
+    description="Require description (or label if unsupported) on all resources of the stack at once",
+    config_schema=require_description.config_schema,
+    validate=RequireDescription().validate_stack,
+)
@@ -1,58 +1,57 @@
 # noqa: D100
 from __future__ import annotations
 
-from fnmatch import fnmatch
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import pulumi_policy as policy
 
+from pulumi_extra._pattern import PatternMatcher
+from pulumi_extra.contrib._policy import PolicyValidator
 from pulumi_extra.contrib.gcp import is_gcp_resource, is_labelable
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
 
 class RequireLabelsConfig(TypedDict):
     """Configuration schema for RequireLabels policy."""
 
-    exclude: set[str]
+    exclude: PatternMatcher
     """Resource types to exclude from this policy. Supports glob patterns."""
 
-    required_labels: set[str]
+    required_labels: frozenset[str]
     """The set of required labels."""
 
 
-class RequireLabels:
+class RequireLabels(PolicyValidator[RequireLabelsConfig, tuple[str, ...]]):
     """Policy validator to require specific labels on resources."""
 
     def _load_config(self, config: Mapping[str, Any]) -> RequireLabelsConfig:
-        exclude = set(config.get("exclude", []))
-        required_labels = set(config.get("required-labels", []))
+        exclude = PatternMatcher(config.get("exclude", []))
+        required_labels = frozenset(config.get("required-labels", []))
         return RequireLabelsConfig(exclude=exclude, required_labels=required_labels)
 
-    def __call__(  # noqa: D102
-        self,
-        args: policy.ResourceValidationArgs,
-        report_violation: policy.ReportViolation,
-    ) -> None:
-        config = self._load_config(args.get_config())
-        if any(fnmatch(args.resource_type, pattern) for pattern in config["exclude"]):
-            return
+    def _make_plan(self, config: RequireLabelsConfig, resource_type: str) -> tuple[str, ...] | None:
+        """Return the labels to check on resources of given type."""
+        if config["exclude"](resource_type):
+            return None
 
         if not config["required_labels"]:
-            return
+            return None
 
-        if not is_gcp_resource(args.resource_type):
-            return
+        if not is_gcp_resource(resource_type):
+            return None
 
-        if is_labelable(args.resource_type):
-            labels = args.props.get("labels", {})
-            for rl in config["required_labels"]:
-                if not labels or rl not in labels:
-                    report_violation(
-                        f"Resource '{args.urn}' is missing required label '{rl}'",
-                        None,
-                    )
+        if not is_labelable(resource_type):
+            return None
+
+        return tuple(sorted(config["required_labels"]))
+
+    def _check(self, plan: tuple[str, ...], urn: str, props: Mapping[str, Any]) -> Iterator[str]:
+        labels = props.get("labels") or {}
+        for rl in plan:
+            if rl not in labels:
+                yield f"Resource '{urn}' is missing required label '{rl}'"
 
 
 require_labels = policy.ResourceValidationPolicy(
@@ -72,3 +71,10 @@ require_labels = policy.ResourceValidationPolicy(
     ),
     validate=RequireLabels(),
 )
+
+require_labels_stack = policy.StackValidationPolicy(
+    name="gcp:require-labels-stack",
+    description="Require specific labels on all resources of the stack at once",
+    config_schema=require_labels.config_schema,
+    validate=RequireLabels().validate_stack,
+)
@@ -4,14 +4,53 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
+from weakref import WeakKeyDictionary
 
 import pulumi
-from jinja2 import StrictUndefined, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader, StrictUndefined, meta
+
+from ._log import log_once
+from .cache import get_cache_dir
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
     from typing import Any
 
+    from jinja2 import Template
+
+_TEMPLATE_CACHE_SIZE = 256
+
+_INLINE_TEMPLATE_PREFIX = "inline:"
+"""Prefix of names of inline templates, which are named after their source."""
+
+
+def _get_source(name: str) -> tuple[str, str | None, Callable[[], bool] | None]:
+    """Return the source of a template, along with its filename and up-to-date check for template files."""
+    if name.startswith(_INLINE_TEMPLATE_PREFIX):
+        return name[len(_INLINE_TEMPLATE_PREFIX) :], None, None
+
+    path = Path(name)
+    mtime = path.stat().st_mtime_ns
+
+    def uptodate() -> bool:
+        try:
+            return path.stat().st_mtime_ns == mtime
+        except OSError:
+            return False
+
+    return path.read_text(), name, uptodate
+
+
+_TEMPLATE_VARIABLES: WeakKeyDictionary[Template, frozenset[str]] = WeakKeyDictionary()
+"""Variables referenced by compiled templates, computed once per template."""
+
+_ENVIRONMENT = Environment(  # noqa: S701 ; Rendered templates are not HTML
+    loader=FunctionLoader(_get_source),
+    undefined=StrictUndefined,
+    cache_size=_TEMPLATE_CACHE_SIZE,
+    auto_reload=True,
+)
+
 
 @overload
 def render_template(
@@ -37,15 +76,18 @@ def render_template(
 ) -> str | pulumi.Output[str]:
     """Render a template file with the given context.
 
+    Compiled templates are cached per process, keyed by path and modification time for template files
+    and by content for inline templates. See `enable_template_bytecode_cache` to also cache them on disk.
+
+    When rendering with inputs, only the inputs referenced by the template are waited for; unused inputs
+    are dropped so they do not delay rendering nor add dependencies to the output.
+
     Args:
         template: The template file or inline template string.
         context: The context to render the template with. Conflicts with inputs.
         inputs: The inputs to render the template with. Conflicts with context.
     """
-    if isinstance(template, Path):
-        template = template.read_text()
-
-    jinja_tpl = Template(template, undefined=StrictUndefined)
+    jinja_tpl = _load_template(template)
 
     # Render with Python values.
     if context is not None and inputs is None:
@@ -53,8 +95,103 @@ def render_template(
 
     # Render with Pulumi inputs.
     if context is None and inputs is not None:
-        return pulumi.Output.all(inputs).apply(lambda args: jinja_tpl.render(args[0]))
+        used_inputs = _select_inputs(jinja_tpl, inputs)
+        return pulumi.Output.all(used_inputs).apply(lambda args: jinja_tpl.render(args[0]))
 
     # Only one of context or inputs must be provided.
     msg = "Either context or input must be provided."
     raise ValueError(msg)
+
+
+def render_templates(
+    templates: Mapping[str, tuple[Path | str, Mapping[str, pulumi.Input[Any]]]],
+) -> dict[str, pulumi.Output[str]]:
+    """Render many templates with Pulumi inputs at once.
+
+    Inputs of all templates are combined into a single output, each distinct input being waited for once
+    even if shared by several templates, and all templates are rendered in a single apply. This is much
+    cheaper than calling `render_template` in a loop when rendering many templates.
+
+    As the rendered outputs share a single node of the output graph, each of them depends on the inputs
+    of all templates, and is secret if any of the inputs is.
+
+    Args:
+        templates: Templates to render, keyed by name. Each value is a pair of the template file or
+            inline template string, and the inputs to render it with.
+
+    Returns:
+        Rendered outputs, keyed by name.
+
+    """
+    compiled: dict[str, tuple[Template, dict[str, int]]] = {}
+    values: list[Any] = []
+    positions: dict[int, int] = {}
+    for key, (template, inputs) in templates.items():
+        jinja_tpl = _load_template(template)
+        used_inputs = _select_inputs(jinja_tpl, inputs)
+        refs: dict[str, int] = {}
+        for name, value in used_inputs.items():
+            position = positions.get(id(value))
+            if position is None:
+                position = positions[id(value)] = len(values)
+                values.append(value)
+
+            refs[name] = position
+
+        compiled[key] = (jinja_tpl, refs)
+
+    def render(args: list[Any]) -> dict[str, str]:
+        return {
+            key: jinja_tpl.render({name: args[position] for name, position in refs.items()})
+            for key, (jinja_tpl, refs) in compiled.items()
+        }
+
+    rendered = pulumi.Output.all(*values).apply(render)
+    return {key: rendered[key] for key in compiled}
+
+
+def enable_template_bytecode_cache(directory: Path | str | None = None) -> None:
+    """Enable the on-disk bytecode cache of compiled templates, shared across runs.
+
+    Args:
+        directory: Cache directory. Defaults to `jinja2` under `get_cache_dir()`.
+
+    """
+    directory = Path(directory) if directory is not None else get_cache_dir("jinja2")
+    directory.mkdir(parents=True, exist_ok=True)
+    _ENVIRONMENT.bytecode_cache = FileSystemBytecodeCache(str(directory))
+    if _ENVIRONMENT.cache is not None:
+        _ENVIRONMENT.cache.clear()
+
+
+def _load_template(template: Path | str) -> Template:
+    """Load a template through the environment cache, reloading template files when modified."""
+    if isinstance(template, Path):
+        return _ENVIRONMENT.get_template(str(template.resolve()))
+
+    return _ENVIRONMENT.get_template(_INLINE_TEMPLATE_PREFIX + template)
+
+
+def _get_variables(template: Template) -> frozenset[str]:
+    """Return the variables referenced by a template, which must be provided by the context."""
+    try:
+        return _TEMPLATE_VARIABLES[template]
+    except KeyError:
+        pass
+
+    if TYPE_CHECKING:
+        assert template.name is not None
+    source, _, _ = _get_source(template.name)
+    variables = frozenset(meta.find_undeclared_variables(_ENVIRONMENT.parse(source)))
+    _TEMPLATE_VARIABLES[template] = variables
+    return variables
+
+
+def _select_inputs(template: Template, inputs: Mapping[str, Any]) -> dict[str, Any]:
+    variables = _get_variables(template)
+    used_inputs = {k: v for k, v in inputs.items() if k in variables}
+    if len(used_inputs) != len(inputs):
+        unused = sorted(inputs.keys() - used_inputs.keys())
+        log_once.debug(f"Dropping inputs not referenced by template {template.name or '(inline)'}: {unused!r}")
+
+    return used_inputs
@@ -9,16 +9,21 @@ from __future__ import annotations
 
 from functools import cache
 from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version
 from inspect import signature
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-import pulumi
 from pulumi.runtime.rpc import _RESOURCE_MODULES
 
+from ._exit import report_at_exit
+from ._log import log_once
+from .cache import dump_json, get_cache_dir, load_json
 from .errors import UnknownResourceTypeError
+from .schema import get_schema_attributes
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Mapping, Sequence
     from typing import Any
 
 
@@ -26,6 +31,9 @@ if TYPE_CHECKING:
 def resource_has_attribute(resource_type: str, attribute: str) -> bool:
     """Check if a Pulumi resource type has a given attribute.
 
+    Attributes are looked up from loaded provider schemas (see `pulumi_extra.schema`) first, then from the
+    persistent attribute cache (see `enable_attribute_cache`), falling back to introspecting the provider SDK.
+
     Args:
         resource_type: Resource type to check.
         attribute: Attribute to check for.
@@ -33,19 +41,45 @@ def resource_has_attribute(resource_type: str, attribute: str) -> bool:
     Returns:
         `True` if the resource type has the attribute, otherwise `False`.
     """
-    cls = get_resource_cls(resource_type)
-    if cls is None:
-        msg = f"Unable to resolve resource type {resource_type!r}"
-        raise UnknownResourceTypeError(msg)
+    attributes = get_schema_attributes(resource_type)
+    if attributes is None:
+        attributes = _attribute_cache.get(resource_type)
 
-    sig = signature(cls._internal_init)
-    return attribute in sig.parameters
+    if attributes is None:
+        cls = get_resource_cls(resource_type)
+        if cls is None:
+            msg = f"Unable to resolve resource type {resource_type!r}"
+            raise UnknownResourceTypeError(msg)
+
+        attributes = frozenset(signature(cls._internal_init).parameters)
+        _attribute_cache.set(resource_type, attributes)
+
+    return attribute in attributes
+
+
+def enable_attribute_cache(directory: Path | str | None = None) -> None:
+    """Enable the persistent cache of resource attributes.
+
+    Attributes introspected by `resource_has_attribute` are stored on disk, one file per provider package
+    version, so subsequent runs skip importing and introspecting provider SDKs. The cache invalidates
+    automatically when the provider package version changes. Files are loaded in one read on first use and
+    written back when the program exits.
+
+    Args:
+        directory: Cache directory. Defaults to `resource-attributes` under `get_cache_dir()`.
+
+    """
+    _attribute_cache.enable(Path(directory) if directory is not None else get_cache_dir("resource-attributes"))
 
 
-@cache
 def get_resource_cls(resource_type: str) -> Any | None:
     """Get the Pulumi resource class for a given resource type.
 
+    Lookups are served from an index of the Pulumi resource registry, which is refreshed
+    whenever new resource modules get registered (e.g. a provider SDK is imported later on).
+    If the resource type is not registered yet, the provider module owning it
+    (e.g. `pulumi_aws.s3` for `"aws:s3/bucket:Bucket"`) is imported on demand.
+
     Args:
         resource_type: Resource type to get the class for.
 
@@ -53,29 +87,234 @@ def get_resource_cls(resource_type: str) -> Any | None:
         Pulumi resource class if found, otherwise `None`.
 
     """
-    try:
-        _, resource = next(filter(lambda k: k[0] == resource_type, _get_resources()))
-    except StopIteration:
-        pulumi.log.debug(f"Resource type {resource_type} not found")
+    resource = _resource_index.lookup(resource_type)
+    if resource is None and _import_provider_module(*_get_provider_module(resource_type)):
+        resource = _resource_index.lookup(resource_type)
+
+    if resource is None:
+        log_once.debug(f"Resource type {resource_type} not found")
         return None
 
     module_name, class_name = resource
+    return _import_resource_cls(module_name, class_name)
+
+
+def _clear_resource_cls_cache() -> None:
+    """Clear the caches of `get_resource_cls`: the resource index and imported modules and classes."""
+    _resource_index.clear()
+    _import_provider_module.cache_clear()
+    _import_resource_cls.cache_clear()
+
+
+# Kept from when `get_resource_cls` was cached with `functools.cache`
+get_resource_cls.cache_clear = _clear_resource_cls_cache  # type: ignore[attr-defined]
+
+
+def _get_provider_module(resource_type: str) -> tuple[str, str | None]:
+    """Return the provider package and module name owning a resource type.
+
+    For example, `("pulumi_aws", "s3")` for `"aws:s3/bucket:Bucket"`; module is `None` for the index module.
+    """
+    package, _, rest = resource_type.partition(":")
+    module = rest.partition(":")[0].partition("/")[0]
+    package_name = f"pulumi_{package.replace('-', '_')}"
+    if not module or module == "index":
+        return package_name, None
+
+    return package_name, module.replace("-", "_")
+
+
+@cache
+def _import_provider_module(package_name: str, module: str | None) -> bool:
+    """Import a provider module so that its resources get registered.
+
+    Provider SDKs register all of their resource modules on package import, while submodules themselves
+    are loaded lazily; only the submodule owning the resource type is imported.
+
+    Returns:
+        `True` if the provider package could be imported, otherwise `False`.
+    """
+    if module is not None:
+        try:
+            import_module(f"{package_name}.{module}")
+        except ImportError:
+            pass
+        else:
+            return True
+
+    try:
+        import_module(package_name)
+    except ImportError:
+        return False
+
+    return True
+
+
+@cache
+def _import_resource_cls(module_name: str, class_name: str) -> Any:
     module = import_module(module_name)
     return getattr(module, class_name)
 
 
-def _get_resources() -> Iterator[tuple[str, tuple[str, str]]]:
-    """Return Pulumi resource registry.
+class _AttributeCache:
+    """Persistent cache of resource attributes keyed by provider package, version and resource type."""
+
+    def __init__(self) -> None:
+        self._directory: Path | None = None
+        self._packages: dict[str, tuple[Path, dict[str, list[str]]] | None] = {}
+        self._dirty: set[str] = set()
+
+    def enable(self, directory: Path) -> None:
+        self.flush()
+        self._directory = directory
+        self._packages.clear()
+
+    def disable(self) -> None:
+        self.flush()
+        self._directory = None
+        self._packages.clear()
+
+    def get(self, resource_type: str) -> frozenset[str] | None:
+        entry = self._load(resource_type)
+        if entry is None:
+            return None
+
+        _, attributes = entry
+        cached = attributes.get(resource_type)
+        return frozenset(cached) if cached is not None else None
+
+    def set(self, resource_type: str, attributes: frozenset[str]) -> None:
+        entry = self._load(resource_type)
+        if entry is None:
+            return
+
+        package = _get_package(resource_type)
+        entry[1][resource_type] = sorted(attributes)
+        self._dirty.add(package)
+
+    def flush(self) -> list[str]:
+        """Write back packages with new entries, merging with concurrent writers, and return failures."""
+        failures = []
+        for package in self._dirty:
+            entry = self._packages.get(package)
+            if entry is None:
+                continue
+
+            path, attributes = entry
+            merged = _valid_entries(load_json(path))
+            merged.update(attributes)
+            try:
+                dump_json(path, merged)
+            except OSError as err:
+                failures.append(f"Unable to write resource attribute cache {path}: {err}")
+
+        self._dirty.clear()
+        return failures
+
+    def _load(self, resource_type: str) -> tuple[Path, dict[str, list[str]]] | None:
+        if self._directory is None:
+            return None
+
+        package = _get_package(resource_type)
+        if package in self._packages:
+            return self._packages[package]
+
+        try:
+            package_version = version(f"pulumi_{package.replace('-', '_')}")
+        except PackageNotFoundError:
+            entry = None
+        else:
+            path = self._directory / f"{package}-{package_version}.json"
+            entry = (path, _valid_entries(load_json(path)))
+
+        self._packages[package] = entry
+        return entry
+
+
+def _valid_entries(data: Any) -> dict[str, list[str]]:
+    """Return the well-formed entries of a cache file; anything else is treated as a cache miss."""
+    if not isinstance(data, dict):
+        return {}
+
+    return {
+        key: value
+        for key, value in data.items()
+        if isinstance(value, list) and all(isinstance(attribute, str) for attribute in value)
+    }
+
+
+def _get_package(resource_type: str) -> str:
+    """Return the package of a resource type, e.g. `"aws"` for `"aws:s3/bucket:Bucket"`."""
+    return resource_type.split(":", 1)[0]
+
+
+class _ResourceIndex:
+    """Incrementally built index of the Pulumi resource registry, keyed by resource type.
+
+    The underlying registry (`_RESOURCE_MODULES`) gradually populates as provider SDKs are imported,
+    so the index only indexes modules registered since the last refresh. On a miss, the registry is
+    checked for changes in constant time: new registry keys show up in its length, and new versions of
+    an already registered module show up in the length of the registry entry owning the resource type
+    (e.g. `"aws:s3/bucket"` for `"aws:s3/bucket:Bucket"`). Types that are not registered *yet* will thus
+    be found once the registry grows, without walking the registry on every miss.
+    """
+
+    def __init__(self, registry: Mapping[str, Sequence[Any]]) -> None:
+        self._registry = registry
+        self._index: dict[str, tuple[str, str]] = {}
+        self._indexed: dict[str, int] = {}
+        self._size = 0
+
+    def lookup(self, resource_type: str) -> tuple[str, str] | None:
+        """Return the module and class name for given resource type, if registered."""
+        resource = self._index.get(resource_type)
+        if resource is not None:
+            return resource
+
+        if self._is_stale(resource_type.rpartition(":")[0]):
+            self._refresh()
+            resource = self._index.get(resource_type)
+
+        return resource
+
+    def clear(self) -> None:
+        """Drop the index; it will be rebuilt on next lookup."""
+        self._index.clear()
+        self._indexed.clear()
+        self._size = 0
+
+    def _is_stale(self, key: str) -> bool:
+        if len(self._registry) != self._size:
+            return True
+
+        return len(self._registry.get(key, ())) != self._indexed.get(key, 0)
+
+    def _refresh(self) -> None:
+        for key, modules in list(self._registry.items()):
+            start = self._indexed.get(key, 0)
+            for type_, resource in _get_resources(modules[start:]):
+                self._index.setdefault(type_, resource)
+
+            self._indexed[key] = len(modules)
+
+        self._size = len(self._registry)
+
+
+def _get_resources(modules: Sequence[Any]) -> Iterator[tuple[str, tuple[str, str]]]:
+    """Return resources of given Pulumi resource modules.
 
     Returns:
         Iterator of tuple containing resource type and resource class.
 
     """
-    # NOTE: This cannot be cached as the underlying registry (`_RESOURCE_MODULES`) gradually populates
-    for modules in _RESOURCE_MODULES.values():
-        for module in modules:
-            mod_info = module.mod_info  # type: ignore[attr-defined]
-            fqn, classes = mod_info["fqn"], mod_info["classes"]
-            for type_, name in classes.items():
-                # e.g. ("gcp:activedirectory/domain:Domain", ("pulumi_gcp.activedirectory", "Domain"))
-                yield (type_, (fqn, name))
+    for module in modules:
+        mod_info = module.mod_info
+        fqn, classes = mod_info["fqn"], mod_info["classes"]
+        for type_, name in classes.items():
+            # e.g. ("gcp:activedirectory/domain:Domain", ("pulumi_gcp.activedirectory", "Domain"))
+            yield (type_, (fqn, name))
+
+
+_resource_index = _ResourceIndex(_RESOURCE_MODULES)
+_attribute_cache = _AttributeCache()
+report_at_exit(_attribute_cache.flush)
@@ -0,0 +1,129 @@
+"""Provider schema backed index of resource attributes.
+
+Answers `resource_has_attribute` (and thus `is_taggable` and `is_labelable`) from a provider schema,
+as produced by `pulumi package get-schema <provider>`, without importing the provider Python SDK.
+
+Since provider schemas are large, a compact manifest holding only the resource input properties
+can be generated ahead of time and shipped along with a program or policy pack:
+
+```bash
+$ pulumi package get-schema aws > aws-schema.json
+$ python -m pulumi_extra.schema aws-schema.json aws-manifest.json
+```
+
+Then load it at startup:
+
+```python
+from pulumi_extra.schema import load_manifest
+
+load_manifest("aws-manifest.json")
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from keyword import iskeyword
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cache import dump_json
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+_SCHEMA_INDEX: dict[str, frozenset[str]] = {}
+"""Resource type to Python names of its input properties."""
+
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+
+def load_schema(path: Path | str) -> None:
+    """Index resources of a provider schema file.
+
+    Args:
+        path: Path to the provider schema JSON file.
+
+    """
+    schema = json.loads(Path(path).read_bytes())
+    _SCHEMA_INDEX.update(_index_schema(schema))
+
+
+def load_manifest(path: Path | str) -> None:
+    """Index resources of a manifest file generated by `build_manifest`.
+
+    Args:
+        path: Path to the manifest file.
+
+    """
+    manifest = json.loads(Path(path).read_bytes())
+    for type_, attributes in manifest["resources"].items():
+        _SCHEMA_INDEX[type_] = frozenset(attributes)
+
+
+def build_manifest(schema: Path | str, output: Path | str) -> None:
+    """Generate a compact manifest of resource input properties from a provider schema file.
+
+    Args:
+        schema: Path to the provider schema JSON file.
+        output: Path to write the manifest to.
+
+    """
+    schema_ = json.loads(Path(schema).read_bytes())
+    resources = _index_schema(schema_)
+    manifest = {
+        "name": schema_.get("name"),
+        "version": schema_.get("version"),
+        "resources": {type_: sorted(attributes) for type_, attributes in resources.items()},
+    }
+    dump_json(Path(output), manifest)
+
+
+def get_schema_attributes(resource_type: str) -> frozenset[str] | None:
+    """Return the Python names of input properties of given resource type, if indexed.
+
+    Args:
+        resource_type: Resource type to get the attributes for.
+
+    Returns:
+        Set of attributes if the resource type is indexed, otherwise `None`.
+
+    """
+    return _SCHEMA_INDEX.get(resource_type)
+
+
+def _index_schema(schema: Mapping[str, Any]) -> dict[str, frozenset[str]]:
+    return {
+        type_: frozenset(_python_name(name, spec) for name, spec in resource.get("inputProperties", {}).items())
+        for type_, resource in schema.get("resources", {}).items()
+    }
+
+
+def _python_name(name: str, spec: Mapping[str, Any]) -> str:
+    """Return the Python SDK name of a schema property, e.g. `"byte_length"` for `"byteLength"`."""
+    override = spec.get("language", {}).get("python", {}).get("name")
+    if override:
+        return str(override)
+
+    python_name = _CAMEL_CASE_BOUNDARY.sub("_", name).lower()
+    if iskeyword(python_name):
+        python_name += "_"
+
+    return python_name
+
+
+def main(argv: Sequence[str] | None = None) -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(
+        prog="python -m pulumi_extra.schema",
+        description="Generate a compact manifest of resource input properties from a provider schema.",
+    )
+    parser.add_argument("schema", type=Path, help="Provider schema JSON file (`pulumi package get-schema`)")
+    parser.add_argument("output", type=Path, help="Path to write the manifest to")
+    args = parser.parse_args(argv)
+    build_manifest(args.schema, args.output)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from datetime import timedelta
 from functools import cache
 from itertools import chain
+from pathlib import Path
 from typing import Any, overload
+from urllib.parse import quote
 
 import pulumi
 from braceexpand import braceexpand
 
+from ._pattern import PatternMatcher, is_glob
+from .cache import dump_json, get_cache_dir, load_json
+
 
-@cache
 def get_stack_reference(ref: str) -> pulumi.StackReference:
     """Resolve given stack reference shorthand to fully qualified stack reference.
 
@@ -28,11 +35,22 @@ def get_stack_reference(ref: str) -> pulumi.StackReference:
 
         No change is made to the stack reference.
 
+    Stack references are pooled by fully qualified name, so different shorthands of the same stack
+    (e.g. `"dev"` and `"{organization}/{project}/dev"`) share a single `pulumi.StackReference`.
+
     """
-    fqr = _resolve_stack_ref(ref)
+    return _get_stack_reference(_resolve_stack_ref(ref))
+
+
+@cache
+def _get_stack_reference(fqr: str) -> pulumi.StackReference:
     return pulumi.StackReference(fqr)
 
 
+# Kept from when `get_stack_reference` was cached with `functools.cache`
+get_stack_reference.cache_clear = _get_stack_reference.cache_clear  # type: ignore[attr-defined]
+
+
 def _resolve_stack_ref(ref: str) -> str:
     components = ref.split("/")
     num_components = len(components)
@@ -52,27 +70,72 @@ def _resolve_stack_ref(ref: str) -> str:
     return fqr
 
 
+def enable_stack_output_snapshot(
+    directory: Path | str | None = None,
+    *,
+    ttl: timedelta | None = timedelta(days=1),
+    refresh: bool = False,
+) -> None:
+    """Enable the snapshot of stack outputs, to resolve output references offline during previews.
+
+    Outputs of stacks referenced through `get_stack_outputs` and `re_export` are written to a snapshot file
+    per stack once resolved. During previews, output references are then served from the snapshot as long
+    as it is fresh, without reading the referenced stack. Updates always read referenced stacks and refresh
+    the snapshot. Secret outputs are never written to the snapshot, and are always read from the stack.
+
+    Snapshot files are plain JSON, named after the fully qualified stack name (e.g.
+    `organization%2Fnetwork%2Fdev.json`), so they can be written by hand to stand in for a backend:
+
+    ```json
+    {"outputs": {"vpc-id": "vpc-0123456789abcdef0"}}
+    ```
+
+    Note that output references served from a snapshot do not register a `pulumi.StackReference`, as it
+    would read the referenced stack. Previews of a stack whose state holds the reference thus show it as
+    deleted, while updates read the stack and keep it. The version of referenced stacks is not tracked
+    either; rely on `ttl` and `refresh` to pick up changes.
+
+    Args:
+        directory: Snapshot directory. Defaults to `stack-outputs` under `get_cache_dir()`.
+        ttl: Age after which snapshots are ignored. Snapshots without a timestamp, or any snapshot if
+            `None`, never expire.
+        refresh: If `True`, ignore existing snapshots and read referenced stacks again.
+
+    """
+    _stack_output_snapshot.enable(
+        Path(directory) if directory is not None else get_cache_dir("stack-outputs"),
+        ttl=ttl,
+        refresh=refresh,
+    )
+
+
 @overload
-def get_stack_outputs(ref: str) -> pulumi.Output[Any]: ...  # pragma: no cover
+def get_stack_outputs(ref: str, *, fetch_once: bool = False) -> pulumi.Output[Any]: ...  # pragma: no cover
 
 
 @overload
-def get_stack_outputs(*refs: str) -> list[pulumi.Output[Any]]: ...  # pragma: no cover
+def get_stack_outputs(*refs: str, fetch_once: bool = False) -> list[pulumi.Output[Any]]: ...  # pragma: no cover
 
 
 def get_stack_outputs(  # type: ignore[misc]
     *refs: str,
+    fetch_once: bool = False,
 ) -> pulumi.Output[Any] | list[pulumi.Output[Any]]:
-    """Get outputs from a output reference shorthands. Supports brace expansion.
+    """Get outputs from a output reference shorthands. Supports brace expansion and glob patterns.
 
     - Single output reference: (`"<stack_ref>:<output_key>"`).
     - Multiple outputs using brace expansion: (`"<stack_ref>:{<output_key_1>,<output_key_2>}"`).
+    - Outputs matching a glob pattern: (`"<stack_ref>:*"`, `"<stack_ref>:<prefix>_*"`). The output is a map
+      of matching output keys to values, selected from the outputs of the stack in a single apply. It is
+      secret if any output of the stack is.
 
     Args:
         *refs: Output references.
+        fetch_once: If `True`, outputs of each stack are resolved once and served to all requested
+            keys locally, instead of going through `pulumi.StackReference.require_output` per key.
 
     """
-    outputs = _get_stack_outputs(*refs)
+    outputs = _get_stack_outputs(*refs, fetch_once=fetch_once)
     output_values = list(outputs.values())
     if len(output_values) == 1:
         return output_values[0]
@@ -80,19 +143,31 @@ def get_stack_outputs(  # type: ignore[misc]
     return output_values
 
 
-def re_export(*refs: str) -> None:
+def re_export(*refs: str, fetch_once: bool = False) -> None:
     """Re-export outputs from a output reference shorthands.
 
+    Outputs referenced by key are re-exported under the same key. As stack outputs must be exported before
+    referenced stacks are read, outputs selected by glob patterns are re-exported as a single map per stack
+    reference, named after the stack reference (e.g. `"network/dev"` for `"network/dev:vpc_*"`).
+
     Args:
         *refs: Output references.
+        fetch_once: If `True`, outputs of each stack are resolved once. See `get_stack_outputs`.
 
     """
-    outputs = _get_stack_outputs(*refs)
-    for (_, output_key), output in outputs.items():
-        pulumi.export(output_key, output)
+    outputs = _get_stack_outputs(*refs, fetch_once=fetch_once)
+    selections: dict[str, list[pulumi.Output[Any]]] = {}
+    for (stack_ref, output_key), output in outputs.items():
+        if is_glob(output_key):
+            selections.setdefault(stack_ref, []).append(output)
+        else:
+            pulumi.export(output_key, output)
 
+    for stack_ref, selected in selections.items():
+        pulumi.export(stack_ref, pulumi.Output.all(*selected).apply(_merge_selections))
 
-def _get_stack_outputs(*refs: str) -> dict[tuple[str, str], pulumi.Output[Any]]:
+
+def _get_stack_outputs(*refs: str, fetch_once: bool = False) -> dict[tuple[str, str], pulumi.Output[Any]]:
     expand_refs = list(chain.from_iterable(map(braceexpand, refs)))
     pulumi.log.debug(f"Expanded output references ({refs!r}): {expand_refs!r}")
 
@@ -103,12 +178,37 @@ def _get_stack_outputs(*refs: str) -> dict[tuple[str, str], pulumi.Output[Any]]:
 
     outputs: dict[tuple[str, str], pulumi.Output[Any]] = {}
     for stack_ref, output_key in fqr:
-        sr = get_stack_reference(stack_ref)
-        outputs[(stack_ref, output_key)] = sr.require_output(output_key)
+        resolved_ref = _resolve_stack_ref(stack_ref)
+        if is_glob(output_key):
+            # Snapshots lack secret outputs, so selections are always made from the stack itself
+            output = _select_stack_outputs(resolved_ref, output_key)
+            _stack_output_snapshot.watch(resolved_ref)
+        elif (snapshot_output := _stack_output_snapshot.get(resolved_ref, output_key)) is not None:
+            output = snapshot_output
+        else:
+            if fetch_once:
+                output = _get_stack_output_pool(resolved_ref).require(output_key)
+            else:
+                output = _get_stack_reference(resolved_ref).require_output(output_key)
+
+            _stack_output_snapshot.watch(resolved_ref)
+
+        outputs[(stack_ref, output_key)] = output
 
     return outputs
 
 
+def _select_stack_outputs(fqr: str, pattern: str) -> pulumi.Output[dict[str, Any]]:
+    matches = PatternMatcher((pattern,))
+    return _get_stack_reference(fqr).outputs.apply(
+        lambda outputs: {key: value for key, value in outputs.items() if matches(key)},
+    )
+
+
+def _merge_selections(selections: list[dict[str, Any]]) -> dict[str, Any]:
+    return {key: value for selection in selections for key, value in selection.items()}
+
+
 def _resolve_output_ref(ref: str) -> tuple[str, str]:
     components = ref.split(":")
     stack_ref, output_key = components
@@ -117,3 +217,138 @@ def _resolve_output_ref(ref: str) -> tuple[str, str]:
         raise ValueError(msg)
 
     return stack_ref, output_key
+
+
+@cache
+def _get_stack_output_pool(fqr: str) -> _StackOutputPool:
+    return _StackOutputPool(_get_stack_reference(fqr))
+
+
+class _StackOutputPool:
+    """Outputs of a stack reference, resolved once and fanned out locally per key.
+
+    `pulumi.StackReference.require_output` combines the whole outputs map with the key and resolves the
+    secret output names for every key requested. The pool instead derives each key from the outputs map
+    directly, resolves the secret output names once, and memoizes outputs per key.
+    """
+
+    def __init__(self, sr: pulumi.StackReference) -> None:
+        self._sr = sr
+        self._outputs: dict[str, pulumi.Output[Any]] = {}
+        self._secret_names: asyncio.Future[frozenset[str] | None] | None = None
+
+    def require(self, key: str) -> pulumi.Output[Any]:
+        """Return the output of given key, raising `KeyError` on resolution if the stack has no such output."""
+        output = self._outputs.get(key)
+        if output is None:
+            value = self._sr.outputs.apply(lambda outputs: outputs[key])
+            is_secret = asyncio.ensure_future(self._is_secret(key))
+            output = pulumi.Output(value.resources(), value.future(), value.is_known(), is_secret)
+            self._outputs[key] = output
+
+        return output
+
+    async def _is_secret(self, key: str) -> bool:
+        if self._secret_names is None:
+            self._secret_names = asyncio.ensure_future(self._get_secret_names())
+
+        names = await self._secret_names
+        if names is None:
+            return await self._sr.outputs.is_secret()
+
+        return key in names
+
+    async def _get_secret_names(self) -> frozenset[str] | None:
+        # Mirrors `pulumi.StackReference`: fall back to the secretness of the whole outputs map if unknown
+        if not await self._sr.secret_output_names.is_known():
+            return None
+
+        names = await self._sr.secret_output_names.future()
+        return frozenset(names) if names is not None else None
+
+
+class _StackOutputSnapshot:
+    """Snapshot of non-secret stack outputs, one file per fully qualified stack name."""
+
+    def __init__(self) -> None:
+        self._directory: Path | None = None
+        self._ttl: timedelta | None = None
+        self._refresh = False
+        self._snapshots: dict[str, dict[str, Any] | None] = {}
+        self._watched: set[str] = set()
+
+    def enable(self, directory: Path, *, ttl: timedelta | None, refresh: bool) -> None:
+        self._directory = directory
+        self._ttl = ttl
+        self._refresh = refresh
+        self._snapshots.clear()
+        self._watched.clear()
+
+    def disable(self) -> None:
+        self._directory = None
+        self._snapshots.clear()
+        self._watched.clear()
+
+    def get(self, fqr: str, key: str) -> pulumi.Output[Any] | None:
+        """Return the output of given key from the snapshot, if serving from snapshots."""
+        if self._directory is None or self._refresh or not pulumi.runtime.is_dry_run():
+            return None
+
+        if fqr not in self._snapshots:
+            self._snapshots[fqr] = self._load(self._directory, fqr)
+
+        outputs = self._snapshots[fqr]
+        if outputs is None or key not in outputs:
+            return None
+
+        return pulumi.Output.from_input(outputs[key])
+
+    def watch(self, fqr: str) -> None:
+        """Write the outputs of given stack to its snapshot once resolved."""
+        directory = self._directory
+        if directory is None or fqr in self._watched:
+            return
+
+        self._watched.add(fqr)
+        sr = _get_stack_reference(fqr)
+        pulumi.Output.all(sr.outputs, sr.secret_output_names).apply(lambda args: _write(directory, fqr, *args))
+
+    def _load(self, directory: Path, fqr: str) -> dict[str, Any] | None:
+        snapshot = load_json(_get_snapshot_path(directory, fqr))
+        if not isinstance(snapshot, dict):
+            return None
+
+        outputs = snapshot.get("outputs")
+        if not isinstance(outputs, dict):
+            return None
+
+        timestamp = snapshot.get("timestamp")
+        if self._ttl is not None and isinstance(timestamp, (int, float)):
+            age = time.time() - timestamp
+            if age > self._ttl.total_seconds():
+                pulumi.log.debug(f"Snapshot of stack {fqr} outputs expired")
+                return None
+
+        return outputs
+
+
+def _get_snapshot_path(directory: Path, fqr: str) -> Path:
+    return directory / f"{quote(fqr, safe='')}.json"
+
+
+def _write(directory: Path, fqr: str, outputs: dict[str, Any] | None, secret_names: list[str] | None) -> None:
+    # Without the secret output names (older CLIs), secret outputs cannot be told apart
+    if outputs is None or secret_names is None:
+        return
+
+    snapshot = {
+        "timestamp": time.time(),
+        "outputs": {key: value for key, value in outputs.items() if key not in secret_names},
+    }
+    try:
+        dump_json(_get_snapshot_path(directory, fqr), snapshot)
+    except (OSError, TypeError, ValueError) as err:  # Outputs may not be serializable, e.g. assets
+        pulumi.log.debug(f"Unable to write snapshot of stack {fqr} outputs: {err}")
+
+
+_stack_output_snapshot = _StackOutputSnapshot()
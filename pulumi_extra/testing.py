@@ -0,0 +1,225 @@
+"""In-process harness to test Pulumi programs under runtime mocks.
+
+Runs a program function under `pulumi.runtime.set_mocks`, waits for all of its outputs, and returns the
+registered resources along with their final properties. Unlike the engine, runtime mocks do not apply the
+transforms registered with `pulumi.runtime.register_resource_transform` / `register_invoke_transform`
+(including the ones of the default transform registry, e.g. auto-tagging), so the harness applies them.
+
+```python
+import pulumi_aws as aws
+from pulumi_extra.contrib.aws import register_auto_tagging
+from pulumi_extra.testing import run_program
+
+
+def program() -> None:
+    register_auto_tagging()
+    aws.s3.Bucket("bucket")
+
+
+resources = run_program(program)
+assert resources[0].props["tags"]["Managed-By"] == "Pulumi"
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import Context, copy_context
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+from unittest import mock
+
+import pulumi
+from pulumi.runtime.mocks import MockMonitor
+from pulumi.runtime.settings import set_root_resource
+
+from .resource_ import get_resource_cls, resource_has_attribute
+from .stack_reference import _get_stack_output_pool, _get_stack_reference
+from .transforms import provider_routing_table, transform_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+_Args = TypeVar("_Args")
+
+
+class RegisteredResource(NamedTuple):
+    """Resource registered by a program run with `run_program`."""
+
+    urn: str
+    """URN of the resource."""
+
+    type_: str
+    """Type of the resource."""
+
+    name: str
+    """Name of the resource."""
+
+    id: str | None
+    """ID of the resource, as returned by the mocks."""
+
+    props: dict[str, Any]
+    """Properties of the resource, as returned by the mocks. Default mocks return the inputs after transforms."""
+
+
+def run_program(  # noqa: PLR0913
+    program: Callable[[], object],
+    *,
+    mocks: pulumi.runtime.Mocks | None = None,
+    project: str = "project",
+    stack: str = "stack",
+    organization: str = "organization",
+    preview: bool = False,
+) -> list[RegisteredResource]:
+    """Run a Pulumi program in-process under runtime mocks.
+
+    Runtime transforms registered by the program are applied to the inputs of resources and the arguments
+    of invokes before they reach the mocks. Only properties (or arguments) returned by transforms are
+    applied; transforms are given empty options, and options they return are ignored.
+
+    Args:
+        program: Program function to run. If it returns an output, the output is waited for too.
+        mocks: Mocks of resources and invokes. Defaults to mocks returning the inputs of resources as their
+            properties, and empty results for invokes.
+        project: Name of the project.
+        stack: Name of the stack.
+        organization: Name of the organization.
+        preview: Whether to run as a preview.
+
+    Returns:
+        Registered resources, in registration order.
+
+    """
+    transforming_mocks = _TransformingMocks(mocks if mocks is not None else _DefaultMocks())
+    monitor = MockMonitor(transforming_mocks)
+
+    # Make mocks create a root stack resource of their own, as the root is kept across runs otherwise
+    set_root_resource(None)  # type: ignore[arg-type]
+    pulumi.runtime.set_mocks(
+        transforming_mocks,
+        project=project,
+        stack=stack,
+        preview=preview,
+        monitor=monitor,
+        organization=organization,
+    )
+    transforming_mocks.capture_context()
+    with _capture_transforms(transforming_mocks):
+        pulumi.runtime.test(program)()
+
+    return [
+        RegisteredResource(urn, *_parse_urn(urn), registration.id, registration.state)
+        for urn, registration in monitor.get_registered_resources().items()
+    ]
+
+
+def reset_caches() -> None:
+    """Reset the in-memory caches of this package, e.g. between tests.
+
+    This covers `resource_has_attribute`, `get_resource_cls`, `get_stack_reference` and `get_stack_outputs`
+    caches, transforms of the default transform registry and routes of the default provider routing table.
+    """
+    resource_has_attribute.cache_clear()
+    get_resource_cls.cache_clear()  # type: ignore[attr-defined]
+    _get_stack_reference.cache_clear()
+    _get_stack_output_pool.cache_clear()
+    transform_registry.reset()
+    provider_routing_table.reset()
+
+
+class _DefaultMocks(pulumi.runtime.Mocks):
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs) -> tuple[str, dict[str, Any]]:
+        return (f"{args.name}_id", args.inputs)
+
+    def call(self, args: pulumi.runtime.MockCallArgs) -> Any:  # noqa: ARG002
+        return {}
+
+
+class _TransformingMocks(pulumi.runtime.Mocks):
+    """Mocks applying runtime transforms before delegating to other mocks."""
+
+    def __init__(self, mocks: pulumi.runtime.Mocks) -> None:
+        self._mocks = mocks
+        self._context: Context | None = None
+        self.resource_transforms: list[pulumi.ResourceTransform] = []
+        self.invoke_transforms: list[pulumi.InvokeTransform] = []
+
+    def capture_context(self) -> None:
+        """Capture the context of the program, holding its runtime settings.
+
+        Mocks are called from worker threads of the runtime, which do not inherit the context of the program;
+        transforms run in a copy of it so they get the settings of the program (e.g. `pulumi.get_stack()`).
+        """
+        self._context = copy_context()
+
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs) -> tuple[str | None, dict[Any, Any]]:
+        self._run(self._transform_resource, args)
+        return self._mocks.new_resource(args)
+
+    def call(self, args: pulumi.runtime.MockCallArgs) -> Any:
+        self._run(self._transform_invoke, args)
+        return self._mocks.call(args)
+
+    def _run(self, fn: Callable[[_Args], None], args: _Args) -> None:
+        if self._context is None:
+            fn(args)
+        else:
+            self._context.copy().run(fn, args)
+
+    def _transform_resource(self, args: pulumi.runtime.MockResourceArgs) -> None:
+        for transform in self.resource_transforms:
+            result = _resolve(
+                transform(
+                    pulumi.ResourceTransformArgs(
+                        custom=bool(args.custom),
+                        type_=args.typ,
+                        name=args.name,
+                        props=args.inputs,
+                        opts=pulumi.ResourceOptions(),
+                    ),
+                ),
+            )
+            if result is not None:
+                args.inputs = dict(result.props)
+
+    def _transform_invoke(self, args: pulumi.runtime.MockCallArgs) -> None:
+        for transform in self.invoke_transforms:
+            result = _resolve(transform(pulumi.InvokeTransformArgs(args.token, args.args, pulumi.InvokeOptions())))
+            if result is not None:
+                args.args = dict(result.args)
+
+
+@contextmanager
+def _capture_transforms(mocks: _TransformingMocks) -> Iterator[None]:
+    """Capture runtime transforms registered meanwhile, which runtime mocks do not support."""
+    with (
+        mock.patch.object(pulumi.runtime, "register_resource_transform", mocks.resource_transforms.append),
+        mock.patch.object(pulumi.runtime, "register_invoke_transform", mocks.invoke_transforms.append),
+    ):
+        yield
+
+
+def _resolve(result: Any) -> Any:
+    """Return the result of a transform, waiting for it in a loop of its own if asynchronous.
+
+    Mocks are called from worker threads of the runtime, outside of the event loop of the program.
+    """
+    if not isawaitable(result):
+        return result
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_await(result))
+    finally:
+        loop.close()
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+def _parse_urn(urn: str) -> tuple[str, str]:
+    """Return the type and name of a resource from its URN, e.g. `urn:pulumi:stack::project::type::name`."""
+    _, _, qualified_type, name = urn.split("::", 3)
+    return qualified_type.rpartition("$")[2], name
@@ -1,8 +1,21 @@
-from .invoke import override_invoke, override_invoke_defaults, override_invoke_options
-from .resource_ import override_resource, override_resource_defaults, override_resource_options
-from .runtime import override_default_provider
+from typing import TYPE_CHECKING
+
+from pulumi_extra._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .instrumentation import TransformStats, enable_transform_instrumentation, get_transform_stats
+    from .invoke import override_invoke, override_invoke_defaults, override_invoke_options
+    from .registry import TransformRegistry, transform_registry
+    from .resource_ import override_resource, override_resource_defaults, override_resource_options
+    from .routing import ProviderRoutingTable, provider_routing_table
+    from .runtime import override_default_provider
 
 __all__ = (
+    "ProviderRoutingTable",
+    "TransformRegistry",
+    "TransformStats",
+    "enable_transform_instrumentation",
+    "get_transform_stats",
     "override_default_provider",
     "override_invoke",
     "override_invoke_defaults",
@@ -10,4 +23,18 @@ __all__ = (
     "override_resource",
     "override_resource_defaults",
     "override_resource_options",
+    "provider_routing_table",
+    "transform_registry",
+)
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".instrumentation": ("TransformStats", "enable_transform_instrumentation", "get_transform_stats"),
+        ".invoke": ("override_invoke", "override_invoke_defaults", "override_invoke_options"),
+        ".registry": ("TransformRegistry", "transform_registry"),
+        ".resource_": ("override_resource", "override_resource_defaults", "override_resource_options"),
+        ".routing": ("ProviderRoutingTable", "provider_routing_table"),
+        ".runtime": ("override_default_provider",),
+    },
 )
@@ -0,0 +1,166 @@
+"""Opt-in instrumentation of transforms, to find slow transforms or transforms that never match.
+
+Once enabled, transforms created by the transform factories of this package (and by the contrib
+auto-tagging/labeling) record how many times they were called, matched (e.g. the resource type) and changed
+something (i.e. returned a result), and the cumulative and maximum time spent in them. Statistics are
+summarized at program exit.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pulumi_extra._exit import report_at_exit
+from pulumi_extra.cache import dump_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_Transform = TypeVar("_Transform", bound="Callable[..., Any]")
+
+
+class TransformStats:
+    """Statistics of a transform."""
+
+    __slots__ = ("calls", "changes", "matches", "max_time", "name", "total_time")
+
+    def __init__(self, name: str) -> None:
+        """Create empty statistics for the transform of given name."""
+        self.name = name
+        """Name of the transform, made of the factory and the types it matches."""
+
+        self.calls = 0
+        """Number of times the transform was called."""
+
+        self.matches = 0
+        """Number of times the transform matched, e.g. the resource type, whether or not it changed anything."""
+
+        self.changes = 0
+        """Number of times the transform returned a result. Asynchronous results always count as changes."""
+
+        self.total_time = 0.0
+        """Cumulative time spent in the transform, in seconds."""
+
+        self.max_time = 0.0
+        """Maximum time spent in a single call of the transform, in seconds."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "matches": self.matches,
+            "changes": self.changes,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, calls={self.calls}, matches={self.matches},"
+            f" changes={self.changes}, total_time={self.total_time:.6f}, max_time={self.max_time:.6f})"
+        )
+
+
+def enable_transform_instrumentation(output: Path | str | None = None) -> None:
+    """Enable the instrumentation of transforms.
+
+    Only transforms created after this call are instrumented; call it before creating any transform.
+    Statistics are available through `get_transform_stats`, and are reported at program exit: written to
+    given JSON file, or written to standard error if no file is given.
+
+    Args:
+        output: JSON file to write the statistics to at exit.
+
+    """
+    _instrumentation.enable(Path(output) if output is not None else None)
+
+
+def get_transform_stats() -> list[TransformStats]:
+    """Return the statistics of instrumented transforms, slowest first."""
+    return _instrumentation.get_stats()
+
+
+def instrument(transform: _Transform, name: str, matches: Callable[[Any], bool] | None = None) -> _Transform:
+    """Return given transform recording its statistics under given name, if instrumentation is enabled.
+
+    Args:
+        transform: Transform to instrument.
+        name: Name of the transform in statistics.
+        matches: Whether the transform matches given arguments, e.g. their resource type. Transforms without
+            it match whenever they return a result.
+
+    """
+    return _instrumentation.instrument(transform, name, matches)
+
+
+class _Instrumentation:
+    def __init__(self) -> None:
+        self._enabled = False
+        self._output: Path | None = None
+        self._stats: list[TransformStats] = []
+
+    def enable(self, output: Path | None) -> None:
+        self._enabled = True
+        self._output = output
+
+    def disable(self) -> None:
+        self._enabled = False
+        self._output = None
+        self._stats.clear()
+
+    def get_stats(self) -> list[TransformStats]:
+        return sorted(self._stats, key=lambda stats: stats.total_time, reverse=True)
+
+    def instrument(self, transform: _Transform, name: str, matches: Callable[[Any], bool] | None) -> _Transform:
+        if not self._enabled:
+            return transform
+
+        stats = TransformStats(name)
+        self._stats.append(stats)
+
+        def instrumented(args: Any) -> Any:
+            start = perf_counter()
+            try:
+                result = transform(args)
+            finally:
+                elapsed = perf_counter() - start
+                stats.calls += 1
+                stats.total_time += elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+
+            if result is not None:
+                stats.changes += 1
+
+            if (result is not None) if matches is None else matches(args):
+                stats.matches += 1
+
+            return result
+
+        return cast("_Transform", instrumented)
+
+    def report(self) -> list[str]:
+        """Write statistics of instrumented transforms to the output file, or return them as a report."""
+        stats = self.get_stats()
+        if not stats:
+            return []
+
+        if self._output is not None:
+            try:
+                dump_json(self._output, [s.as_dict() for s in stats])
+            except OSError as err:
+                return [f"Unable to write transform statistics to {self._output}: {err}"]
+
+            return []
+
+        return [
+            f"{s.name}: calls={s.calls} matches={s.matches} changes={s.changes}"
+            f" total={s.total_time * 1000:.3f}ms max={s.max_time * 1000:.3f}ms"
+            for s in stats
+        ]
+
+
+_instrumentation = _Instrumentation()
+report_at_exit(_instrumentation.report)
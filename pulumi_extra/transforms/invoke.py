@@ -6,12 +6,14 @@ registering invoke transforms per-invoke basis.
 
 from __future__ import annotations
 
-from fnmatch import fnmatch
-from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 import pulumi
-from braceexpand import braceexpand
+
+from pulumi_extra._options import OptionsOverride, contains
+from pulumi_extra._pattern import PatternMatcher
+
+from .instrumentation import instrument
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -26,6 +28,9 @@ def override_invoke(
 ) -> pulumi.InvokeTransform:
     """Pulumi transform factory for invoke tokens (`get_*`).
 
+    The transform returns `None` for invokes the override is applied to already, e.g. by a previous
+    transform, so that the engine skips the result.
+
     Args:
         *invoke_tokens: Invoke tokens to match. Supports glob patterns and brace expand.
         args: Invoke arguments to override, or a callable that returns the new arguments from given `args.args` input.
@@ -33,32 +38,39 @@ def override_invoke(
 
     """
     args_ = args
+    matches = PatternMatcher(invoke_tokens)
+    opts_override = OptionsOverride(opts) if isinstance(opts, pulumi.InvokeOptions) else None
 
     def transform(args: pulumi.InvokeTransformArgs) -> pulumi.InvokeTransformResult | None:
-        nonlocal args_, opts
-
-        for it in chain.from_iterable(map(braceexpand, invoke_tokens)):
-            if not fnmatch(args.token, it):
-                continue
+        if not matches(args.token):
+            return None
 
-            # Transform invoke arguments
-            if TYPE_CHECKING:
-                assert isinstance(args.args, dict)
+        # Transform invoke arguments
+        if TYPE_CHECKING:
+            assert isinstance(args.args, dict)
 
-            if callable(args_):  # noqa: SIM108
-                new_args = args_(args.args)
-            else:
-                new_args = args.args | args_ if args_ is not None else args.args
+        if callable(args_):
+            new_args = args_(args.args)
+        elif args_ is not None and not contains(args.args, args_):
+            new_args = args.args | args_
+        else:
+            new_args = args.args
 
-            # Transform invoke options
-            new_opts = opts(args.opts) if callable(opts) else (opts or pulumi.InvokeOptions())
-            new_opts = pulumi.InvokeOptions.merge(args.opts, new_opts)
+        # Transform invoke options
+        new_opts: pulumi.InvokeOptions | None
+        if callable(opts):
+            new_opts = pulumi.InvokeOptions.merge(args.opts, opts(args.opts))
+        elif opts_override is not None:
+            new_opts = opts_override.apply(args.opts)
+        else:
+            new_opts = None
 
-            return pulumi.InvokeTransformResult(args=new_args, opts=new_opts)
+        if new_args is args.args and new_opts is None:
+            return None
 
-        return None
+        return pulumi.InvokeTransformResult(args=new_args, opts=new_opts or args.opts)
 
-    return transform
+    return instrument(transform, f"override_invoke({', '.join(invoke_tokens)})", lambda args: matches(args.token))
 
 
 def override_invoke_defaults(*invoke_tokens: str, defaults: dict[str, Any]) -> pulumi.InvokeTransform:
@@ -71,7 +83,7 @@ def override_invoke_defaults(*invoke_tokens: str, defaults: dict[str, Any]) -> p
     """
     return override_invoke(
         *invoke_tokens,
-        args=lambda args: defaults | args,
+        args=lambda args: args if defaults.keys() <= args.keys() else defaults | args,
     )
 
 
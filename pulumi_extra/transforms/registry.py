@@ -0,0 +1,234 @@
+"""Registry multiplexing many transforms through a single runtime transform.
+
+Each transform registered at the runtime level is invoked by the engine for every resource (or invoke),
+even if it only applies to a few types. The registry registers one resource transform and one invoke
+transform, and dispatches each resource or invoke only to the transforms whose patterns match its type.
+
+Note that transforms in the registry run at the position the registry itself was first registered at,
+relative to other runtime transforms. For example, if a transform is registered at the runtime directly
+after the registry, it runs after *all* transforms of the registry, including the ones added later.
+
+The registry is tied to the Pulumi program run it was registered in: once a new run starts (e.g. another
+inline program of the Automation API, or new mocks in unit tests), the transforms of the previous run are
+dropped and the registry registers itself again with the new run on next addition.
+"""
+
+from __future__ import annotations
+
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+import pulumi
+from pulumi.runtime.settings import get_monitor
+
+from pulumi_extra._pattern import PatternMatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+_Transform = TypeVar("_Transform")
+_Args = TypeVar("_Args")
+_Result = TypeVar("_Result")
+
+
+class _Rule(NamedTuple):
+    matches: PatternMatcher
+    transform: Any
+
+
+class _RuleSet(Generic[_Transform]):
+    """Transforms indexed by the package of the patterns they match, with per-type dispatch plans."""
+
+    def __init__(self) -> None:
+        self._rules: list[_Rule] = []
+        self._by_package: dict[str | None, list[int]] = {}
+        self._plans: dict[str, tuple[_Transform, ...]] = {}
+
+    def add(self, transform: _Transform, patterns: Sequence[str]) -> None:
+        rule = _Rule(PatternMatcher(patterns or ("*",)), transform)
+        index = len(self._rules)
+        self._rules.append(rule)
+        for package in dict.fromkeys(map(_get_package, rule.matches.patterns)):
+            self._by_package.setdefault(package, []).append(index)
+
+        self._plans.clear()
+
+    def plan(self, type_: str) -> tuple[_Transform, ...]:
+        """Return the transforms to apply to given type, in registration order."""
+        try:
+            return self._plans[type_]
+        except KeyError:
+            pass
+
+        package = type_.split(":", 1)[0]
+        candidates = sorted({*self._by_package.get(package, ()), *self._by_package.get(None, ())})
+        plan: tuple[_Transform, ...] = tuple(
+            self._rules[i].transform for i in candidates if self._rules[i].matches(type_)
+        )
+        self._plans[type_] = plan
+        return plan
+
+    def clear(self) -> None:
+        self._rules.clear()
+        self._by_package.clear()
+        self._plans.clear()
+
+
+class TransformRegistry:
+    """Registry of resource and invoke transforms dispatched by type.
+
+    Transforms are registered along with the resource types (or invoke tokens) they apply to, supporting
+    glob patterns and brace expansion. Matching transforms are applied in registration order, each one
+    receiving the props (or args) and options returned by the previous one.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._resource_rules: _RuleSet[pulumi.ResourceTransform] = _RuleSet()
+        self._invoke_rules: _RuleSet[pulumi.InvokeTransform] = _RuleSet()
+        self._resource_transform_registered = False
+        self._invoke_transform_registered = False
+        self._monitor: object = None
+
+    def add_resource_transform(self, transform: pulumi.ResourceTransform, *resource_types: str) -> None:
+        """Add a transform for resources of given types.
+
+        The registry registers its resource transform to the runtime on first call of each program run.
+
+        Args:
+            transform: Resource transform to add.
+            *resource_types: Resource types to match. Supports glob patterns and brace expand.
+                Matches all resources if omitted.
+
+        """
+        self._track_run()
+        self._resource_rules.add(transform, resource_types)
+        if not self._resource_transform_registered:
+            pulumi.runtime.register_resource_transform(self.transform_resource)
+            self._resource_transform_registered = True
+
+    def add_invoke_transform(self, transform: pulumi.InvokeTransform, *invoke_tokens: str) -> None:
+        """Add a transform for invokes of given tokens.
+
+        The registry registers its invoke transform to the runtime on first call of each program run.
+
+        Args:
+            transform: Invoke transform to add.
+            *invoke_tokens: Invoke tokens to match. Supports glob patterns and brace expand.
+                Matches all invokes if omitted.
+
+        """
+        self._track_run()
+        self._invoke_rules.add(transform, invoke_tokens)
+        if not self._invoke_transform_registered:
+            pulumi.runtime.register_invoke_transform(self.transform_invoke)
+            self._invoke_transform_registered = True
+
+    def transform_resource(
+        self,
+        args: pulumi.ResourceTransformArgs,
+    ) -> pulumi.ResourceTransformResult | Awaitable[pulumi.ResourceTransformResult | None] | None:
+        """Apply the transforms matching given resource."""
+        return _apply(self._resource_rules.plan(args.type_), args, _next_resource_args)
+
+    def transform_invoke(
+        self,
+        args: pulumi.InvokeTransformArgs,
+    ) -> pulumi.InvokeTransformResult | Awaitable[pulumi.InvokeTransformResult | None] | None:
+        """Apply the transforms matching given invoke."""
+        return _apply(self._invoke_rules.plan(args.token), args, _next_invoke_args)
+
+    def reset(self) -> None:
+        """Remove all transforms and forget runtime registration, e.g. between tests."""
+        self._resource_rules.clear()
+        self._invoke_rules.clear()
+        self._resource_transform_registered = False
+        self._invoke_transform_registered = False
+        self._monitor = None
+
+    def _track_run(self) -> None:
+        """Reset the registry if a new program run started since the last addition.
+
+        Runs are told apart by the resource monitor, which is replaced by the runtime settings of each run
+        (and by `pulumi.runtime.set_mocks`) along with the callback server transforms are registered to.
+        """
+        monitor = get_monitor()
+        if monitor is not self._monitor:
+            self.reset()
+            self._monitor = monitor
+
+
+def _get_package(pattern: str) -> str | None:
+    """Return the package a pattern is restricted to, or `None` if it may match any package."""
+    package, sep, _ = pattern.partition(":")
+    if not sep or any(c in package for c in "*?["):
+        return None
+
+    return package
+
+
+def _next_resource_args(
+    args: pulumi.ResourceTransformArgs,
+    result: pulumi.ResourceTransformResult,
+) -> pulumi.ResourceTransformArgs:
+    return pulumi.ResourceTransformArgs(
+        custom=args.custom,
+        type_=args.type_,
+        name=args.name,
+        props=result.props,
+        opts=result.opts,
+    )
+
+
+def _next_invoke_args(
+    args: pulumi.InvokeTransformArgs,
+    result: pulumi.InvokeTransformResult,
+) -> pulumi.InvokeTransformArgs:
+    return pulumi.InvokeTransformArgs(token=args.token, args=result.args, opts=result.opts)
+
+
+def _apply(
+    transforms: Sequence[Callable[[_Args], Any]],
+    args: _Args,
+    next_args: Callable[[_Args, _Result], _Args],
+    result: _Result | None = None,
+) -> _Result | Awaitable[_Result | None] | None:
+    """Apply transforms in order, switching to asynchronous application once a transform returns an awaitable."""
+    for i, transform in enumerate(transforms):
+        new_result = transform(args)
+        if isawaitable(new_result):
+            return _apply_async(new_result, transforms[i + 1 :], args, next_args, result)
+
+        if new_result is not None:
+            result = new_result
+            args = next_args(args, new_result)
+
+    return result
+
+
+async def _apply_async(
+    pending: Awaitable[_Result | None],
+    transforms: Sequence[Callable[[_Args], Any]],
+    args: _Args,
+    next_args: Callable[[_Args, _Result], _Args],
+    result: _Result | None,
+) -> _Result | None:
+    new_result = await pending
+    if new_result is not None:
+        result = new_result
+        args = next_args(args, new_result)
+
+    for transform in transforms:
+        new_result = transform(args)
+        if isawaitable(new_result):
+            new_result = await new_result
+
+        if new_result is not None:
+            result = new_result
+            args = next_args(args, new_result)
+
+    return result
+
+
+transform_registry = TransformRegistry()
+"""Default transform registry, used by `override_default_provider` and the contrib auto-tagging/labeling."""
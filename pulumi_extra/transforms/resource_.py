@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from fnmatch import fnmatch
-from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 import pulumi
-from braceexpand import braceexpand
+
+from pulumi_extra._options import OptionsOverride, contains
+from pulumi_extra._pattern import PatternMatcher
+
+from .instrumentation import instrument
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -22,38 +24,48 @@ def override_resource(
 ) -> pulumi.ResourceTransform:
     """Pulumi transform factory for resources.
 
+    The transform returns `None` for resources the override is applied to already, e.g. by a previous
+    transform, so that the engine skips the result.
+
     Args:
         *resource_types: Resource types to match. Supports glob patterns and brace expand.
         props: Resource properties to override, or a callable that returns the new properties from given `args.props` input.
         opts: Resource options to override, or a callable that returns the new options given `args.opts` input.
 
     """  # noqa: E501
+    matches = PatternMatcher(resource_types)
+    opts_override = OptionsOverride(opts) if isinstance(opts, pulumi.ResourceOptions) else None
 
     def transform(args: pulumi.ResourceTransformArgs) -> pulumi.ResourceTransformResult | None:
-        nonlocal props, opts
-
-        for rt in chain.from_iterable(map(braceexpand, resource_types)):
-            if not fnmatch(args.type_, rt):
-                continue
+        if not matches(args.type_):
+            return None
 
-            # Transform resource properties
-            if TYPE_CHECKING:
-                assert isinstance(args.props, dict)
+        # Transform resource properties
+        if TYPE_CHECKING:
+            assert isinstance(args.props, dict)
 
-            if callable(props):
-                new_props = props(args.props)
-            else:
-                new_props = args.props | props if props is not None else args.props
+        if callable(props):
+            new_props = props(args.props)
+        elif props is not None and not contains(args.props, props):
+            new_props = args.props | props
+        else:
+            new_props = args.props
 
-            # Transform resource options
-            new_opts = opts(args.opts) if callable(opts) else (opts or pulumi.ResourceOptions())
-            new_opts = pulumi.ResourceOptions.merge(args.opts, new_opts)
+        # Transform resource options
+        new_opts: pulumi.ResourceOptions | None
+        if callable(opts):
+            new_opts = pulumi.ResourceOptions.merge(args.opts, opts(args.opts))
+        elif opts_override is not None:
+            new_opts = opts_override.apply(args.opts)
+        else:
+            new_opts = None
 
-            return pulumi.ResourceTransformResult(props=new_props, opts=new_opts)
+        if new_props is args.props and new_opts is None:
+            return None
 
-        return None
+        return pulumi.ResourceTransformResult(props=new_props, opts=new_opts or args.opts)
 
-    return transform
+    return instrument(transform, f"override_resource({', '.join(resource_types)})", lambda args: matches(args.type_))
 
 
 def override_resource_defaults(
@@ -69,7 +81,7 @@ def override_resource_defaults(
     """
     return override_resource(
         *resource_types,
-        props=lambda props: defaults | props,
+        props=lambda props: props if defaults.keys() <= props.keys() else defaults | props,
     )
 
 
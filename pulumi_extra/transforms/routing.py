@@ -0,0 +1,211 @@
+"""Routing of resources and invokes to providers.
+
+A routing table maps resource types (or invoke tokens), optionally along with prefixes of resource names and
+of parent names, to providers. However many routes it holds, it adds a single resource transform and a
+single invoke transform to the transform registry, which find the provider of each resource with a fixed
+number of dictionary lookups rather than matching every route in turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import NamedTuple
+
+import pulumi
+from pulumi.runtime.settings import get_monitor
+
+from pulumi_extra._options import OptionsOverride
+from pulumi_extra._pattern import PatternMatcher
+
+from .instrumentation import instrument
+from .registry import TransformRegistry, transform_registry
+
+_Key = tuple[str, str]
+"""Prefixes of the resource name and of the parent name."""
+
+_Plan = dict[tuple[int, int], dict[_Key, int]]
+"""Indexes of the routes matching a type, by their key, by lengths of the prefixes of their key."""
+
+
+class _Route(NamedTuple):
+    key: _Key
+    provider: pulumi.ProviderResource
+    resource_opts: OptionsOverride[pulumi.ResourceOptions]
+    invoke_opts: OptionsOverride[pulumi.InvokeOptions]
+
+
+class ProviderRoutingTable:
+    """Table of routes from resource types and invoke tokens to providers.
+
+    Routes are matched on the type of resources (or token of invokes), and optionally on prefixes of the
+    resource name and of the parent name. If several routes match, the route added last wins, so that more
+    specific routes are added after more general ones, e.g. a route for all AWS resource types first, then
+    routes for resources of a given name prefix.
+    """
+
+    def __init__(self, registry: TransformRegistry | None = None) -> None:
+        """Create an empty routing table.
+
+        Args:
+            registry: Transform registry to add the transforms of the table to. Defaults to the default
+                transform registry.
+
+        """
+        self._registry = registry if registry is not None else transform_registry
+        self._routes: list[_Route] = []
+        self._groups: dict[tuple[str, ...], tuple[PatternMatcher, list[int]]] = {}
+        """Indexes of the routes by the patterns they match, so that routes of same patterns match at once."""
+
+        self._plans: dict[str, _Plan] = {}
+        self._plans_by_groups: dict[tuple[tuple[str, ...], ...], _Plan] = {}
+        self._registered = False
+        self._monitor: object = None
+
+    def add_route(
+        self,
+        *rt_or_it: str,
+        provider: pulumi.ProviderResource,
+        name_prefix: str = "",
+        parent_prefix: str = "",
+    ) -> None:
+        """Route resources and invokes of given types to given provider.
+
+        The table adds its transforms to the registry on first call of each program run.
+
+        Args:
+            *rt_or_it: Resource types or invoke tokens to match. Supports glob patterns and brace expand.
+                Matches all resources and invokes if omitted.
+            provider: Provider to route to.
+            name_prefix: Prefix of the names of resources to match. Invokes have no name, so routes with
+                a name prefix only apply to resources.
+            parent_prefix: Prefix of the names of parents of resources (or invokes) to match. Names are taken
+                from the URN of parents, as passed to transforms by the engine.
+
+        """
+        self._track_run()
+        patterns = rt_or_it or ("*",)
+        if patterns not in self._groups:
+            self._groups[patterns] = (PatternMatcher(patterns), [])
+
+        self._groups[patterns][1].append(len(self._routes))
+        self._routes.append(
+            _Route(
+                (name_prefix, parent_prefix),
+                provider,
+                OptionsOverride(pulumi.ResourceOptions(provider=provider)),
+                OptionsOverride(pulumi.InvokeOptions(provider=provider)),
+            ),
+        )
+        self._plans.clear()
+        self._plans_by_groups.clear()
+        if not self._registered:
+            self._registry.add_resource_transform(
+                instrument(
+                    self.route_resource,
+                    "provider_routing_table",
+                    lambda args: self._lookup(args.type_, args.name, args.opts.parent) is not None,
+                ),
+            )
+            self._registry.add_invoke_transform(
+                instrument(
+                    self.route_invoke,
+                    "provider_routing_table",
+                    lambda args: self._lookup(args.token, "", args.opts.parent) is not None,
+                ),
+            )
+            self._registered = True
+
+    def get_provider(
+        self,
+        type_: str,
+        name: str = "",
+        parent: pulumi.Resource | None = None,
+    ) -> pulumi.ProviderResource | None:
+        """Return the provider of given resource type (or invoke token), name and parent, if routed."""
+        route = self._lookup(type_, name, parent)
+        return route.provider if route is not None else None
+
+    def route_resource(self, args: pulumi.ResourceTransformArgs) -> pulumi.ResourceTransformResult | None:
+        """Set the provider of given resource, if routed and not set to it already."""
+        route = self._lookup(args.type_, args.name, args.opts.parent)
+        new_opts = route.resource_opts.apply(args.opts) if route is not None else None
+        if new_opts is None:
+            return None
+
+        return pulumi.ResourceTransformResult(props=args.props, opts=new_opts)
+
+    def route_invoke(self, args: pulumi.InvokeTransformArgs) -> pulumi.InvokeTransformResult | None:
+        """Set the provider of given invoke, if routed and not set to it already."""
+        route = self._lookup(args.token, "", args.opts.parent)
+        new_opts = route.invoke_opts.apply(args.opts) if route is not None else None
+        if new_opts is None:
+            return None
+
+        return pulumi.InvokeTransformResult(args=args.args, opts=new_opts)
+
+    def reset(self) -> None:
+        """Remove all routes and forget registration, e.g. between tests."""
+        self._routes.clear()
+        self._groups.clear()
+        self._plans.clear()
+        self._plans_by_groups.clear()
+        self._registered = False
+        self._monitor = None
+
+    def _lookup(self, type_: str, name: str, parent: pulumi.Resource | None) -> _Route | None:
+        try:
+            plan = self._plans[type_]
+        except KeyError:
+            plan = self._plans[type_] = self._make_plan(type_)
+
+        parent_name = _get_resource_name(parent) if parent is not None else ""
+        best = -1
+        for (name_length, parent_length), routes in plan.items():
+            index = routes.get((name[:name_length], parent_name[:parent_length]), -1)
+            best = max(best, index)
+
+        return self._routes[best] if best >= 0 else None
+
+    def _make_plan(self, type_: str) -> _Plan:
+        """Return the plan of given type, shared by all types matching the same groups of routes."""
+        groups = tuple(patterns for patterns, (matches, _) in self._groups.items() if matches(type_))
+        try:
+            return self._plans_by_groups[groups]
+        except KeyError:
+            pass
+
+        plan: _Plan = {}
+        for index in sorted(i for patterns in groups for i in self._groups[patterns][1]):
+            name_prefix, parent_prefix = key = self._routes[index].key
+            plan.setdefault((len(name_prefix), len(parent_prefix)), {})[key] = index
+
+        self._plans_by_groups[groups] = plan
+        return plan
+
+    def _track_run(self) -> None:
+        """Reset the table if a new program run started since the last addition, as the registry does."""
+        monitor = get_monitor()
+        if monitor is not self._monitor:
+            self.reset()
+            self._monitor = monitor
+
+
+def _get_resource_name(resource: pulumi.Resource) -> str:
+    """Return the name of given resource, from its URN if known already.
+
+    The engine passes the parent to transforms as a `DependencyResource` built from its URN, which has no
+    name of its own. Other resources fall back to their name, as long as their URN is not known yet.
+    """
+    # Outputs offer no synchronous access to known values
+    data = getattr(resource.urn, "_data", None)
+    if isinstance(data, asyncio.Future) and data.done() and not data.cancelled() and data.exception() is None:
+        urn = data.result().value
+        if isinstance(urn, str):
+            return urn.rpartition("::")[2]
+
+    name: str = getattr(resource, "_name", "")
+    return name
+
+
+provider_routing_table = ProviderRoutingTable()
+"""Default provider routing table, used by `override_default_provider`."""
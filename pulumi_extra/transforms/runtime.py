@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import pulumi
+from typing import TYPE_CHECKING
 
-from .invoke import override_invoke_options
-from .resource_ import override_resource_options
+from .routing import provider_routing_table
+
+if TYPE_CHECKING:
+    import pulumi
 
 
 def override_default_provider(
@@ -14,10 +16,15 @@ def override_default_provider(
 ) -> None:
     """Override the default provider for resources and invokes of given types.
 
+    Routes are added to the default provider routing table, whose transforms are added to the default
+    transform registry rather than registered at the runtime one by one. As such, they run at the position
+    the registry was first registered at relative to transforms registered with
+    `pulumi.runtime.register_resource_transform` / `register_invoke_transform` directly, rather than at the
+    position of this call. If several calls match a resource or invoke, the last one wins.
+
     Args:
         *rt_or_it: Resource types or invoke tokens to match.
         provider: Provider to override.
 
     """
-    pulumi.runtime.register_resource_transform(override_resource_options(*rt_or_it, provider=provider))
-    pulumi.runtime.register_invoke_transform(override_invoke_options(*rt_or_it, provider=provider))
+    provider_routing_table.add_route(*rt_or_it, provider=provider)
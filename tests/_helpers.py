@@ -1,7 +1,100 @@
-from typing import Any
+from __future__ import annotations
 
-from pulumi import automation
+from textwrap import dedent
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    import pulumi_policy as policy
+    from pulumi import automation
 
 
 def resolve_output_values(outputs: automation.OutputMap) -> dict[str, Any]:
     return {k: v.value for k, v in outputs.items()}
+
+
+def resource_urn(resource_type: str, name: str = "resource") -> str:
+    return f"urn:pulumi:stack::project::{resource_type}::{name}"
+
+
+def policy_resource(resource_type: str, name: str, props: Mapping[str, Any]) -> policy.PolicyResource:
+    import pulumi_policy as policy  # noqa: PLC0415 ; Optional dependency
+
+    return policy.PolicyResource(
+        resource_type=resource_type,
+        props=props,
+        urn=resource_urn(resource_type, name),
+        name=name,
+        opts=mock.Mock(),
+        provider=None,
+        parent=None,
+        dependencies=[],
+        property_dependencies={},
+    )
+
+
+def policy_args(
+    resource_type: str,
+    props: Mapping[str, Any],
+    config: Mapping[str, Any],
+    name: str = "resource",
+    opts: policy.PolicyResourceOptions | None = None,
+) -> policy.ResourceValidationArgs:
+    import pulumi_policy as policy  # noqa: PLC0415 ; Optional dependency
+
+    return policy.ResourceValidationArgs(
+        resource_type=resource_type,
+        props=props,
+        urn=resource_urn(resource_type, name),
+        name=name,
+        opts=opts if opts is not None else mock.Mock(),
+        provider=None,
+        config=dict(config),  # Policies get a fresh copy of their config for every resource
+    )
+
+
+def write_stub_provider(directory: Path, package: str, resources: Mapping[str, Sequence[str]]) -> None:
+    """Write a stub provider SDK in given directory, laid out like generated ones.
+
+    The package registers its resource modules on import, while resource classes live in submodules that
+    are only imported on demand.
+    """
+    root = directory / f"pulumi_{package}"
+    root.mkdir()
+    init = ["import pulumi", "", _STUB_RESOURCE_MODULE]
+    modules: dict[str, list[str]] = {}
+    for type_, attributes in resources.items():
+        key, _, class_name = type_.rpartition(":")
+        mod = key.partition(":")[2].partition("/")[0]
+        fqn = f"pulumi_{package}.{mod}"
+        init.append(
+            f"pulumi.runtime.register_resource_module({package!r}, {key.partition(':')[2]!r}, "
+            f"_Module({fqn!r}, {{{type_!r}: {class_name!r}}}))"
+        )
+        params = ", ".join(f"{attribute}=None" for attribute in attributes)
+        modules.setdefault(mod, ["import pulumi"]).append(
+            f"class {class_name}(pulumi.CustomResource):\n"
+            f"    def _internal_init(__self__, resource_name, opts=None, {params}): ...",
+        )
+
+    (root / "__init__.py").write_text("\n".join(init) + "\n")
+    for mod, lines in modules.items():
+        (root / f"{mod}.py").write_text("\n\n".join(lines) + "\n")
+
+
+_STUB_RESOURCE_MODULE = dedent(
+    """
+    class _Module(pulumi.runtime.ResourceModule):
+        def __init__(self, fqn, classes):
+            self.mod_info = {"fqn": fqn, "classes": classes}
+
+        def version(self):
+            return None
+
+        def construct(self, name, typ, urn):
+            raise NotImplementedError
+    """,
+)
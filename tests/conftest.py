@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pulumi
 import pytest
-
-from pulumi_extra import get_resource_cls, get_stack_reference, resource_has_attribute
+from pulumi.runtime.rpc import _RESOURCE_MODULES
+from pulumi.runtime.settings import set_root_resource
+
+from pulumi_extra._log import log_once
+from pulumi_extra.output import _ENVIRONMENT
+from pulumi_extra.resource_ import _attribute_cache
+from pulumi_extra.schema import _SCHEMA_INDEX
+from pulumi_extra.stack_reference import _stack_output_snapshot
+from pulumi_extra.testing import reset_caches
+from pulumi_extra.transforms.instrumentation import _instrumentation
+from tests._helpers import write_stub_provider
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+    from pathlib import Path
 
 
 class ResourceMocks(pulumi.runtime.Mocks):
@@ -34,6 +45,9 @@ def set_event_loop() -> Iterator[asyncio.AbstractEventLoop]:
         loop = asyncio.new_event_loop()
 
     asyncio.set_event_loop(loop)
+
+    # Root stack resource is bound to the event loop it was created in, make mocks recreate it
+    set_root_resource(None)  # type: ignore[arg-type]
     yield loop
     loop.close()
 
@@ -55,6 +69,27 @@ def pulumi_organization() -> Iterator[None]:
 @pytest.fixture(autouse=True)
 def reset_cache() -> None:
     """Reset cache for each test."""
-    resource_has_attribute.cache_clear()
-    get_resource_cls.cache_clear()
-    get_stack_reference.cache_clear()
+    reset_caches()
+    _attribute_cache.disable()
+    _SCHEMA_INDEX.clear()
+    _stack_output_snapshot.disable()
+    log_once.reset()
+    _instrumentation.disable()
+    _ENVIRONMENT.bytecode_cache = None
+    if _ENVIRONMENT.cache is not None:
+        _ENVIRONMENT.cache.clear()
+
+
+@pytest.fixture
+def stub_provider(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[..., None]]:
+    """Create stub provider SDKs on `sys.path`, as `write_stub_provider` does.
+
+    Imported modules and registered resource modules are dropped afterwards.
+    """
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def create(package: str, resources: Mapping[str, Sequence[str]]) -> None:
+        write_stub_provider(tmp_path, package, resources)
+
+    with mock.patch.dict(sys.modules), mock.patch.dict(_RESOURCE_MODULES):
+        yield create
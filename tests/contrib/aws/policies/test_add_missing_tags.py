@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pulumi_policy as policy
+
+from pulumi_extra.contrib.aws.policies.add_missing_tags import AddMissingTags, add_missing_tags
+from pulumi_extra.schema import _SCHEMA_INDEX
+from tests._helpers import policy_args
+
+
+class Test__AddMissingTags:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        _SCHEMA_INDEX["aws:iam/rolePolicy:RolePolicy"] = frozenset({"policy", "role"})
+        config = {"extra-tags": {"Team": "platform"}, "exclude": ["aws:ec2/*"]}
+        remediate = AddMissingTags()
+
+        # Act
+        result = remediate(policy_args("aws:s3/bucket:Bucket", {"bucket": "b", "tags": {"Team": "data"}}, config))
+        excluded = remediate(policy_args("aws:ec2/instance:Instance", {}, config))
+        not_taggable = remediate(policy_args("aws:iam/rolePolicy:RolePolicy", {}, config))
+
+        # Assert
+        assert result == {
+            "bucket": "b",
+            "tags": {
+                "pulumi:Organization": "organization",
+                "pulumi:Project": "project",
+                "pulumi:Stack": "stack",
+                "Managed-By": "Pulumi",
+                "Team": "data",
+            },
+        }
+        assert excluded is None
+        assert not_taggable is None
+
+    def test_nothing_missing(self) -> None:
+        """Resources are left untouched if they have all the tags already."""
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        config = {"no-default-tags": True, "extra-tags": {"Team": "platform"}}
+        remediate = AddMissingTags()
+
+        # Act
+        result = remediate(policy_args("aws:s3/bucket:Bucket", {"tags": {"Team": "data", "Name": "b"}}, config))
+
+        # Assert
+        assert result is None
+
+    def test_enforcement_level(self) -> None:
+        """Remediations only run at the remediate enforcement level, so the policy defaults to it."""
+        # Act & Assert
+        assert add_missing_tags.enforcement_level == policy.EnforcementLevel.REMEDIATE
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from pulumi_extra.contrib.aws.policies.governance import Governance
+from pulumi_extra.schema import _SCHEMA_INDEX
+from tests._helpers import policy_args, resource_urn
+
+
+class Test__Governance:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        _SCHEMA_INDEX["aws:ec2/securityGroup:SecurityGroup"] = frozenset({"description", "name", "tags"})
+        _SCHEMA_INDEX["aws:iam/rolePolicy:RolePolicy"] = frozenset({"policy", "role"})
+        config = {
+            "required-tags": ["Team", "Environment"],
+            "allowed-values": {"Environment": "dev|prod"},
+        }
+        validate = Governance()
+        report_violation = mock.Mock()
+
+        # Act
+        validate(
+            policy_args("aws:s3/bucket:Bucket", {"tags": {"Team": "a", "Environment": "prod"}}, config),
+            report_violation,
+        )
+        validate(policy_args("aws:s3/bucket:Bucket", {"tags": {"Environment": "production"}}, config), report_violation)
+        validate(
+            policy_args("aws:ec2/securityGroup:SecurityGroup", {"tags": {"Team": "a", "Environment": "dev"}}, config),
+            report_violation,
+        )
+        validate(policy_args("aws:iam/rolePolicy:RolePolicy", {}, config), report_violation)
+
+        # Assert
+        bucket_urn = resource_urn("aws:s3/bucket:Bucket")
+        assert report_violation.call_args_list == [
+            mock.call(f"Resource '{bucket_urn}' is missing required tag 'Team'", None),
+            mock.call(f"Resource '{bucket_urn}' has tag 'Environment' with disallowed value 'production'", None),
+            mock.call(
+                f"Resource '{resource_urn('aws:ec2/securityGroup:SecurityGroup')}' is missing required description",
+                None,
+            ),
+        ]
+
+    def test_description_tag(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        config = {"require-tag-if-description-unsupported": True}
+        validate = Governance()
+        report_violation = mock.Mock()
+
+        # Act
+        validate(policy_args("aws:s3/bucket:Bucket", {"tags": {"Description": "Logs"}}, config), report_violation)
+        validate(policy_args("aws:s3/bucket:Bucket", {}, config), report_violation)
+
+        # Assert
+        report_violation.assert_called_once_with(
+            f"Resource '{resource_urn('aws:s3/bucket:Bucket')}' is missing required tag 'Description'",
+            None,
+        )
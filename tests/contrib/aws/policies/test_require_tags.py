@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sys
+from unittest import mock
+
+import pulumi_policy as policy
+
+from pulumi_extra.contrib.aws.policies.require_tags import RequireTags
+from pulumi_extra.schema import _SCHEMA_INDEX
+from tests._helpers import policy_args, policy_resource, resource_urn
+
+
+class Test__RequireTags:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        _SCHEMA_INDEX["aws:iam/rolePolicy:RolePolicy"] = frozenset({"policy", "role"})
+        config = {"required-tags": ["Team", "Environment"], "exclude": ["aws:ec2/*"]}
+        validate = RequireTags()
+        report_violation = mock.Mock()
+
+        # Act
+        validate(policy_args("aws:s3/bucket:Bucket", {"tags": {"Team": "platform"}}, config), report_violation)
+        validate(
+            policy_args("aws:s3/bucket:Bucket", {"tags": {"Team": "a", "Environment": "b"}}, config),
+            report_violation,
+        )
+        validate(policy_args("aws:ec2/instance:Instance", {}, config), report_violation)
+        validate(policy_args("aws:iam/rolePolicy:RolePolicy", {}, config), report_violation)
+        validate(policy_args("gcp:storage/bucket:Bucket", {}, config), report_violation)
+
+        # Assert
+        report_violation.assert_called_once_with(
+            f"Resource '{resource_urn('aws:s3/bucket:Bucket')}' is missing required tag 'Environment'",
+            None,
+        )
+
+    def test_config_loaded_once(self) -> None:
+        """Config is loaded again only when it changes."""
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        report_violation = mock.Mock()
+
+        # Act
+        with mock.patch.object(RequireTags, "_load_config", autospec=True, side_effect=RequireTags._load_config) as m:
+            validate = RequireTags()
+            for _ in range(3):
+                validate(policy_args("aws:s3/bucket:Bucket", {}, {"required-tags": ["Team"]}), report_violation)
+
+            validate(policy_args("aws:s3/bucket:Bucket", {}, {"required-tags": ["Owner"]}), report_violation)
+
+        # Assert
+        assert m.call_count == 2
+        assert report_violation.call_count == 4
+
+    def test_plan_computed_once_per_type(self) -> None:
+        """Resource type checks run once per type, resources are checked from their props only."""
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        config = {"required-tags": ["Team"]}
+        report_violation = mock.Mock()
+
+        # Act
+        module = sys.modules[RequireTags.__module__]
+        with mock.patch.object(module, "is_taggable", autospec=True, return_value=True) as m:
+            validate = RequireTags()
+            for i in range(5):
+                validate(
+                    policy_args("aws:s3/bucket:Bucket", {"tags": {"Team": str(i)} if i % 2 else None}, config),
+                    report_violation,
+                )
+
+        # Assert
+        m.assert_called_once_with("aws:s3/bucket:Bucket")
+        assert report_violation.call_count == 3
+
+
+class Test__RequireTags__validate_stack:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        _SCHEMA_INDEX["aws:iam/rolePolicy:RolePolicy"] = frozenset({"policy", "role"})
+        resources = [
+            policy_resource("aws:s3/bucket:Bucket", "a", {"tags": {"Team": "platform"}}),
+            policy_resource("aws:s3/bucket:Bucket", "b", {}),
+            policy_resource("aws:iam/rolePolicy:RolePolicy", "c", {}),
+            policy_resource("aws:s3/bucket:Bucket", "d", {"tags": None}),
+        ]
+        args = policy.StackValidationArgs(resources=resources, config={"required-tags": ["Team"]})
+        report_violation = mock.Mock()
+
+        # Act
+        RequireTags().validate_stack(args, report_violation)
+
+        # Assert
+        assert report_violation.call_args_list == [
+            mock.call(f"Resource '{r.urn}' is missing required tag '{'Team'}'", r.urn)
+            for r in (resources[1], resources[3])
+        ]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import sys
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pulumi
+import pytest
+
+from pulumi_extra.contrib.aws import is_taggable, register_auto_tagging
+from pulumi_extra.schema import _SCHEMA_INDEX
+from pulumi_extra.transforms import transform_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _resource_args(type_: str, props: dict[str, Any]) -> pulumi.ResourceTransformArgs:
+    return pulumi.ResourceTransformArgs(
+        custom=True,
+        type_=type_,
+        name="resource",
+        props=props,
+        opts=pulumi.ResourceOptions(),
+    )
+
+
+class Test__register_auto_tagging:
+    @pulumi.runtime.test
+    def test(self) -> None:
+        """Tags are applied through the default transform registry."""
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+
+        # Act
+        with mock.patch("pulumi.runtime.register_resource_transform") as m:
+            register_auto_tagging(extra={"Team": "platform"})
+
+        result = transform_registry.transform_resource(
+            _resource_args("aws:s3/bucket:Bucket", {"tags": {"Name": "bucket"}}),
+        )
+
+        # Assert
+        m.assert_called_once_with(transform_registry.transform_resource)
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.props["tags"] == {
+            "pulumi:Organization": "organization",
+            "pulumi:Project": "project",
+            "pulumi:Stack": "stack",
+            "Managed-By": "Pulumi",
+            "Team": "platform",
+            "Name": "bucket",
+        }
+
+    @pulumi.runtime.test
+    def test_not_dispatched(self) -> None:
+        """Non-AWS resources are not dispatched to the auto-tagging transform at all."""
+        # Arrange
+        with mock.patch("pulumi.runtime.register_resource_transform"):
+            register_auto_tagging()
+
+        # Act
+        with mock.patch("pulumi_extra.contrib.aws.autotag.is_taggable") as m:
+            result = transform_registry.transform_resource(_resource_args("gcp:storage/bucket:Bucket", {}))
+
+        # Assert
+        assert result is None
+        m.assert_not_called()
+
+
+@pytest.mark.skipif(find_spec("pulumi_aws") is not None, reason="Stub would shadow the installed AWS provider SDK")
+class Test__is_taggable:
+    def test_import_provider_module_lazily(self, stub_provider: Callable[..., None]) -> None:
+        """AWS provider SDK is not imported by the contrib module, only the module owning the type on demand."""
+        # Arrange
+        stub_provider(
+            "aws",
+            {
+                "aws:s3/bucket:Bucket": ["bucket", "tags"],
+                "aws:iam/rolePolicy:RolePolicy": ["policy", "role"],
+            },
+        )
+        assert "pulumi_aws" not in sys.modules
+
+        # Act & Assert
+        assert is_taggable("aws:s3/bucket:Bucket") is True
+        assert "pulumi_aws.s3" in sys.modules
+        assert "pulumi_aws.iam" not in sys.modules
+        assert is_taggable("aws:iam/rolePolicy:RolePolicy") is False
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pulumi_policy as policy
+
+from pulumi_extra.contrib.gcp.policies.add_missing_labels import AddMissingLabels, add_missing_labels
+from pulumi_extra.schema import _SCHEMA_INDEX
+from tests._helpers import policy_args
+
+
+class Test__AddMissingLabels:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["gcp:storage/bucket:Bucket"] = frozenset({"name", "labels"})
+        remediate = AddMissingLabels()
+
+        # Act
+        result = remediate(policy_args("gcp:storage/bucket:Bucket", {"name": "b", "labels": None}, {}))
+        not_gcp = remediate(policy_args("aws:s3/bucket:Bucket", {}, {}))
+
+        # Assert
+        assert result == {
+            "name": "b",
+            "labels": {
+                "pulumi-organization": "organization",
+                "pulumi-project": "project",
+                "pulumi-stack": "stack",
+                "managed-by": "pulumi",
+            },
+        }
+        assert not_gcp is None
+
+    def test_enforcement_level(self) -> None:
+        """Remediations only run at the remediate enforcement level, so the policy defaults to it."""
+        # Act & Assert
+        assert add_missing_labels.enforcement_level == policy.EnforcementLevel.REMEDIATE
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from pulumi_extra.contrib.gcp.policies.governance import Governance
+from pulumi_extra.schema import _SCHEMA_INDEX
+from tests._helpers import policy_args, resource_urn
+
+
+class Test__Governance:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["gcp:storage/bucket:Bucket"] = frozenset({"name", "labels"})
+        config = {
+            "required-labels": ["team"],
+            "allowed-values": {"env": "dev|prod"},
+            "exclude": ["gcp:sql/*"],
+        }
+        validate = Governance()
+        report_violation = mock.Mock()
+
+        # Act
+        validate(
+            policy_args("gcp:storage/bucket:Bucket", {"labels": {"team": "a", "env": "dev"}}, config),
+            report_violation,
+        )
+        validate(policy_args("gcp:storage/bucket:Bucket", {"labels": {"env": "devel"}}, config), report_violation)
+        validate(policy_args("gcp:sql/databaseInstance:DatabaseInstance", {}, config), report_violation)
+
+        # Assert
+        assert report_violation.call_args_list == [
+            mock.call(f"Resource '{resource_urn('gcp:storage/bucket:Bucket')}' is missing required label 'team'", None),
+            mock.call(
+                f"Resource '{resource_urn('gcp:storage/bucket:Bucket')}' has label 'env' with disallowed value 'devel'",
+                None,
+            ),
+        ]
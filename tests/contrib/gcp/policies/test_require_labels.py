@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pulumi_policy as policy
+
+from pulumi_extra.contrib.gcp.policies.require_labels import RequireLabels
+from pulumi_extra.schema import _SCHEMA_INDEX
+from tests._helpers import policy_args, policy_resource, resource_urn
+
+
+class Test__RequireLabels:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["gcp:storage/bucket:Bucket"] = frozenset({"name", "labels"})
+        config = {"required-labels": ["team"], "exclude": ["gcp:{compute,sql}/*"]}
+        validate = RequireLabels()
+        report_violation = mock.Mock()
+
+        # Act
+        validate(policy_args("gcp:storage/bucket:Bucket", {"labels": {"team": "platform"}}, config), report_violation)
+        validate(policy_args("gcp:storage/bucket:Bucket", {}, config), report_violation)
+        validate(policy_args("gcp:sql/databaseInstance:DatabaseInstance", {}, config), report_violation)
+        validate(policy_args("aws:s3/bucket:Bucket", {}, config), report_violation)
+
+        # Assert
+        report_violation.assert_called_once_with(
+            f"Resource '{resource_urn('gcp:storage/bucket:Bucket')}' is missing required label 'team'",
+            None,
+        )
+
+
+class Test__RequireLabels__validate_stack:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["gcp:storage/bucket:Bucket"] = frozenset({"name", "labels"})
+        resources = [
+            policy_resource("gcp:storage/bucket:Bucket", "a", {"labels": {"team": "platform"}}),
+            policy_resource("gcp:storage/bucket:Bucket", "b", {}),
+            policy_resource("aws:s3/bucket:Bucket", "c", {}),
+            policy_resource("gcp:storage/bucket:Bucket", "d", {"labels": None}),
+        ]
+        args = policy.StackValidationArgs(resources=resources, config={"required-labels": ["team"]})
+        report_violation = mock.Mock()
+
+        # Act
+        RequireLabels().validate_stack(args, report_violation)
+
+        # Assert
+        assert report_violation.call_args_list == [
+            mock.call(f"Resource '{r.urn}' is missing required label '{'team'}'", r.urn)
+            for r in (resources[1], resources[3])
+        ]
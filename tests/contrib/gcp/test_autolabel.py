@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
+import pulumi
+
+from pulumi_extra.contrib.gcp import register_auto_labeling
+from pulumi_extra.schema import _SCHEMA_INDEX
+from pulumi_extra.transforms import transform_registry
+
+
+def _resource_args(type_: str, props: dict[str, Any]) -> pulumi.ResourceTransformArgs:
+    return pulumi.ResourceTransformArgs(
+        custom=True,
+        type_=type_,
+        name="resource",
+        props=props,
+        opts=pulumi.ResourceOptions(),
+    )
+
+
+class Test__register_auto_labeling:
+    @pulumi.runtime.test
+    def test(self) -> None:
+        """Labels are applied through the default transform registry."""
+        # Arrange
+        _SCHEMA_INDEX["gcp:storage/bucket:Bucket"] = frozenset({"name", "labels"})
+
+        # Act
+        with mock.patch("pulumi.runtime.register_resource_transform") as m:
+            register_auto_labeling(extra={"team": "platform"})
+
+        result = transform_registry.transform_resource(
+            _resource_args("gcp:storage/bucket:Bucket", {"labels": {"name": "bucket"}}),
+        )
+
+        # Assert
+        m.assert_called_once_with(transform_registry.transform_resource)
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.props["labels"] == {
+            "pulumi-organization": "organization",
+            "pulumi-project": "project",
+            "pulumi-stack": "stack",
+            "managed-by": "pulumi",
+            "team": "platform",
+            "name": "bucket",
+        }
+
+    @pulumi.runtime.test
+    def test_not_labelable(self) -> None:
+        """GCP resources without labels are left untouched."""
+        # Arrange
+        _SCHEMA_INDEX["gcp:projects/iAMMember:IAMMember"] = frozenset({"member", "role"})
+        with mock.patch("pulumi.runtime.register_resource_transform"):
+            register_auto_labeling()
+
+        # Act
+        result = transform_registry.transform_resource(_resource_args("gcp:projects/iAMMember:IAMMember", {}))
+
+        # Assert
+        assert result is None
+
+    @pulumi.runtime.test
+    def test_not_dispatched(self) -> None:
+        """Non-GCP resources are not dispatched to the auto-labeling transform at all."""
+        # Arrange
+        with mock.patch("pulumi.runtime.register_resource_transform"):
+            register_auto_labeling()
+
+        # Act
+        with mock.patch("pulumi_extra.contrib.gcp.autolabel.is_labelable") as m:
+            result = transform_registry.transform_resource(_resource_args("aws:s3/bucket:Bucket", {}))
+
+        # Assert
+        assert result is None
+        m.assert_not_called()
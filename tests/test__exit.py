@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pulumi_extra._exit import write_report
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class Test__write_report:
+    def test(self, capsys: pytest.CaptureFixture[str]) -> None:
+        # Act
+        write_report(lambda: ["first", "second"])
+        write_report(list)
+
+        # Assert
+        assert capsys.readouterr().err == "first\nsecond\n"
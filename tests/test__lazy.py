@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+_PACKAGES = [
+    "pulumi_extra",
+    "pulumi_extra.transforms",
+    "pulumi_extra.contrib.aws",
+    "pulumi_extra.contrib.aws.policies",
+    "pulumi_extra.contrib.gcp",
+    "pulumi_extra.contrib.gcp.policies",
+]
+
+
+class Test__lazy_exports:
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test(self, package: str) -> None:
+        # Arrange
+        module = import_module(package)
+
+        # Act & Assert
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+
+        assert set(module.__all__) <= set(dir(module))
+
+    def test_unknown(self) -> None:
+        # Arrange
+        module = import_module("pulumi_extra")
+
+        # Act & Assert
+        with pytest.raises(AttributeError, match="module 'pulumi_extra' has no attribute 'unknown'"):
+            module.unknown  # noqa: B018
+
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test_import(self, package: str) -> None:
+        """Importing a package does not import its exports, nor their dependencies."""
+        # Arrange
+        script = f"import sys, {package}; print(*sorted(sys.modules))"
+
+        # Act
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)  # noqa: S603
+
+        # Assert
+        modules = set(result.stdout.split())
+        assert not modules & {"braceexpand", "jinja2", "pulumi", "pulumi_policy"}
+        assert {m for m in modules if m.startswith("pulumi_extra.")} <= {
+            "pulumi_extra._lazy",
+            "pulumi_extra.contrib",
+            "pulumi_extra.contrib.aws",
+            "pulumi_extra.contrib.gcp",
+            package,
+        }
+
+    def test_import_transforms(self) -> None:
+        """Using a transform factory does not import templates, stack references nor resource lookups."""
+        # Arrange
+        script = "import sys; from pulumi_extra import override_resource_options; print(*sorted(sys.modules))"
+
+        # Act
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)  # noqa: S603
+
+        # Assert
+        modules = set(result.stdout.split())
+        assert not modules & {"jinja2", "pulumi_extra.output", "pulumi_extra.resource_", "pulumi_extra.stack_reference"}
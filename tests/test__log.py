@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from pulumi_extra._log import OnceLogger
+
+
+class Test__OnceLogger:
+    def test(self) -> None:
+        """Each distinct message is logged once."""
+        # Arrange
+        logger = OnceLogger()
+
+        # Act
+        with mock.patch("pulumi.log.info") as m:
+            for _ in range(3):
+                logger.info("Resource type aws:s3/bucket:Bucket is set not-taggable explicitly")
+
+            logger.info("Resource type aws:ec2/vpc:Vpc is set not-taggable explicitly")
+
+        # Assert
+        assert m.call_args_list == [
+            mock.call("Resource type aws:s3/bucket:Bucket is set not-taggable explicitly"),
+            mock.call("Resource type aws:ec2/vpc:Vpc is set not-taggable explicitly"),
+        ]
+        assert logger.summary() == (
+            "Suppressed 2 repeat(s) of 2 distinct log message(s) and dropped 0 message(s) over the limit of 1024"
+        )
+
+    def test_max_messages(self) -> None:
+        """Distinct messages over the limit are dropped."""
+        # Arrange
+        logger = OnceLogger(max_messages=2)
+
+        # Act
+        with mock.patch("pulumi.log.debug") as m:
+            for message in [f"Message {i}" for i in range(5)]:
+                logger.debug(message)
+
+        # Assert
+        assert m.call_count == 2
+        assert logger.summary() == (
+            "Suppressed 0 repeat(s) of 2 distinct log message(s) and dropped 3 message(s) over the limit of 2"
+        )
+
+    def test_report(self) -> None:
+        """Summary is reported at exit only if anything was suppressed."""
+        # Arrange
+        logger = OnceLogger()
+
+        # Act
+        with mock.patch("pulumi.log.debug"):
+            logger.debug("Message")
+            first = logger.report()
+            logger.debug("Message")
+            second = logger.report()
+
+        # Assert
+        assert first == []
+        assert second == [
+            "Suppressed 1 repeat(s) of 1 distinct log message(s) and dropped 0 message(s) over the limit of 1024",
+        ]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pulumi
+import pytest
+
+from pulumi_extra import override_invoke_defaults, override_resource_defaults, override_resource_options
+from pulumi_extra._options import OptionsOverride, contains
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def _resource_args(props: Mapping[str, Any], opts: pulumi.ResourceOptions) -> pulumi.ResourceTransformArgs:
+    return pulumi.ResourceTransformArgs(
+        custom=True,
+        type_="aws:s3/bucket:Bucket",
+        name="bucket",
+        props=props,
+        opts=opts,
+    )
+
+
+class Test__OptionsOverride:
+    def test(self) -> None:
+        # Arrange
+        provider = mock.Mock(spec=pulumi.ProviderResource)
+        override = OptionsOverride(pulumi.ResourceOptions(provider=provider, protect=True))
+        opts = pulumi.ResourceOptions(retain_on_delete=True, depends_on=[mock.Mock(spec=pulumi.Resource)])
+
+        # Act
+        new_opts = override.apply(opts)
+
+        # Assert
+        assert new_opts is not None
+        assert new_opts is not opts
+        assert (new_opts.provider, new_opts.protect, new_opts.retain_on_delete) == (provider, True, True)
+        assert new_opts.depends_on is opts.depends_on
+        assert opts.provider is None  # Unchanged
+
+    def test_applied(self) -> None:
+        """Options holding the override already are left as they are."""
+        # Arrange
+        provider = mock.Mock(spec=pulumi.ProviderResource)
+        override = OptionsOverride(pulumi.ResourceOptions(provider=provider, protect=True))
+
+        # Act & Assert
+        assert override.apply(pulumi.ResourceOptions(provider=provider, protect=True, retain_on_delete=True)) is None
+        assert override.apply(pulumi.ResourceOptions(provider=provider, protect=False)) is not None
+
+    def test_none(self) -> None:
+        # Arrange
+        override = OptionsOverride(pulumi.InvokeOptions(version="1.0.0"))
+
+        # Act
+        new_opts = override.apply(None)
+
+        # Assert
+        assert isinstance(new_opts, pulumi.InvokeOptions)
+        assert new_opts.version == "1.0.0"
+
+    def test_collections(self) -> None:
+        """Collections are merged as `pulumi.ResourceOptions.merge` does."""
+        # Arrange
+        override = OptionsOverride(pulumi.ResourceOptions(ignore_changes=["tags"]))
+
+        # Act
+        new_opts = override.apply(pulumi.ResourceOptions(ignore_changes=["name"]))
+
+        # Assert
+        assert new_opts is not None
+        assert new_opts.ignore_changes == ["name", "tags"]
+
+
+class Test__contains:
+    @pytest.mark.parametrize(
+        ("items", "expect"),
+        [
+            ({}, True),
+            ({"a": 1}, True),
+            ({"a": 1, "b": "b"}, True),
+            ({"a": True}, False),
+            ({"a": 2}, False),
+            ({"c": None}, False),
+        ],
+    )
+    def test(self, *, items: dict[str, object], expect: bool) -> None:
+        # Arrange
+        mapping = {"a": 1, "b": "b"}
+
+        # Act & Assert
+        assert contains(mapping, items) is expect
+
+    def test_opaque(self) -> None:
+        """Values other than primitives are only the same if identical, e.g. outputs."""
+        # Arrange
+        value = pulumi.Output.from_input("value")
+
+        # Act & Assert
+        assert contains({"a": value}, {"a": value}) is True
+        assert contains({"a": value}, {"a": pulumi.Output.from_input("value")}) is False
+
+
+class Test__override_noop:
+    def test_resource_options(self) -> None:
+        # Arrange
+        transform = override_resource_options("*", protect=True)
+        args = _resource_args({}, pulumi.ResourceOptions())
+
+        # Act
+        result = transform(args)
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        noop = transform(_resource_args(result.props, result.opts))
+
+        # Assert
+        assert result.opts.protect is True
+        assert noop is None
+
+    def test_resource_defaults(self) -> None:
+        # Arrange
+        transform = override_resource_defaults("*", defaults={"bucket": "default"})
+
+        # Act & Assert
+        result = transform(_resource_args({}, pulumi.ResourceOptions()))
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.props == {"bucket": "default"}
+        assert transform(_resource_args({"bucket": "bucket"}, pulumi.ResourceOptions())) is None
+
+    def test_invoke_defaults(self) -> None:
+        # Arrange
+        transform = override_invoke_defaults("*", defaults={"region": "us-east-1"})
+
+        # Act & Assert
+        args = pulumi.InvokeTransformArgs(
+            "aws:index/getRegion:getRegion",
+            {"region": "eu-west-1"},
+            pulumi.InvokeOptions(),
+        )
+        assert transform(args) is None
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from pulumi_extra._pattern import PatternMatcher
+
+
+class Test__PatternMatcher:
+    @pytest.mark.parametrize(
+        ("patterns", "value", "expect"),
+        [
+            (["aws:s3/bucket:Bucket"], "aws:s3/bucket:Bucket", True),
+            (["aws:s3/bucket:Bucket"], "aws:s3/bucketV2:BucketV2", False),
+            (["*"], "aws:s3/bucket:Bucket", True),
+            (["aws:*"], "gcp:storage/bucket:Bucket", False),
+            (["aws:{ec2,rds,s3}/*:*"], "aws:rds/instance:Instance", True),
+            (["aws:{ec2,rds,s3}/*:*"], "aws:lambda/function:Function", False),
+            (["aws:s3/bucket{,V2}:Bucket{,V2}"], "aws:s3/bucketV2:BucketV2", True),
+            (["aws:s3/[bc]*"], "aws:s3/bucket:Bucket", True),
+            (["aws:ec2/?pc:Vpc"], "aws:ec2/vpc:Vpc", True),
+            (["_"], "aws:ec2/vpc:Vpc", False),
+            ([], "aws:ec2/vpc:Vpc", False),
+        ],
+    )
+    def test(self, *, patterns: list[str], value: str, expect: bool) -> None:
+        # Arrange
+        matches = PatternMatcher(patterns)
+
+        # Act & Assert
+        assert matches(value) is expect
+        assert matches(value) is expect  # Memoized
+
+    def test_many_globs(self) -> None:
+        """Many glob patterns are combined into a single expression."""
+        # Arrange
+        matches = PatternMatcher(f"aws:service{i}/*:*" for i in range(500))
+
+        # Act & Assert
+        assert matches("aws:service499/resource:Resource") is True
+        assert matches("aws:service500/resource:Resource") is False
+
+    def test_patterns(self) -> None:
+        # Arrange
+        # ...
+
+        # Act
+        matches = PatternMatcher(["aws:{s3,ec2}/*", "aws:s3/*"])
+
+        # Assert
+        assert matches.patterns == ("aws:s3/*", "aws:ec2/*")
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from unittest import mock
 
 import pulumi
 import pytest
+from jinja2 import Environment
 
-from pulumi_extra import render_template
+from pulumi_extra import enable_template_bytecode_cache, render_template, render_templates
+from pulumi_extra.output import _get_variables, _load_template
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -62,6 +67,47 @@ class Test__render_template:
 
         return pulumi.Output.all(result).apply(check)
 
+    @pulumi.runtime.test
+    def test_inputs_unused(self, template: Path | str) -> Any:
+        """Inputs not referenced by the template are not waited for."""
+        # Arrange
+        loop = asyncio.get_event_loop()
+        pending: asyncio.Future[str] = loop.create_future()
+        known = loop.create_future()
+        known.set_result(True)
+        unused = pulumi.Output(set(), pending, known)
+
+        # Act
+        result = render_template(
+            template,
+            inputs={"image": "busybox:latest", "command": "true", "unused": unused},
+        )
+
+        # Assert
+        async def check() -> None:
+            try:
+                rendered = await asyncio.wait_for(result.future(), timeout=5)
+            finally:
+                pending.set_result("unused")  # Let the test harness settle all outputs
+
+            assert rendered == "docker run --detach busybox:latest true"
+
+        return check()
+
+    def test_inputs_unused_logged_once(self, template: Path | str) -> None:
+        """Inputs not referenced by the template are logged once per template, not on every render."""
+        # Arrange
+        inputs = {"image": "busybox:latest", "command": "true", "unused": "unused"}
+
+        # Act
+        with mock.patch("pulumi.log.debug") as m:
+            render_template(template, inputs=inputs)
+            render_template(template, inputs=inputs)
+
+        # Assert
+        m.assert_called_once()
+        assert "['unused']" in m.call_args.args[0]
+
     def test_inputs_and_context_mutually_exclusive(self) -> None:
         """Test mutually exclusive arguments."""
         # Arrange
@@ -74,3 +120,116 @@ class Test__render_template:
                 context={"don't-care": "yes"},
                 inputs={"don't-care": "yes"},
             )
+
+
+class Test__render_templates:
+    @pulumi.runtime.test
+    def test(self, tmp_path: Path) -> Any:
+        # Arrange
+        file = tmp_path / "template.j2"
+        file.write_text("{{ name }}: {{ image }}")
+        image = pulumi.Output.from_input("busybox:latest")
+
+        # Act
+        result = render_templates(
+            {
+                "web": (_TEMPLATE, {"image": image, "command": "httpd"}),
+                "worker": (file, {"name": "worker", "image": image, "unused": "whatever"}),
+            },
+        )
+
+        # Assert
+        def check(args: list[Any]) -> None:
+            assert args == ["docker run --detach busybox:latest httpd", "worker: busybox:latest"]
+
+        assert list(result) == ["web", "worker"]
+        return pulumi.Output.all(*result.values()).apply(check)
+
+    def test_single_apply(self) -> None:
+        """Shared inputs are combined once and all templates are rendered in a single apply."""
+        # Arrange
+        image = pulumi.Output.from_input("busybox:latest")
+
+        # Act
+        with mock.patch("pulumi.Output.all") as m:
+            render_templates({str(i): (_TEMPLATE, {"image": image, "command": str(i)}) for i in range(3)})
+
+        # Assert
+        m.assert_called_once_with(image, "0", "1", "2")
+        m.return_value.apply.assert_called_once()
+
+
+class Test__load_template:
+    def test_inline(self) -> None:
+        """Inline templates are compiled once per content."""
+        # Arrange
+        # ...
+
+        # Act & Assert
+        assert _load_template(_TEMPLATE) is _load_template("".join(_TEMPLATE))
+        assert _load_template(_TEMPLATE) is not _load_template("{{ image }}")
+
+    def test_file(self, tmp_path: Path) -> None:
+        """Template files are compiled once per modification."""
+        # Arrange
+        file = tmp_path / "template.j2"
+        file.write_text(_TEMPLATE)
+        template = _load_template(file)
+
+        # Act & Assert
+        assert _load_template(file) is template
+
+        file.write_text("{{ image }}")
+        os.utime(file, ns=(0, 0))
+        assert _load_template(file) is not template
+        assert _load_template(file).render(image="busybox") == "busybox"
+
+
+class Test__get_variables:
+    def test(self) -> None:
+        # Arrange
+        template = _load_template("{% set x = 1 %}{{ x }} {{ image }} {% for c in commands %}{{ c }}{% endfor %}")
+
+        # Act & Assert
+        assert _get_variables(template) == {"image", "commands"}
+
+    def test_file(self, tmp_path: Path) -> None:
+        """Variables follow modifications of template files."""
+        # Arrange
+        file = tmp_path / "template.j2"
+        file.write_text(_TEMPLATE)
+        assert _get_variables(_load_template(file)) == {"image", "command"}
+
+        # Act
+        file.write_text("{{ image }}")
+        os.utime(file, ns=(0, 0))
+
+        # Assert
+        assert _get_variables(_load_template(file)) == {"image"}
+
+
+class Test__enable_template_bytecode_cache:
+    def test(self, tmp_path: Path) -> None:
+        # Arrange
+        enable_template_bytecode_cache(tmp_path)
+
+        # Act
+        result = render_template(_TEMPLATE, context={"image": "busybox", "command": "true"})
+
+        # Assert
+        assert result == "docker run --detach busybox true"
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_read(self, tmp_path: Path) -> None:
+        """Templates compiled in previous runs are loaded from the bytecode cache."""
+        # Arrange
+        enable_template_bytecode_cache(tmp_path)
+        _load_template(_TEMPLATE)
+        enable_template_bytecode_cache(tmp_path)  # Clears in-process cache
+
+        # Act & Assert
+        with mock.patch.object(Environment, "compile") as m:
+            result = render_template(_TEMPLATE, context={"image": "busybox", "command": "true"})
+            m.assert_not_called()
+
+        assert result == "docker run --detach busybox true"
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import json
+import sys
+from importlib.metadata import version
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
 
-from pulumi_extra import get_resource_cls, resource_has_attribute
+from pulumi_extra import enable_attribute_cache, get_resource_cls, resource_has_attribute
 from pulumi_extra.errors import UnknownResourceTypeError
+from pulumi_extra.resource_ import _attribute_cache, _get_provider_module, _ResourceIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _resource_module(fqn: str, classes: dict[str, str]) -> Any:
+    return SimpleNamespace(mod_info={"fqn": fqn, "classes": classes})
 
 
 class Test__resource_has_attribute:
@@ -30,6 +44,86 @@ class Test__resource_has_attribute:
             resource_has_attribute("random:unknown/unknown:Unknown", "whatever")
 
 
+class Test__enable_attribute_cache:
+    def test_write(self, tmp_path: Path) -> None:
+        # Arrange
+        import pulumi_random  # noqa: F401, PLC0415
+
+        enable_attribute_cache(tmp_path)
+
+        # Act
+        assert resource_has_attribute("random:index/randomId:RandomId", "byte_length") is True
+        _attribute_cache.flush()
+
+        # Assert
+        cache = json.loads((tmp_path / f"random-{version('pulumi_random')}.json").read_text())
+        assert "byte_length" in cache["random:index/randomId:RandomId"]
+
+    def test_read(self, tmp_path: Path) -> None:
+        """Cached attributes are served without resolving the resource class."""
+        # Arrange
+        (tmp_path / f"random-{version('pulumi_random')}.json").write_text(
+            json.dumps({"random:index/randomId:RandomId": ["cached"]})
+        )
+        enable_attribute_cache(tmp_path)
+
+        # Act & Assert
+        with mock.patch("pulumi_extra.resource_.get_resource_cls") as m:
+            assert resource_has_attribute("random:index/randomId:RandomId", "cached") is True
+            assert resource_has_attribute("random:index/randomId:RandomId", "byte_length") is False
+            m.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "cached",
+        [
+            "tags",
+            ["tags", 1],
+            {"tags": True},
+        ],
+    )
+    def test_malformed_entry(self, tmp_path: Path, cached: Any) -> None:
+        """Malformed cache entries are treated as misses."""
+        # Arrange
+        import pulumi_random  # noqa: F401, PLC0415
+
+        (tmp_path / f"random-{version('pulumi_random')}.json").write_text(
+            json.dumps({"random:index/randomId:RandomId": cached})
+        )
+        enable_attribute_cache(tmp_path)
+
+        # Act & Assert
+        assert resource_has_attribute("random:index/randomId:RandomId", "t") is False
+        assert resource_has_attribute("random:index/randomId:RandomId", "byte_length") is True
+
+    def test_write_error(self, tmp_path: Path) -> None:
+        """Failing to write the cache at exit is reported without raising."""
+        # Arrange
+        import pulumi_random  # noqa: F401, PLC0415
+
+        enable_attribute_cache(tmp_path)
+        assert resource_has_attribute("random:index/randomId:RandomId", "byte_length") is True
+
+        # Act
+        with mock.patch("pulumi_extra.resource_.dump_json", side_effect=OSError("read-only")):
+            failures = _attribute_cache.flush()
+
+        # Assert
+        assert len(failures) == 1
+        assert failures[0].startswith("Unable to write resource attribute cache")
+
+    def test_version_changed(self, tmp_path: Path) -> None:
+        """Cache of other provider versions is ignored."""
+        # Arrange
+        import pulumi_random  # noqa: F401, PLC0415
+
+        (tmp_path / "random-0.0.1.json").write_text(json.dumps({"random:index/randomId:RandomId": ["cached"]}))
+        enable_attribute_cache(tmp_path)
+
+        # Act & Assert
+        assert resource_has_attribute("random:index/randomId:RandomId", "cached") is False
+        assert resource_has_attribute("random:index/randomId:RandomId", "byte_length") is True
+
+
 class Test__get_resource_cls:
     def test(self) -> None:
         # Arrange
@@ -42,10 +136,67 @@ class Test__get_resource_cls:
         assert cls is not None
         assert f"{cls.__module__}.{cls.__name__}" == "pulumi_random.random_id.RandomId"
 
+    def test_import_provider_module(self) -> None:
+        """Provider module owning the resource type is imported on demand."""
+        # Arrange
+        # ...
+
+        # Act
+        with (
+            mock.patch("pulumi_extra.resource_._resource_index", _ResourceIndex({})),
+            mock.patch("pulumi_extra.resource_.import_module") as m,
+        ):
+            cls = get_resource_cls("aws:s3/bucket:Bucket")
+
+        # Assert
+        assert cls is None
+        m.assert_called_once_with("pulumi_aws.s3")
+
+    def test_cache_clear(self) -> None:
+        """Types not resolved before are looked up again once caches are cleared, as with `functools.cache`."""
+        # Arrange
+        get_resource_cls("aws:s3/bucket:Bucket")
+
+        # Act
+        with mock.patch("pulumi_extra.resource_.import_module") as m:
+            get_resource_cls("aws:s3/bucket:Bucket")
+            get_resource_cls.cache_clear()  # type: ignore[attr-defined]
+            get_resource_cls("aws:s3/bucket:Bucket")
+
+        # Assert
+        m.assert_called_once_with("pulumi_aws.s3")
+
+    def test_import_provider_module_lazily(self, stub_provider: Callable[..., None]) -> None:
+        """Provider SDKs are not imported until one of their resource types is resolved."""
+        # Arrange
+        stub_provider(
+            "stub",
+            {
+                "stub:storage/bucket:Bucket": ["name", "tags"],
+                "stub:compute/instance:Instance": ["name"],
+            },
+        )
+        assert "pulumi_stub" not in sys.modules
+
+        # Act
+        cls = get_resource_cls("stub:storage/bucket:Bucket")
+
+        # Assert
+        assert cls is not None
+        assert f"{cls.__module__}.{cls.__name__}" == "pulumi_stub.storage.Bucket"
+        assert "pulumi_stub.compute" not in sys.modules
+        assert resource_has_attribute("stub:storage/bucket:Bucket", "tags") is True
+
+    def test_provider_not_installed(self) -> None:
+        # Arrange
+        # ...
+
+        # Act & Assert
+        assert get_resource_cls("unknown:module/resource:Resource") is None
+
     def test_registry_not_initialized(self) -> None:
         """If registry not initialized, it will return `None`."""
-        with mock.patch("pulumi_extra.resource_._get_resources") as m:
-            m.return_value = []
+        with mock.patch("pulumi_extra.resource_._resource_index", _ResourceIndex({})):
             assert get_resource_cls("random:index/randomId:RandomId") is None
 
     def test_unknown_resource_type(self) -> None:
@@ -54,3 +205,77 @@ class Test__get_resource_cls:
 
         # Act & Assert
         assert get_resource_cls("random:unknown/unknown:Unknown") is None
+
+
+class Test__ResourceIndex:
+    def test_lookup(self) -> None:
+        # Arrange
+        index = _ResourceIndex(
+            {
+                "random:index": [
+                    _resource_module("pulumi_random", {"random:index/randomId:RandomId": "RandomId"}),
+                ],
+            },
+        )
+
+        # Act & Assert
+        assert index.lookup("random:index/randomId:RandomId") == ("pulumi_random", "RandomId")
+        assert index.lookup("random:unknown/unknown:Unknown") is None
+
+    def test_registry_grows(self) -> None:
+        """Types registered after a miss are found once the registry generation changes."""
+        # Arrange
+        registry: dict[str, list[Any]] = {}
+        index = _ResourceIndex(registry)
+        assert index.lookup("random:index/randomId:RandomId") is None
+
+        # Act
+        registry["random:index"] = [
+            _resource_module("pulumi_random", {"random:index/randomId:RandomId": "RandomId"}),
+        ]
+
+        # Assert
+        assert index.lookup("random:index/randomId:RandomId") == ("pulumi_random", "RandomId")
+
+    def test_new_module_version(self) -> None:
+        """Modules appended to an already indexed key are indexed too."""
+        # Arrange
+        registry = {
+            "random:index/randomPet": [
+                _resource_module("pulumi_random", {"random:index/randomId:RandomId": "RandomId"}),
+            ],
+        }
+        index = _ResourceIndex(registry)
+        assert index.lookup("random:index/randomPet:RandomPet") is None
+
+        # Act
+        registry["random:index/randomPet"].append(
+            _resource_module("pulumi_random", {"random:index/randomPet:RandomPet": "RandomPet"}),
+        )
+
+        # Assert
+        assert index.lookup("random:index/randomPet:RandomPet") == ("pulumi_random", "RandomPet")
+
+    def test_miss_is_not_rescanned(self) -> None:
+        """Repeated misses do not walk the registry again while it is unchanged."""
+        # Arrange
+        index = _ResourceIndex({})
+        assert index.lookup("random:unknown/unknown:Unknown") is None
+
+        # Act & Assert
+        with mock.patch.object(index, "_refresh") as m:
+            assert index.lookup("random:unknown/unknown:Unknown") is None
+            m.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("resource_type", "expect"),
+    [
+        ("aws:s3/bucket:Bucket", ("pulumi_aws", "s3")),
+        ("gcp:cloudrunv2/service:Service", ("pulumi_gcp", "cloudrunv2")),
+        ("random:index/randomId:RandomId", ("pulumi_random", None)),
+        ("azure-native:storage:StorageAccount", ("pulumi_azure_native", "storage")),
+    ],
+)
+def test__get_provider_module(resource_type: str, expect: tuple[str, str | None]) -> None:
+    assert _get_provider_module(resource_type) == expect
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+
+from pulumi_extra import resource_has_attribute
+from pulumi_extra.schema import build_manifest, get_schema_attributes, load_manifest, load_schema, main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_SCHEMA: dict[str, Any] = {
+    "name": "random",
+    "version": "4.21.0",
+    "resources": {
+        "random:index/randomId:RandomId": {
+            "inputProperties": {
+                "byteLength": {"type": "integer"},
+                "keepers": {"type": "object"},
+                "prefix": {"type": "string"},
+            },
+        },
+        "random:index/randomPet:RandomPet": {
+            "inputProperties": {
+                "from": {"type": "string"},
+                "customName": {"type": "string", "language": {"python": {"name": "overridden_name"}}},
+            },
+        },
+        "random:index/randomUuid:RandomUuid": {},
+    },
+}
+
+
+@pytest.fixture
+def schema_file(tmp_path: Path) -> Path:
+    file = tmp_path / "schema.json"
+    file.write_text(json.dumps(_SCHEMA))
+    return file
+
+
+class Test__load_schema:
+    def test(self, schema_file: Path) -> None:
+        # Arrange
+        # ...
+
+        # Act
+        load_schema(schema_file)
+
+        # Assert
+        assert get_schema_attributes("random:index/randomId:RandomId") == {"byte_length", "keepers", "prefix"}
+        assert get_schema_attributes("random:index/randomPet:RandomPet") == {"from_", "overridden_name"}
+        assert get_schema_attributes("random:index/randomUuid:RandomUuid") == frozenset()
+        assert get_schema_attributes("random:unknown/unknown:Unknown") is None
+
+    def test_resource_has_attribute(self, schema_file: Path) -> None:
+        """Schema index answers without resolving the resource class."""
+        # Arrange
+        load_schema(schema_file)
+
+        # Act & Assert
+        with mock.patch("pulumi_extra.resource_.get_resource_cls") as m:
+            assert resource_has_attribute("random:index/randomId:RandomId", "byte_length") is True
+            assert resource_has_attribute("random:index/randomId:RandomId", "my-attribute") is False
+            assert resource_has_attribute("random:index/randomUuid:RandomUuid", "keepers") is False
+            m.assert_not_called()
+
+
+class Test__build_manifest:
+    def test(self, schema_file: Path, tmp_path: Path) -> None:
+        # Arrange
+        manifest = tmp_path / "manifest.json"
+
+        # Act
+        build_manifest(schema_file, manifest)
+        load_manifest(manifest)
+
+        # Assert
+        assert json.loads(manifest.read_text()) == {
+            "name": "random",
+            "version": "4.21.0",
+            "resources": {
+                "random:index/randomId:RandomId": ["byte_length", "keepers", "prefix"],
+                "random:index/randomPet:RandomPet": ["from_", "overridden_name"],
+                "random:index/randomUuid:RandomUuid": [],
+            },
+        }
+        assert get_schema_attributes("random:index/randomId:RandomId") == {"byte_length", "keepers", "prefix"}
+
+    def test_cli(self, schema_file: Path, tmp_path: Path) -> None:
+        # Arrange
+        manifest = tmp_path / "manifest.json"
+
+        # Act
+        main([str(schema_file), str(manifest)])
+
+        # Assert
+        assert manifest.exists()
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import json
+import time
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pulumi
 import pytest
 
-from pulumi_extra import get_stack_outputs, get_stack_reference, re_export
+from pulumi_extra import enable_stack_output_snapshot, get_stack_outputs, get_stack_reference, re_export
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -47,6 +51,35 @@ class Test__get_stack_reference:
 
         return pulumi.Output.all(sr.name).apply(check)
 
+    def test_pooled(self) -> None:
+        """Shorthands of the same stack share a single stack reference."""
+        # Arrange
+        # ...
+
+        # Act
+        with mock.patch("pulumi.StackReference", side_effect=lambda _: mock.Mock()) as m:
+            refs = [get_stack_reference(ref) for ref in ("dev", "project/dev", "organization/project/dev")]
+            other = get_stack_reference("network/dev")
+
+        # Assert
+        assert refs[0] is refs[1] is refs[2]
+        assert other is not refs[0]
+        assert m.call_args_list == [mock.call("organization/project/dev"), mock.call("organization/network/dev")]
+
+    def test_cache_clear(self) -> None:
+        """Pooled stack references are dropped once the cache is cleared, as with `functools.cache`."""
+        # Arrange
+        # ...
+
+        # Act
+        with mock.patch("pulumi.StackReference", side_effect=lambda _: mock.Mock()):
+            ref = get_stack_reference("dev")
+            get_stack_reference.cache_clear()  # type: ignore[attr-defined]
+            other = get_stack_reference("dev")
+
+        # Assert
+        assert other is not ref
+
     def test_invalid_ref(self) -> Any:
         # Arrange
         # ...
@@ -56,6 +89,14 @@ class Test__get_stack_reference:
             get_stack_reference("organization/project/dev/extra")
 
 
+@pytest.fixture
+def mock_stack_outputs(mock_stack_reference: mock.MagicMock) -> mock.MagicMock:
+    """Mock `pulumi.StackReference` outputs map with outputs `a` and `b`, the latter being secret."""
+    mock_stack_reference.return_value.outputs = pulumi.Output.from_input({"a": "value:a", "b": "value:b"})
+    mock_stack_reference.return_value.secret_output_names = pulumi.Output.from_input(["b"])
+    return mock_stack_reference
+
+
 class Test__get_stack_outputs:
     @pytest.mark.parametrize(
         ("ref", "expect"),
@@ -88,6 +129,190 @@ class Test__get_stack_outputs:
             get_stack_outputs(":output")
 
 
+class Test__get_stack_outputs_glob:
+    @pytest.fixture
+    def mock_stack_outputs(self, mock_stack_reference: mock.MagicMock) -> mock.MagicMock:
+        mock_stack_reference.return_value.outputs = pulumi.Output.from_input(
+            {"vpc_id": "vpc-1", "vpc_cidr": "10.0.0.0/16", "subnet_id": "subnet-1"},
+        )
+        return mock_stack_reference
+
+    @pytest.mark.parametrize(
+        ("ref", "expect"),
+        [
+            ("dev:*", {"vpc_id": "vpc-1", "vpc_cidr": "10.0.0.0/16", "subnet_id": "subnet-1"}),
+            ("dev:vpc_*", {"vpc_id": "vpc-1", "vpc_cidr": "10.0.0.0/16"}),
+            ("dev:{vpc_id,subnet_*}", ["vpc-1", {"subnet_id": "subnet-1"}]),
+            ("dev:unknown_*", {}),
+        ],
+    )
+    @pulumi.runtime.test
+    def test(self, mock_stack_outputs: mock.MagicMock, *, ref: str, expect: Any) -> Any:
+        # Arrange
+        mock_stack_outputs.return_value.require_output.side_effect = {"vpc_id": pulumi.Output.from_input("vpc-1")}.get
+
+        # Act
+        outputs = get_stack_outputs(ref)
+
+        # Assert
+        def check(args: list[Any]) -> None:
+            assert args[0] == expect
+
+        return pulumi.Output.all(outputs).apply(check)
+
+    @pytest.mark.usefixtures("mock_stack_outputs")
+    @pulumi.runtime.test
+    def test_re_export(self) -> Any:
+        """Selected outputs are re-exported as a single map per stack reference."""
+        # Arrange
+        # ...
+
+        # Act
+        with mock.patch("pulumi.export") as m_export:
+            re_export("network/dev:{vpc_*,subnet_*}")
+
+        # Assert
+        m_export.assert_called_once()
+        name, output = m_export.call_args.args
+        assert name == "network/dev"
+
+        def check(value: Any) -> None:
+            assert value == {"vpc_id": "vpc-1", "vpc_cidr": "10.0.0.0/16", "subnet_id": "subnet-1"}
+
+        return output.apply(check)
+
+
+class Test__get_stack_outputs_fetch_once:
+    @pulumi.runtime.test
+    def test(self, mock_stack_outputs: mock.MagicMock) -> Any:
+        # Arrange
+        # ...
+
+        # Act
+        outputs = get_stack_outputs("dev:{a,b}", "organization/project/dev:a", fetch_once=True)
+
+        # Assert
+        mock_stack_outputs.assert_called_once_with("organization/project/dev")
+        mock_stack_outputs.return_value.require_output.assert_not_called()
+        assert outputs[0] is outputs[2]
+
+        async def check() -> None:
+            assert [await output.future() for output in outputs] == ["value:a", "value:b", "value:a"]
+            assert [await output.is_secret() for output in outputs] == [False, True, False]
+
+        return check()
+
+    @pulumi.runtime.test
+    def test_secret_names_unknown(self, mock_stack_outputs: mock.MagicMock) -> Any:
+        """Secretness of the whole outputs map is used if the secret output names are unknown."""
+        # Arrange
+        mock_stack_outputs.return_value.outputs = pulumi.Output.secret({"a": "value:a"})
+        mock_stack_outputs.return_value.secret_output_names = pulumi.Output.from_input(None)
+
+        # Act
+        output = get_stack_outputs("dev:a", fetch_once=True)
+
+        # Assert
+        async def check() -> None:
+            assert await output.future() == "value:a"
+            assert await output.is_secret() is True
+
+        return check()
+
+
+class Test__enable_stack_output_snapshot:
+    @pytest.mark.usefixtures("mock_stack_outputs")
+    def test_write(self, tmp_path: Path) -> None:
+        """Non-secret outputs of referenced stacks are written to the snapshot once resolved."""
+        # Arrange
+        enable_stack_output_snapshot(tmp_path)
+
+        # Act
+        @pulumi.runtime.test
+        def program() -> Any:
+            return get_stack_outputs("dev:a")
+
+        program()
+
+        # Assert
+        snapshot = json.loads((tmp_path / "organization%2Fproject%2Fdev.json").read_text())
+        assert snapshot["outputs"] == {"a": "value:a"}
+
+    def test_write_error(self, tmp_path: Path, mock_stack_reference: mock.MagicMock) -> None:
+        """Outputs that cannot be written to the snapshot leave neither the program failing nor files behind."""
+        # Arrange
+        mock_stack_reference.return_value.outputs = pulumi.Output.from_input({"a": "value:a", "b": {1, 2}})
+        mock_stack_reference.return_value.secret_output_names = pulumi.Output.from_input([])
+        enable_stack_output_snapshot(tmp_path)
+
+        # Act
+        @pulumi.runtime.test
+        def program() -> Any:
+            return get_stack_outputs("dev:a")
+
+        program()
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        ("preview", "options", "expect_from_snapshot"),
+        [
+            (True, {}, True),
+            (True, {"ttl": None}, True),
+            (True, {"ttl": timedelta(minutes=1)}, False),
+            (True, {"refresh": True}, False),
+            (False, {}, False),
+        ],
+    )
+    @pulumi.runtime.test
+    def test_read(
+        self,
+        tmp_path: Path,
+        mock_stack_outputs: mock.MagicMock,
+        *,
+        preview: bool,
+        options: dict[str, Any],
+        expect_from_snapshot: bool,
+    ) -> Any:
+        """Previews serve output references from fresh snapshots, without reading the referenced stack."""
+        # Arrange
+        snapshot = {"timestamp": time.time() - 3600, "outputs": {"a": "snapshot:a"}}
+        (tmp_path / "organization%2Fproject%2Fdev.json").write_text(json.dumps(snapshot))
+        enable_stack_output_snapshot(tmp_path, **options)
+
+        # Act
+        with mock.patch("pulumi.runtime.is_dry_run", return_value=preview):
+            output = get_stack_outputs("dev:a")
+
+        # Assert
+        assert mock_stack_outputs.called is not expect_from_snapshot
+
+        def check(value: Any) -> None:
+            assert value == ("snapshot:a" if expect_from_snapshot else "value:a")
+
+        return output.apply(check)
+
+    @pulumi.runtime.test
+    def test_read_secret(self, tmp_path: Path, mock_stack_outputs: mock.MagicMock) -> Any:
+        """Outputs missing from the snapshot, such as secrets, are read from the referenced stack."""
+        # Arrange
+        (tmp_path / "organization%2Fproject%2Fdev.json").write_text(json.dumps({"outputs": {"a": "snapshot:a"}}))
+        enable_stack_output_snapshot(tmp_path)
+
+        # Act
+        with mock.patch("pulumi.runtime.is_dry_run", return_value=True):
+            outputs = get_stack_outputs("dev:{a,b}", fetch_once=True)
+
+        # Assert
+        mock_stack_outputs.assert_called_once_with("organization/project/dev")
+
+        def check(values: list[Any]) -> None:
+            assert values == ["snapshot:a", "value:b"]
+
+        return pulumi.Output.all(*outputs).apply(check)
+
+
 class Test__re_export:
     @pytest.mark.usefixtures("mock_stack_reference")
     @pulumi.runtime.test
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pulumi
+
+from pulumi_extra import get_resource_cls, override_invoke, override_resource, resource_has_attribute
+from pulumi_extra.contrib.aws import register_auto_tagging
+from pulumi_extra.schema import _SCHEMA_INDEX
+from pulumi_extra.testing import RegisteredResource, reset_caches, run_program
+from pulumi_extra.transforms import transform_registry
+
+
+class _Mocks(pulumi.runtime.Mocks):
+    def __init__(self) -> None:
+        self.calls: list[pulumi.runtime.MockCallArgs] = []
+
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs) -> Any:
+        return (f"{args.name}-id", {**args.inputs, "arn": f"arn:{args.name}"})
+
+    def call(self, args: pulumi.runtime.MockCallArgs) -> Any:
+        self.calls.append(args)
+        return {"name": "ap-northeast-2"}
+
+
+class Test__run_program:
+    def test(self) -> None:
+        """Registered resources are returned with their properties after runtime transforms."""
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        _SCHEMA_INDEX["aws:s3/bucketPolicy:BucketPolicy"] = frozenset({"bucket", "policy"})
+
+        def program() -> None:
+            register_auto_tagging()
+            bucket = pulumi.CustomResource("aws:s3/bucket:Bucket", "bucket", props={"tags": {"Name": "bucket"}})
+            pulumi.CustomResource(
+                "aws:s3/bucketPolicy:BucketPolicy",
+                "policy",
+                props={"bucket": bucket.id},
+                opts=pulumi.ResourceOptions(parent=bucket),
+            )
+
+        # Act
+        resources = run_program(program)
+
+        # Assert
+        assert resources == [
+            RegisteredResource(
+                urn="urn:pulumi:stack::project::pulumi:pulumi:Stack$aws:s3/bucket:Bucket::bucket",
+                type_="aws:s3/bucket:Bucket",
+                name="bucket",
+                id="bucket_id",
+                props={
+                    "tags": {
+                        "pulumi:Organization": "organization",
+                        "pulumi:Project": "project",
+                        "pulumi:Stack": "stack",
+                        "Managed-By": "Pulumi",
+                        "Name": "bucket",
+                    },
+                },
+            ),
+            RegisteredResource(
+                urn="urn:pulumi:stack::project::aws:s3/bucket:Bucket$aws:s3/bucketPolicy:BucketPolicy::policy",
+                type_="aws:s3/bucketPolicy:BucketPolicy",
+                name="policy",
+                id="policy_id",
+                props={"bucket": "bucket_id"},
+            ),
+        ]
+
+    def test_mocks(self) -> None:
+        """Custom mocks receive resources and invokes after runtime transforms."""
+        # Arrange
+        mocks = _Mocks()
+        regions: list[str] = []
+
+        def program() -> pulumi.Output[Any]:
+            transform_registry.add_resource_transform(
+                override_resource("*", props=lambda props: props | {"bucket": pulumi.get_stack()}),
+            )
+            transform_registry.add_invoke_transform(override_invoke("*", args={"id": "a"}))
+            pulumi.CustomResource("aws:s3/bucket:Bucket", "bucket", props={})
+            return pulumi.Output.from_input(
+                pulumi.runtime.invoke_output("aws:index/getRegion:getRegion", {}),
+            ).apply(lambda result: regions.append(result["name"]))
+
+        # Act
+        [resource] = run_program(program, mocks=mocks, stack="dev")
+
+        # Assert
+        assert resource.props == {"bucket": "dev", "arn": "arn:bucket"}
+        assert [call.args for call in mocks.calls] == [{"id": "a"}]
+        assert regions == ["ap-northeast-2"]
+
+
+class Test__reset_caches:
+    def test(self) -> None:
+        # Arrange
+        _SCHEMA_INDEX["aws:s3/bucket:Bucket"] = frozenset({"bucket", "tags"})
+        resource_has_attribute("aws:s3/bucket:Bucket", "tags")
+        get_resource_cls("aws:s3/bucket:Bucket")
+
+        # Act
+        reset_caches()
+
+        # Assert
+        assert resource_has_attribute.cache_info().currsize == 0
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pulumi
+
+from pulumi_extra.transforms import (
+    enable_transform_instrumentation,
+    get_transform_stats,
+    override_invoke_options,
+    override_resource,
+)
+from pulumi_extra.transforms.instrumentation import _instrumentation
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _resource_args(type_: str) -> pulumi.ResourceTransformArgs:
+    return pulumi.ResourceTransformArgs(
+        custom=True,
+        type_=type_,
+        name="resource",
+        props={},
+        opts=pulumi.ResourceOptions(),
+    )
+
+
+class Test__enable_transform_instrumentation:
+    def test(self) -> None:
+        # Arrange
+        enable_transform_instrumentation()
+        bucket = override_resource("aws:s3/bucket:Bucket", props={"bucket": "b"})
+        never = override_resource("aws:ec2/*")
+
+        # Act
+        for type_ in ("aws:s3/bucket:Bucket", "aws:s3/bucket:Bucket", "aws:iam/role:Role"):
+            bucket(_resource_args(type_))
+            never(_resource_args(type_))
+
+        # Assert
+        stats = {s.name: s for s in get_transform_stats()}
+        assert stats.keys() == {"override_resource(aws:s3/bucket:Bucket)", "override_resource(aws:ec2/*)"}
+        assert (
+            stats["override_resource(aws:s3/bucket:Bucket)"].calls,
+            stats["override_resource(aws:s3/bucket:Bucket)"].matches,
+        ) == (3, 2)
+        assert (stats["override_resource(aws:ec2/*)"].calls, stats["override_resource(aws:ec2/*)"].matches) == (3, 0)
+        assert all(0 < s.max_time <= s.total_time for s in stats.values())
+
+    def test_matches_applied(self) -> None:
+        """Overrides applied already count as matches, but not as changes."""
+        # Arrange
+        enable_transform_instrumentation()
+        transform = override_resource("aws:s3/bucket:Bucket", props={"bucket": "b"})
+        args = _resource_args("aws:s3/bucket:Bucket")
+
+        # Act
+        result = transform(args)
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        args.props = result.props
+        noop = transform(args)
+
+        # Assert
+        (stats,) = get_transform_stats()
+        assert noop is None
+        assert (stats.calls, stats.matches, stats.changes) == (2, 2, 1)
+
+    def test_disabled(self) -> None:
+        """Transforms are not wrapped unless instrumentation is enabled."""
+        # Arrange
+        transform = override_invoke_options("aws:index/getRegion:getRegion", version="6.0.0")
+
+        # Act
+        transform(pulumi.InvokeTransformArgs("aws:index/getRegion:getRegion", {}, pulumi.InvokeOptions()))
+
+        # Assert
+        assert transform.__name__ == "transform"
+        assert get_transform_stats() == []
+
+    def test_report(self) -> None:
+        """Statistics are reported at exit if no output file is given."""
+        # Arrange
+        enable_transform_instrumentation()
+        override_resource("*", props={"a": 1})(_resource_args("aws:s3/bucket:Bucket"))
+
+        # Act
+        report = _instrumentation.report()
+
+        # Assert
+        assert len(report) == 1
+        assert report[0].startswith("override_resource(*): calls=1 matches=1 changes=1 ")
+
+    def test_report_at_exit(self) -> None:
+        """Statistics are written to standard error at exit, without logging configured by the program."""
+        # Arrange
+        script = (
+            "import pulumi\n"
+            "from pulumi_extra import override_resource\n"
+            "from pulumi_extra.transforms import enable_transform_instrumentation\n"
+            "enable_transform_instrumentation()\n"
+            "args = pulumi.ResourceTransformArgs(True, 'aws:s3/bucket:Bucket', 'b', {}, pulumi.ResourceOptions())\n"
+            "override_resource('*', props={'a': 1})(args)\n"
+        )
+
+        # Act
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)  # noqa: S603
+
+        # Assert
+        assert "override_resource(*): calls=1 matches=1 changes=1 " in result.stderr
+
+    def test_report_output(self, tmp_path: Path) -> None:
+        """Statistics are written to the output file at exit, if given."""
+        # Arrange
+        output = tmp_path / "stats.json"
+        enable_transform_instrumentation(output)
+        override_resource("*", props={"a": 1})(_resource_args("aws:s3/bucket:Bucket"))
+
+        # Act
+        _instrumentation.report()
+
+        # Assert
+        [stats] = json.loads(output.read_text())
+        assert stats["name"] == "override_resource(*)"
+        assert (stats["calls"], stats["matches"]) == (1, 1)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pulumi
+import pytest
+
+from pulumi_extra import override_invoke, override_resource
+from pulumi_extra.transforms import TransformRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def registry() -> Iterator[TransformRegistry]:
+    with (
+        mock.patch("pulumi.runtime.register_resource_transform"),
+        mock.patch("pulumi.runtime.register_invoke_transform"),
+    ):
+        yield TransformRegistry()
+
+
+def _resource_args(type_: str, props: dict[str, Any] | None = None) -> pulumi.ResourceTransformArgs:
+    return pulumi.ResourceTransformArgs(
+        custom=True,
+        type_=type_,
+        name="resource",
+        props=props or {},
+        opts=pulumi.ResourceOptions(),
+    )
+
+
+class Test__TransformRegistry:
+    def test_register_once(self) -> None:
+        # Arrange
+        registry = TransformRegistry()
+
+        # Act
+        with (
+            mock.patch("pulumi.runtime.register_resource_transform") as m_resource,
+            mock.patch("pulumi.runtime.register_invoke_transform") as m_invoke,
+        ):
+            for _ in range(3):
+                registry.add_resource_transform(override_resource("*", props={"a": 1}))
+                registry.add_invoke_transform(override_invoke("*", args={"a": 1}))
+
+        # Assert
+        m_resource.assert_called_once_with(registry.transform_resource)
+        m_invoke.assert_called_once_with(registry.transform_invoke)
+
+    def test_new_run(self) -> None:
+        """Transforms of a previous program run are dropped and the registry registers itself again."""
+        # Arrange
+        registry = TransformRegistry()
+        previous = mock.Mock(return_value=None)
+        current = mock.Mock(return_value=None)
+
+        with (
+            mock.patch("pulumi.runtime.register_resource_transform") as m,
+            mock.patch("pulumi_extra.transforms.registry.get_monitor", side_effect=[object(), object()]),
+        ):
+            registry.add_resource_transform(previous)
+
+            # Act
+            registry.add_resource_transform(current)
+
+        registry.transform_resource(_resource_args("aws:s3/bucket:Bucket"))
+
+        # Assert
+        assert m.call_count == 2
+        previous.assert_not_called()
+        current.assert_called_once()
+
+    def test_dispatch(self, registry: TransformRegistry) -> None:
+        """Transforms are only called for matching types."""
+        # Arrange
+        aws = mock.Mock(return_value=None)
+        gcp = mock.Mock(return_value=None)
+        any_ = mock.Mock(return_value=None)
+        registry.add_resource_transform(aws, "aws:*")
+        registry.add_resource_transform(gcp, "gcp:{storage,compute}/*")
+        registry.add_resource_transform(any_)
+
+        # Act
+        result = registry.transform_resource(_resource_args("aws:s3/bucket:Bucket"))
+        registry.transform_resource(_resource_args("gcp:storage/bucket:Bucket"))
+
+        # Assert
+        assert result is None
+        assert aws.call_count == 1
+        assert gcp.call_count == 1
+        assert any_.call_count == 2
+
+    def test_compose(self, registry: TransformRegistry) -> None:
+        """Matching transforms are applied in registration order."""
+        # Arrange
+        registry.add_resource_transform(override_resource("*", props={"name": "first", "a": 1}), "aws:*")
+        registry.add_resource_transform(override_resource("*", props={"name": "second"}), "aws:s3/*")
+        registry.add_resource_transform(override_resource("*", props={"name": "unmatched"}), "gcp:*")
+        registry.add_resource_transform(override_resource("*", opts=pulumi.ResourceOptions(protect=True)), "*")
+
+        # Act
+        result = registry.transform_resource(_resource_args("aws:s3/bucket:Bucket"))
+
+        # Assert
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.props == {"name": "second", "a": 1}
+        assert result.opts.protect is True
+
+    @pulumi.runtime.test
+    def test_compose_async(self, registry: TransformRegistry) -> Any:
+        # Arrange
+        async def transform(args: pulumi.ResourceTransformArgs) -> pulumi.ResourceTransformResult:
+            return pulumi.ResourceTransformResult(props={**args.props, "async": True}, opts=args.opts)
+
+        registry.add_resource_transform(override_resource("*", props={"a": 1}))
+        registry.add_resource_transform(transform)
+        registry.add_resource_transform(override_resource("*", props={"b": 2}))
+
+        # Act
+        result = registry.transform_resource(_resource_args("aws:s3/bucket:Bucket"))
+
+        # Assert
+        async def check() -> None:
+            assert not isinstance(result, pulumi.ResourceTransformResult)
+            resolved = await result  # type: ignore[misc]
+            assert resolved.props == {"a": 1, "async": True, "b": 2}
+
+        return check()
+
+    def test_invoke(self, registry: TransformRegistry) -> None:
+        # Arrange
+        registry.add_invoke_transform(override_invoke("*", args={"a": 1}), "docker:index/getRegistryImage:*")
+        registry.add_invoke_transform(override_invoke("*", args={"b": 2}), "aws:*")
+
+        # Act
+        result = registry.transform_invoke(
+            pulumi.InvokeTransformArgs(
+                token="docker:index/getRegistryImage:getRegistryImage",  # noqa: S106
+                args={},
+                opts=pulumi.InvokeOptions(),
+            ),
+        )
+
+        # Assert
+        assert isinstance(result, pulumi.InvokeTransformResult)
+        assert result.args == {"a": 1}
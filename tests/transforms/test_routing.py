@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pulumi
+import pytest
+from pulumi.resource import DependencyResource
+
+from pulumi_extra.transforms import ProviderRoutingTable, TransformRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def registry() -> Iterator[TransformRegistry]:
+    with (
+        mock.patch("pulumi.runtime.register_resource_transform"),
+        mock.patch("pulumi.runtime.register_invoke_transform"),
+    ):
+        yield TransformRegistry()
+
+
+def _provider() -> pulumi.ProviderResource:
+    return mock.Mock(spec=pulumi.ProviderResource)
+
+
+def _parent(name: str) -> pulumi.Resource:
+    """Return a parent as the engine passes it to transforms, i.e. built from its URN."""
+    return DependencyResource(f"urn:pulumi:stack::project::my:index:Component::{name}")
+
+
+class Test__ProviderRoutingTable:
+    def test(self, registry: TransformRegistry) -> None:
+        # Arrange
+        table = ProviderRoutingTable(registry)
+        aws, s3, gcp = _provider(), _provider(), _provider()
+
+        # Act
+        table.add_route("aws:*", provider=aws)
+        table.add_route("aws:s3/*", provider=s3)
+        table.add_route("gcp:*", provider=gcp)
+
+        # Assert
+        result = registry.transform_resource(
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_="aws:s3/bucket:Bucket",
+                name="bucket",
+                props={"bucket": "bucket"},
+                opts=pulumi.ResourceOptions(protect=True),
+            ),
+        )
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.props == {"bucket": "bucket"}
+        assert result.opts.provider is s3
+        assert result.opts.protect is True
+
+        assert table.get_provider("aws:ec2/vpc:Vpc") is aws
+        assert table.get_provider("gcp:storage/bucket:Bucket") is gcp
+        assert table.get_provider("azure:storage/account:Account") is None
+
+    def test_register_once(self) -> None:
+        # Arrange
+        table = ProviderRoutingTable(TransformRegistry())
+
+        # Act
+        with (
+            mock.patch("pulumi.runtime.register_resource_transform") as m_resource,
+            mock.patch("pulumi.runtime.register_invoke_transform") as m_invoke,
+        ):
+            for i in range(30):
+                table.add_route("aws:*", provider=_provider(), name_prefix=f"account{i}-")
+
+        # Assert
+        m_resource.assert_called_once()
+        m_invoke.assert_called_once()
+
+    def test_prefixes(self, registry: TransformRegistry) -> None:
+        """The route added last wins among routes matching the type and prefixes of names."""
+        # Arrange
+        table = ProviderRoutingTable(registry)
+        default, account, region, nested = _provider(), _provider(), _provider(), _provider()
+
+        # Act
+        table.add_route(provider=default)
+        table.add_route("aws:*", provider=account, name_prefix="prod-")
+        table.add_route("aws:*", provider=region, parent_prefix="eu-")
+        table.add_route("aws:*", provider=nested, name_prefix="prod-", parent_prefix="eu-")
+
+        # Assert
+        assert table.get_provider("aws:s3/bucket:Bucket", "dev-bucket") is default
+        assert table.get_provider("aws:s3/bucket:Bucket", "prod-bucket") is account
+        assert table.get_provider("gcp:storage/bucket:Bucket", "prod-bucket") is default
+        assert table.get_provider("aws:s3/bucket:Bucket", "dev-bucket", _parent("eu-west-1")) is region
+        assert table.get_provider("aws:s3/bucket:Bucket", "prod-bucket", _parent("eu-west-1")) is nested
+        assert table.get_provider("aws:s3/bucket:Bucket", "prod-bucket", _parent("us-east-1")) is account
+
+    def test_parent_prefix(self, registry: TransformRegistry) -> None:
+        """Parents are matched by the name in their URN, as transforms get parents without a name."""
+        # Arrange
+        table = ProviderRoutingTable(registry)
+        default, region = _provider(), _provider()
+        table.add_route("aws:*", provider=default)
+        table.add_route("aws:*", provider=region, parent_prefix="eu-")
+
+        # Act
+        result = registry.transform_resource(
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_="aws:s3/bucket:Bucket",
+                name="bucket",
+                props={},
+                opts=pulumi.ResourceOptions(parent=_parent("eu-west-1")),
+            ),
+        )
+
+        # Assert
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.opts.provider is region
+
+    def test_invoke(self, registry: TransformRegistry) -> None:
+        """Invokes have no name, so routes with a name prefix do not apply."""
+        # Arrange
+        table = ProviderRoutingTable(registry)
+        default, account = _provider(), _provider()
+
+        # Act
+        table.add_route("aws:*", provider=default)
+        table.add_route("aws:*", provider=account, name_prefix="prod-")
+
+        # Assert
+        result = registry.transform_invoke(
+            pulumi.InvokeTransformArgs(
+                token="aws:index/getRegion:getRegion",  # noqa: S106
+                args={},
+                opts=pulumi.InvokeOptions(),
+            ),
+        )
+        assert isinstance(result, pulumi.InvokeTransformResult)
+        assert result.opts.provider is default
+
+        assert (
+            registry.transform_invoke(
+                pulumi.InvokeTransformArgs(
+                    token="gcp:organizations/getProject:getProject",  # noqa: S106
+                    args={},
+                    opts=pulumi.InvokeOptions(),
+                ),
+            )
+            is None
+        )
+
+    def test_noop(self, registry: TransformRegistry) -> None:
+        """Resources set to the routed provider already are left as they are."""
+        # Arrange
+        table = ProviderRoutingTable(registry)
+        provider = _provider()
+        table.add_route("aws:*", provider=provider)
+
+        # Act
+        result = table.route_resource(
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_="aws:s3/bucket:Bucket",
+                name="bucket",
+                props={},
+                opts=pulumi.ResourceOptions(provider=provider),
+            ),
+        )
+
+        # Assert
+        assert result is None
+
+    def test_new_run(self) -> None:
+        """Routes of a previous program run are dropped and the table adds its transforms again."""
+        # Arrange
+        registry = TransformRegistry()
+        table = ProviderRoutingTable(registry)
+        previous, current = _provider(), _provider()
+
+        with (
+            mock.patch("pulumi.runtime.register_resource_transform"),
+            mock.patch("pulumi.runtime.register_invoke_transform"),
+            mock.patch("pulumi_extra.transforms.registry.get_monitor", return_value=object()),
+            mock.patch("pulumi_extra.transforms.routing.get_monitor", return_value=object()),
+        ):
+            table.add_route("aws:*", provider=previous)
+
+        # Act
+        with (
+            mock.patch("pulumi.runtime.register_resource_transform"),
+            mock.patch("pulumi.runtime.register_invoke_transform"),
+            mock.patch("pulumi_extra.transforms.registry.get_monitor", return_value=object()),
+            mock.patch("pulumi_extra.transforms.routing.get_monitor", return_value=object()),
+        ):
+            table.add_route("gcp:*", provider=current)
+
+        # Assert
+        assert table.get_provider("aws:s3/bucket:Bucket") is None
+        assert table.get_provider("gcp:storage/bucket:Bucket") is current
+        result = registry.transform_resource(
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_="gcp:storage/bucket:Bucket",
+                name="bucket",
+                props={},
+                opts=pulumi.ResourceOptions(),
+            ),
+        )
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.opts.provider is current
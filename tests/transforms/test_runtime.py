@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pulumi
+
+from pulumi_extra import override_default_provider
+from pulumi_extra.transforms import transform_registry
+
+
+class Test__override_default_provider:
+    def test(self) -> None:
+        # Arrange
+        providers = [mock.Mock(spec=pulumi.ProviderResource) for _ in range(3)]
+
+        # Act
+        with (
+            mock.patch("pulumi.runtime.register_resource_transform") as m_resource,
+            mock.patch("pulumi.runtime.register_invoke_transform") as m_invoke,
+        ):
+            override_default_provider("aws:*", provider=providers[0])
+            override_default_provider("gcp:*", provider=providers[1])
+            override_default_provider("aws:s3/*", provider=providers[2])
+
+        # Assert
+        m_resource.assert_called_once()
+        m_invoke.assert_called_once()
+        result = transform_registry.transform_resource(
+            pulumi.ResourceTransformArgs(
+                custom=True,
+                type_="aws:s3/bucket:Bucket",
+                name="bucket",
+                props={},
+                opts=pulumi.ResourceOptions(),
+            ),
+        )
+        assert isinstance(result, pulumi.ResourceTransformResult)
+        assert result.opts.provider is providers[2]